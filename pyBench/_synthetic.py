@@ -0,0 +1,57 @@
+# Synthetic ticket generator for pyBench.
+# Produces tickets in the exact shape GET /api/external/ticket returns, with
+# realistic cardinalities: a few hundred sites, a handful of components,
+# statuses and error strings repeated across thousands of tickets.
+
+import random
+from datetime import datetime, timedelta
+
+COMPONENTS = ['Printer', 'POS', 'Card Reader', 'Dispenser', 'Pump Controller', 'Tank Monitor']
+STATUSES = ['open', 'In Progress', 'Closed', 'Pending Closed', 'Dispatch']
+ERRORS = [
+    'communication error', 'paper out', 'card reader offline', 'pump stopped',
+    'meter fault', 'display failure', 'keypad error', 'network timeout',
+]
+
+
+def make_tickets(count: int, *, sites: int = 250, seed: int = 42, start_id: int = 1) -> list:
+    """Return `count` synthetic ticket dicts. Deterministic for a given seed."""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    tickets = []
+    for i in range(count):
+        site = rng.randrange(sites)
+        opened = base + timedelta(seconds=rng.randrange(365 * 86400))
+        warranty = base + timedelta(days=rng.randrange(-180, 720))
+        alerts = []
+        for _ in range(rng.choice((1, 1, 1, 2, 2, 3, 4))):
+            alert_open = opened - timedelta(seconds=rng.randrange(3600))
+            closed = rng.random() < 0.7
+            alerts.append({
+                'error': rng.choice(ERRORS),
+                'fuelingPosition': rng.randrange(1, 17) if rng.random() < 0.8 else None,
+                'alertOpenTimestamp': alert_open.strftime('%Y-%m-%d %H:%M:%S'),
+                'alertCloseTimestamp': (
+                    (alert_open + timedelta(seconds=rng.randrange(60, 7 * 86400))).strftime('%Y-%m-%d %H:%M:%S')
+                    if closed else None
+                ),
+            })
+        pump = rng.randrange(1, 16)
+        tickets.append({
+            'ticketID': start_id + i,
+            'ticketOpenTimestamp': opened.strftime('%Y-%m-%d %H:%M:%S'),
+            'siteID': str(100000 + site),
+            'siteName': f'Trial #{site}',
+            'companyName': f'Demo Company {site % 12}',
+            'address': f'{site} Main St, City, ST',
+            'integrationID1': f'WO-{start_id + i}' if rng.random() < 0.3 else None,
+            'integrationID2': None,
+            'integrationID3': None,
+            'warrantyDate': warranty.strftime('%Y-%m-%d') if rng.random() < 0.9 else None,
+            'warrantyStatus': 'In' if warranty > base + timedelta(days=180) else 'Out',
+            'dispenser': f'{pump}/{pump + 1}',
+            'ticketStatus': rng.choice(STATUSES),
+            'component': rng.choice(COMPONENTS),
+            'alerts': alerts,
+        })
+    return tickets
@@ -0,0 +1,180 @@
+# End-to-end client benchmarks against the local mock server.
+# Starts pyBench/mock_server.py in a subprocess, then runs each scenario in a
+# fresh process so peak RSS is per scenario. Reports tickets/sec, time to
+# first ticket (TTFT) and peak RSS for get_tickets, iter_tickets and export.
+#
+#   python pyBench/bench_client.py [--tickets 50000] [--latency 0.02] [--json results.json]
+#   python pyBench/bench_client.py --only iter_stream,export_csv
+#
+# --record DIR saves the server's responses during the warm-up run; --replay DIR
+# then runs every scenario from that capture with no server or network, so
+# decode/export throughput is measured alone and runs are repeatable.
+#
+#   python pyBench/bench_client.py --tickets 50000 --record capture/
+#   python pyBench/bench_client.py --replay capture/
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import argparse
+import json
+import os
+import subprocess
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+HERE = pathlib.Path(__file__).parent
+
+# name -> (client options, call). Every scenario pulls every ticket (delta=1).
+SCENARIOS = {
+    'get_tickets':          ({}, 'get'),
+    'get_tickets_prefetch': ({}, 'get_prefetch'),
+    'get_tickets_records':  ({'records': True}, 'get'),
+    'get_tickets_decoder':  ({'decoder': True}, 'get'),
+    'iter_tickets':         ({}, 'iter'),
+    'iter_prefetch':        ({}, 'iter_prefetch'),
+    'iter_stream':          ({'stream_decode': True}, 'iter'),
+    'iter_alerts_open':     ({}, 'alerts'),
+    'export_csv':           ({}, 'export_csv'),
+    'export_jsonl_gz':      ({}, 'export_jsonl_gz'),
+}
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_child(name: str, base_uri: str, record: str = None, replay: str = None) -> dict:
+    from pySiteIQ import PageDecoder, ReplayTransport, SiteIQClient
+
+    options, call = SCENARIOS[name]
+    if options.get('decoder'):
+        options = dict(options, decoder=PageDecoder())
+    if record or replay:
+        options = dict(options, transport=ReplayTransport(record or replay, record=bool(record)))
+    client = SiteIQClient(base_uri, **options)
+    client.connect('bench@example.com', 'bench')
+    rss_before = peak_rss_mb()
+    first = None
+    count = 0
+    start = time.perf_counter()
+    if call in ('get', 'get_prefetch'):
+        tickets = client.get_tickets(status='All', delta=1, all_pages=True,
+                                     prefetch=2 if call == 'get_prefetch' else 0)
+        first = time.perf_counter()
+        count = len(tickets)
+    elif call in ('iter', 'iter_prefetch', 'alerts'):
+        if call == 'alerts':
+            rows = client.iter_alerts(open_only=True, status='All', delta=1)
+        else:
+            rows = client.iter_tickets(status='All', delta=1, prefetch=2 if call == 'iter_prefetch' else 0)
+        for _ in rows:
+            if first is None:
+                first = time.perf_counter()
+            count += 1
+    else:
+        suffix = '.csv' if call == 'export_csv' else '.jsonl.gz'
+        with tempfile.TemporaryDirectory() as tmp:
+            result = client.export(os.path.join(tmp, 'out' + suffix), status='All', delta=1)
+        count = result['rows']
+    elapsed = time.perf_counter() - start
+    client.disconnect()
+    return {
+        'scenario': name,
+        'tickets': count,
+        'seconds': round(elapsed, 3),
+        'tickets_per_sec': round(count / elapsed) if elapsed else 0,
+        'ttft_ms': round((first - start) * 1000, 1) if first is not None else None,
+        'rss_base_mb': rss_before,
+        'rss_peak_mb': peak_rss_mb(),
+    }
+
+
+def start_server(args) -> tuple:
+    cmd = [
+        sys.executable, str(HERE / 'mock_server.py'), '--port', '0',
+        '--tickets', str(args.tickets), '--latency', str(args.latency),
+        '--error-rate', str(args.error_rate), '--throttle-rate', str(args.throttle_rate),
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    base_uri = proc.stdout.readline().strip()
+    if not base_uri:
+        proc.kill()
+        sys.exit('mock server failed to start')
+    return proc, base_uri
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tickets', type=int, default=50_000)
+    parser.add_argument('--latency', type=float, default=0.0, help='mock server latency per request, seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--only', help='comma-separated scenario names')
+    parser.add_argument('--json', help='also write results to this file')
+    parser.add_argument('--record', metavar='DIR', help='save server responses to DIR during the warm-up run')
+    parser.add_argument('--replay', metavar='DIR', help='run scenarios from a capture instead of the mock server')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--base-uri', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.base_uri, args.record, args.replay)))
+        return
+
+    names = args.only.split(',') if args.only else list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        sys.exit(f'unknown scenarios {unknown}; choose from {list(SCENARIOS)}')
+
+    if args.replay:
+        proc, base_uri = None, 'http://replay.invalid'
+        child = ['--replay', args.replay]
+        print(f'replaying {args.replay}\n')
+    else:
+        proc, base_uri = start_server(args)
+        child = []
+        print(f'mock server {base_uri}: {args.tickets} tickets, latency {args.latency}s, '
+              f'errors {args.error_rate:.0%}, throttling {args.throttle_rate:.0%}\n')
+    results = []
+    try:
+        # Warm the server's result cache so the first scenario is not penalised.
+        if proc is not None:
+            warm = ['--record', args.record] if args.record else []
+            subprocess.run([sys.executable, __file__, '--child', 'iter_tickets', '--base-uri', base_uri] + warm,
+                           check=True, capture_output=True)
+        print(f'{"scenario":<22} {"tickets":>8} {"seconds":>8} {"tickets/s":>10} {"TTFT ms":>9} {"peak RSS MB":>12}')
+        print('-' * 74)
+        for name in names:
+            out = subprocess.run(
+                [sys.executable, __file__, '--child', name, '--base-uri', base_uri] + child,
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout)
+            results.append(r)
+            ttft = '' if r['ttft_ms'] is None else r['ttft_ms']
+            print(f'{name:<22} {r["tickets"]:>8} {r["seconds"]:>8} {r["tickets_per_sec"]:>10} '
+                  f'{ttft:>9} {r["rss_peak_mb"]:>12}')
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'tickets': args.tickets, 'latency': args.latency, 'replay': args.replay,
+                       'results': results}, f, indent=2)
+        print(f'\nWrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
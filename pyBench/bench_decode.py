@@ -0,0 +1,85 @@
+# Per-page decode cost: raw page bytes -> tickets, for each decode path.
+# Pages are synthetic 1000-ticket pages, or the pages of a ReplayTransport
+# capture (see bench_client.py --record) to measure real API responses.
+# Each path decodes every page `--rounds` times; the best round is reported.
+#
+#   python pyBench/bench_decode.py [--pages 20] [--rounds 5]
+#   python pyBench/bench_decode.py --replay capture/
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import argparse
+import json
+import statistics
+import time
+
+from pySiteIQ import PageDecoder, Ticket
+from pySiteIQ._decode import _HAS_MSGSPEC
+from _synthetic import make_tickets
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_pages(args) -> list:
+    if args.replay:
+        capture = pathlib.Path(args.replay)
+        manifest = json.loads((capture / 'manifest.json').read_text(encoding='utf-8'))
+        pages = [(capture / e['file']).read_bytes() for e in manifest.values() if e['status'] == 200]
+        return [p for p in pages if p.strip() != b'[]']
+    return [json.dumps(make_tickets(1000, seed=i, start_id=i * 1000 + 1)).encode() for i in range(args.pages)]
+
+
+def paths() -> dict:
+    out = {
+        'json.loads (dicts)': json.loads,
+        'json + Ticket.from_dict': PageDecoder('json').decode,
+    }
+    if orjson is not None:
+        out['orjson + Ticket.from_dict'] = lambda body: [Ticket.from_dict(t) for t in orjson.loads(body)]
+    if _HAS_MSGSPEC:
+        out['PageDecoder (msgspec)'] = PageDecoder('msgspec').decode
+        out['PageDecoder (intern=False)'] = PageDecoder('msgspec', intern=False).decode
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-page decode cost of each decode path.')
+    parser.add_argument('--pages', type=int, default=20, help='synthetic pages of 1000 tickets')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--replay', metavar='DIR', help='decode the pages of a ReplayTransport capture')
+    args = parser.parse_args()
+
+    pages = load_pages(args)
+    if not pages:
+        sys.exit('no pages to decode')
+    tickets = sum(len(json.loads(p)) for p in pages)
+    size = sum(len(p) for p in pages)
+    print(f'{len(pages)} pages, {tickets} tickets, {size / 1e6:.1f} MB'
+          f'{"" if _HAS_MSGSPEC else "  (msgspec not installed: pip install msgspec)"}\n')
+
+    print(f'{"decode path":<28} {"ms/page":>8} {"us/ticket":>10} {"MB/s":>7} {"vs from_dict":>13}')
+    print('-' * 70)
+    baseline = None
+    for name, decode in paths().items():
+        rounds = []
+        for _ in range(args.rounds):
+            per_page = []
+            for body in pages:
+                start = time.perf_counter()
+                decode(body)
+                per_page.append(time.perf_counter() - start)
+            rounds.append(statistics.median(per_page))
+        best = min(rounds)
+        if name == 'json + Ticket.from_dict':
+            baseline = best
+        ratio = f'{baseline / best:.2f}x' if baseline else ''
+        print(f'{name:<28} {best * 1000:>8.2f} {best * 1e6 / (tickets / len(pages)):>10.2f} '
+              f'{size / len(pages) / best / 1e6:>7.1f} {ratio:>13}')
+
+
+if __name__ == '__main__':
+    main()
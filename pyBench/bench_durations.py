@@ -0,0 +1,79 @@
+# Per-group alert MTTR and percentiles over a synthetic payload, two ways:
+# keeping every closed duration and open age per group and sorting (exact),
+# and one streaming pass through AlertDurations (exact up to 1024 values per
+# group, then a mergeable quantile sketch, so memory is bounded per group).
+#
+#   python pyBench/bench_durations.py [ticket_count] [group_by ...]
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import time
+import tracemalloc
+
+from pySiteIQ import NO_TIME, AlertDurations, to_epoch
+import pySiteIQ._timestamps as timestamps
+from _synthetic import make_tickets
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+by = tuple(sys.argv[2:]) or ('siteName', 'error')
+tickets = make_tickets(count)
+now = to_epoch('2026-01-01 00:00:00')
+alerts = sum(len(t['alerts']) for t in tickets)
+print(f'{count} tickets, {alerts} alerts, grouped by {", ".join(by)}\n')
+
+
+def exact() -> dict:
+    groups = {}
+    for t in tickets:
+        for a in t['alerts']:
+            key = tuple(a[f] if f in a else t[f] for f in by)
+            closed, ages = groups.setdefault(key, ([], []))
+            start = to_epoch(a['alertOpenTimestamp'])
+            if a['alertCloseTimestamp'] is None:
+                ages.append(max(0, now - start))
+            else:
+                closed.append(to_epoch(a['alertCloseTimestamp']) - start)
+    for closed, ages in groups.values():
+        closed.sort()
+        ages.sort()
+    return groups
+
+
+def sketched() -> AlertDurations:
+    return AlertDurations(by=by, now=now).update(tickets)
+
+
+def run(name: str, fn):
+    timestamps._CACHE = {None: NO_TIME, '': NO_TIME}
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    # Retained size of the result alone, with the shared timestamp cache dropped.
+    timestamps._CACHE = {None: NO_TIME, '': NO_TIME}
+    tracemalloc.start()
+    result = fn()
+    timestamps._CACHE = {None: NO_TIME, '': NO_TIME}
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'{name:<22} {elapsed:>8.3f} {alerts / elapsed / 1e6:>10.2f} {retained / 2**20:>12.2f}')
+    return result
+
+
+print(f'{"method":<22} {"seconds":>8} {"M alerts/s":>10} {"retained MiB":>12}')
+print('-' * 55)
+reference = run('exact lists + sort', exact)
+result = run('AlertDurations', sketched)
+
+worst = 0.0
+for key, (values, ages) in reference.items():
+    stats = result.stats(*key)
+    assert stats.closed.count == len(values) and stats.closed_sum == sum(values)
+    assert stats.open.count == len(ages) and stats.open_sum == sum(ages)
+    if not values:
+        continue
+    for q in (0.5, 0.9, 0.99):
+        true = values[int(q * (len(values) - 1))]
+        worst = max(worst, abs(stats.closed.quantile(q) - true) / true)
+print(f'\n{len(result)} groups, worst relative percentile error {worst:.4f} '
+      f'(bound {result.relative_accuracy})')
@@ -0,0 +1,45 @@
+# Memory footprint of dict tickets vs slotted Ticket/Alert records.
+# Decodes a synthetic payload the same way the client does (json.loads), then
+# measures the retained heap of each representation with tracemalloc.
+#
+#   python pyBench/bench_records_memory.py [ticket_count]
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import gc
+import json
+import time
+import tracemalloc
+
+from pySiteIQ import Ticket
+from _synthetic import make_tickets
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+payload = json.dumps(make_tickets(count)).encode()
+print(f'{count} tickets, {len(payload) / 1e6:.1f} MB of JSON\n')
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, retained, elapsed
+
+
+dicts, dict_bytes, dict_secs = measure(lambda: json.loads(payload))
+del dicts
+records, record_bytes, record_secs = measure(lambda: [Ticket.from_dict(t) for t in json.loads(payload)])
+assert len(records) == count
+del records
+
+print(f'{"Representation":<18}  {"Retained MB":>11}  {"Bytes/ticket":>12}  {"Build s":>8}')
+print('-' * 56)
+print(f'{"dict":<18}  {dict_bytes / 1e6:>11.1f}  {dict_bytes / count:>12.0f}  {dict_secs:>8.2f}')
+print(f'{"Ticket records":<18}  {record_bytes / 1e6:>11.1f}  {record_bytes / count:>12.0f}  {record_secs:>8.2f}')
+print(f'\nRecords use {record_bytes / dict_bytes:.0%} of the dict footprint')
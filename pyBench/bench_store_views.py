@@ -0,0 +1,90 @@
+# Dashboard refresh after a delta sync, three ways: Counters over a full
+# pull (what the example reports do today), GROUP BY over the whole
+# TicketStore, and reading materialized views that the delta upsert kept
+# current. Also reports what the view triggers add to each upsert.
+#
+#   python pyBench/bench_store_views.py [ticket_count] [changes_per_delta]
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import copy
+import random
+import time
+from collections import Counter
+
+from pySiteIQ import TicketStore
+from _synthetic import STATUSES, make_tickets
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+changes = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+VIEWS = {
+    'by_component': ('component',),
+    'by_site': ('siteName',),
+    'by_warranty': ('ticketStatus', 'warrantyStatus'),
+    'out_of_warranty_by_site': ('warrantyStatus', 'siteName'),
+}
+tickets = make_tickets(count)
+rng = random.Random(7)
+
+
+def delta() -> list:
+    """`changes` existing tickets with a new status/warranty and alert list."""
+    batch = []
+    for t in rng.sample(tickets, changes):
+        t = copy.deepcopy(t)
+        t['ticketStatus'] = rng.choice(STATUSES)
+        t['warrantyStatus'] = rng.choice(('In', 'Out'))
+        t['alerts'] = t['alerts'][:rng.randrange(1, 5)]
+        batch.append(t)
+    return batch
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def full_pull(store: TicketStore) -> None:
+    pulled = store.get_tickets()
+    Counter(t['component'] for t in pulled)
+    Counter(t['siteName'] for t in pulled)
+    Counter((t['ticketStatus'], t['warrantyStatus']) for t in pulled)
+    Counter(t['siteName'] for t in pulled if t['warrantyStatus'] == 'Out')
+    [t for t in pulled if len(t['alerts']) >= 3]
+
+
+def group_by(store: TicketStore) -> None:
+    for columns in VIEWS.values():
+        group = ', '.join(columns)
+        store.query(f'SELECT {group}, COUNT(*), SUM(alertCount) FROM tickets GROUP BY {group}')
+    store.count(min_alerts=3)
+
+
+def materialized(store: TicketStore) -> None:
+    for name in VIEWS:
+        store.aggregate(name)
+    store.count(min_alerts=3)
+
+
+plain, viewed = TicketStore(), TicketStore()
+plain.upsert(tickets)
+viewed.upsert(tickets)
+seed = timed(lambda: [viewed.materialize(name, by) for name, by in VIEWS.items()])
+batch = delta()
+print(f'{count} tickets, {changes} changed per delta, {len(VIEWS)} views (seeded in {seed:.3f} s)\n')
+
+print(f'{"step":<40} {"seconds":>8}')
+print('-' * 49)
+print(f'{"delta upsert, no views":<40} {timed(lambda: plain.upsert(batch)):>8.3f}')
+print(f'{"delta upsert, views maintained":<40} {timed(lambda: viewed.upsert(batch)):>8.3f}')
+print(f'{"refresh: Counters over full pull":<40} {timed(lambda: full_pull(plain)):>8.3f}')
+print(f'{"refresh: GROUP BY over store":<40} {timed(lambda: group_by(plain)):>8.3f}')
+print(f'{"refresh: read materialized views":<40} {timed(lambda: materialized(viewed)):>8.3f}')
+
+for name, columns in VIEWS.items():
+    group = ', '.join(columns)
+    expected = sorted(plain.query(f'SELECT {group}, COUNT(*), SUM(alertCount) FROM tickets GROUP BY {group}'))
+    got = sorted(tuple(r[c] for c in columns) + (r['tickets'], r['alerts']) for r in viewed.aggregate(name))
+    assert expected == got, name
@@ -0,0 +1,58 @@
+# Alert time-to-close over a synthetic payload, three ways:
+# strptime per row (what scripts do today), to_epochs over the columns, and
+# TicketFrame.alerts.seconds_to_close() with its memoized epoch columns.
+#
+#   python pyBench/bench_timestamps.py [ticket_count]
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import time
+from datetime import datetime
+
+from pySiteIQ import NO_TIME, TicketFrame, durations, to_epochs
+import pySiteIQ._timestamps as timestamps
+from _synthetic import make_tickets
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+tickets = make_tickets(count)
+frame = TicketFrame(tickets)
+opened = frame.alerts.columns['alertOpenTimestamp']
+closed = frame.alerts.columns['alertCloseTimestamp']
+print(f'{count} tickets, {len(opened)} alerts, {sum(c is not None for c in closed)} closed\n')
+
+
+def with_strptime() -> list:
+    fmt = '%Y-%m-%d %H:%M:%S'
+    return [
+        int((datetime.strptime(c, fmt) - datetime.strptime(o, fmt)).total_seconds())
+        for o, c in zip(opened, closed) if c is not None
+    ]
+
+
+def with_to_epochs() -> list:
+    return [s for s in durations(to_epochs(opened), to_epochs(closed)) if s != NO_TIME]
+
+
+def with_frame() -> list:
+    return [s for s in frame.alerts.seconds_to_close() if s != NO_TIME]
+
+
+def run(name: str, fn, cold: bool = False) -> list:
+    if cold:
+        timestamps._CACHE = {None: NO_TIME, '': NO_TIME}
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f'{name:<36} {elapsed:>8.3f} {len(opened) / elapsed / 1e6:>10.2f}')
+    return result
+
+
+print(f'{"method":<36} {"seconds":>8} {"M alerts/s":>10}')
+print('-' * 56)
+reference = run('strptime per row', with_strptime)
+cold = run('to_epochs, cold cache', with_to_epochs, cold=True)
+warm = run('to_epochs, warm cache', with_to_epochs)
+run('frame.alerts.seconds_to_close, first', with_frame, cold=True)
+framed = run('frame.alerts.seconds_to_close, again', with_frame)
+assert reference == cold == warm == framed
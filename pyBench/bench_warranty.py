@@ -0,0 +1,83 @@
+# Multi-horizon warranty report (expiring within 7/30/60/90/180/365 days,
+# plus expired per site) by linear scan of warrantyDate strings, as
+# 09_warranty_report.py used to, versus a WarrantyIndex. Also times keeping
+# the index current from a delta batch against rebuilding it.
+#
+#   python pyBench/bench_warranty.py [ticket_count] [changes_per_delta]
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import copy
+import random
+import time
+from datetime import date, timedelta
+
+from pySiteIQ import WarrantyIndex
+from _synthetic import make_tickets
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+changes = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+HORIZONS = (7, 30, 60, 90, 180, 365)
+TODAY = date(2025, 6, 1)
+tickets = make_tickets(count)
+sites = sorted({t['siteName'] for t in tickets})
+
+
+def scan_report() -> list:
+    today = TODAY.isoformat()
+    counts = []
+    for days in HORIZONS:
+        cutoff = (TODAY + timedelta(days=days)).isoformat()
+        counts.append(sum(
+            1 for t in tickets
+            if t.get('warrantyStatus') == 'In' and t.get('warrantyDate') and today <= t['warrantyDate'] <= cutoff
+        ))
+    for site in sites:
+        counts.append(sum(
+            1 for t in tickets
+            if t.get('siteName') == site and t.get('warrantyDate') and t['warrantyDate'] < today
+        ))
+    return counts
+
+
+def index_report(index: WarrantyIndex) -> list:
+    counts = [index.count_expiring(days, today=TODAY) for days in HORIZONS]
+    counts.extend(len(index.expired(today=TODAY, site=site)) for site in sites)
+    return counts
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+rng = random.Random(11)
+batch = []
+for t in rng.sample(tickets, changes):
+    t = copy.deepcopy(t)
+    t['warrantyStatus'] = rng.choice(('In', 'Out'))
+    t['warrantyDate'] = (TODAY + timedelta(days=rng.randrange(-365, 730))).isoformat()
+    batch.append(t)
+
+print(f'{count} tickets, {len(HORIZONS)} horizons + expired at each of {len(sites)} sites, '
+      f'{changes} changed per delta\n')
+print(f'{"step":<36} {"seconds":>8}')
+print('-' * 45)
+scan_seconds, expected = timed(scan_report)
+print(f'{"report by linear scan":<36} {scan_seconds:>8.3f}')
+build_seconds, index = timed(lambda: WarrantyIndex(tickets))
+print(f'{"build WarrantyIndex":<36} {build_seconds:>8.3f}')
+report_seconds, got = timed(lambda: index_report(index))
+print(f'{"report from index":<36} {report_seconds:>8.3f}')
+assert got == expected
+
+update_seconds, _ = timed(lambda: index.update(batch))
+print(f'{"apply delta to index":<36} {update_seconds:>8.3f}')
+by_id = {t['ticketID']: t for t in tickets}
+by_id.update((t['ticketID'], t) for t in batch)
+tickets = list(by_id.values())
+rebuild_seconds, rebuilt = timed(lambda: WarrantyIndex(tickets))
+print(f'{"rebuild index instead":<36} {rebuild_seconds:>8.3f}')
+assert index_report(index) == index_report(rebuilt) == scan_report()
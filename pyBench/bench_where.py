@@ -0,0 +1,79 @@
+# Cost of filtering a page client-side: decode every ticket and filter the
+# results, versus a compiled Where applied during decode (before records are
+# built). Also compares the compiled predicate with the same conditions
+# checked in an interpreted loop. Best of --rounds, per 1000-ticket page.
+#
+#   python pyBench/bench_where.py [--pages 20] [--rounds 5]
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import argparse
+import json
+import time
+
+from pySiteIQ import PageDecoder, Where
+from pySiteIQ._decode import _HAS_MSGSPEC
+from pySiteIQ._export import _matcher
+from _synthetic import make_tickets
+
+CONDITIONS = {'component': {'Printer', 'POS'}, 'warrantyStatus': 'Out', 'alertCount': lambda n: n >= 2}
+
+
+def interpreted(conditions: dict):
+    # What a hand-rolled filter does: look up each condition per ticket.
+    tests = [(name, _matcher(c)) for name, c in conditions.items()]
+
+    def match(t) -> bool:
+        for name, test in tests:
+            value = len(t.get('alerts') or ()) if name == 'alertCount' else t.get(name)
+            if not test(value):
+                return False
+        return True
+    return match
+
+
+def paths(where: Where) -> dict:
+    loose = interpreted(where.conditions)
+    out = {
+        'dicts: loads, interpreted filter': lambda body: [t for t in json.loads(body) if loose(t)],
+        'dicts: loads, compiled Where': lambda body: [t for t in json.loads(body) if where.match(t)],
+        'records (json): decode, then filter': lambda body: [t for t in PageDecoder('json').decode(body) if where(t)],
+        'records (json): Where pushdown': lambda body: PageDecoder('json').decode_page(body, where)[1],
+    }
+    if _HAS_MSGSPEC:
+        decoder = PageDecoder('msgspec')
+        out['records (msgspec): decode, then filter'] = lambda body: [t for t in decoder.decode(body) if where(t)]
+        out['records (msgspec): Where pushdown'] = lambda body: decoder.decode_page(body, where)[1]
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Client-side filter cost per page, with and without pushdown.')
+    parser.add_argument('--pages', type=int, default=20, help='synthetic pages of 1000 tickets')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    pages = [json.dumps(make_tickets(1000, seed=i, start_id=i * 1000 + 1)).encode() for i in range(args.pages)]
+    where = Where(CONDITIONS)
+    kept = sum(len(PageDecoder('json').decode_page(p, where)[1]) for p in pages)
+    print(f'{len(pages)} pages, {kept / len(pages):.0f} of 1000 tickets kept per page'
+          f'{"" if _HAS_MSGSPEC else "  (msgspec not installed: pip install msgspec)"}\n')
+
+    print(f'{"path":<40} {"ms/page":>8}')
+    print('-' * 49)
+    results = {}
+    for name, run in paths(where).items():
+        best = float('inf')
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            for body in pages:
+                results[name] = run(body)
+            best = min(best, (time.perf_counter() - start) / len(pages))
+        print(f'{name:<40} {best * 1000:>8.2f}')
+    ids = {name: [t['ticketID'] for t in r] for name, r in results.items()}
+    assert len({tuple(v) for v in ids.values()}) == 1
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+# Local stand-in for the Site-IQ API, for benchmarks and offline testing.
+# Implements POST /api/web/auth/token and GET /api/external/ticket as
+# described in docs/openapi.yaml: bearer tokens, status filter, date windows
+# (30-day default, HTTP 400 for explicit ranges over 7 days), delta, pageLimit / pageOffset.
+# pageOffset is a ticket offset, advanced by pageLimit, as both clients use it.
+# Tickets come from _synthetic.make_tickets, so data is repeatable per seed.
+#
+# Latency, server errors and throttling can be injected to exercise retries
+# and the adaptive limiter.
+#
+#   python pyBench/mock_server.py --tickets 100000 --port 8080 --latency 0.05
+#   python pyExamples/...  with  SiteIQClient('http://127.0.0.1:8080')
+#
+# or in-process:
+#
+#   with MockSiteIQServer(tickets=20000) as server:
+#       client = SiteIQClient(server.base_uri)
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import argparse
+import base64
+import json
+import random
+import secrets
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from _synthetic import make_tickets
+
+# API status filter -> ticketStatus values it matches in the synthetic data.
+STATUS_MATCH = {
+    'InProgress': {'open', 'In Progress'},
+    'Closed': {'Closed'},
+    'Pending Closed': {'Pending Closed'},
+    'Dispatch': {'Dispatch'},
+    'All': None,
+}
+MAX_RANGE_DAYS = 7
+RESULT_CACHE_SIZE = 64
+
+
+class MockSiteIQServer:
+    """
+    Threaded HTTP server answering like the Site-IQ API.
+
+    tickets       -- number of synthetic tickets to serve
+    seed          -- synthetic data seed
+    latency       -- seconds added to every ticket request
+    jitter        -- extra uniform random latency, 0..jitter seconds
+    error_rate    -- fraction of ticket requests answered with HTTP 500
+    throttle_rate -- fraction answered with HTTP 429 and Retry-After
+    retry_after   -- Retry-After value sent with 429s, in seconds
+    token_ttl     -- lifetime of issued tokens (JWT exp claim), in seconds
+    password      -- if set, the only password accepted; otherwise any
+    host / port   -- bind address; port 0 picks a free port
+    """
+
+    def __init__(
+        self,
+        tickets: int = 10_000,
+        *,
+        seed: int = 42,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0.0,
+        token_ttl: int = 3600,
+        password: str = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.token_ttl = token_ttl
+        self.password = password
+        self.stats = {'auth': 0, 'requests': 0, 'errors': 0, 'throttled': 0, 'bad_request': 0, 'unauthorized': 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens: dict = {}
+        self._results: dict = {}
+
+        data = sorted(make_tickets(tickets, seed=seed), key=lambda t: t['ticketOpenTimestamp'])
+        self._tickets = data
+        self._opened = [t['ticketOpenTimestamp'] for t in data]
+        # Pseudo last-modified time per ticket: opened plus up to two weeks.
+        mod_rng = random.Random(seed + 1)
+        self._modified = [
+            int(datetime.strptime(t['ticketOpenTimestamp'], '%Y-%m-%d %H:%M:%S').timestamp())
+            + mod_rng.randrange(14 * 86400)
+            for t in data
+        ]
+        # "Now" for the default 30-day window: the newest ticket.
+        self.now = datetime.strptime(self._opened[-1], '%Y-%m-%d %H:%M:%S') if data else datetime.now()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_uri(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'MockSiteIQServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='mock-siteiq', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def __enter__(self) -> 'MockSiteIQServer':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    # -- request handling -------------------------------------------------
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _issue_token(self) -> str:
+        exp = int(time.time()) + self.token_ttl
+        claims = base64.urlsafe_b64encode(json.dumps({'exp': exp}).encode()).decode().rstrip('=')
+        token = f'mock.{claims}.{secrets.token_hex(8)}'
+        with self._lock:
+            self._tokens[token] = exp
+        return token
+
+    def _authorized(self, header: str) -> bool:
+        if not header or not header.startswith('Bearer '):
+            return False
+        exp = self._tokens.get(header[7:])
+        return exp is not None and exp > time.time()
+
+    def _query(self, q: dict):
+        """Return (status_code, body_bytes) for a ticket query."""
+        status = q.get('status', 'InProgress')
+        if status not in STATUS_MATCH:
+            return 400, b'{"error":"invalid status"}'
+        try:
+            limit = int(q.get('pageLimit', 1000))
+            offset = int(q.get('pageOffset', 0))
+        except ValueError:
+            return 400, b'{"error":"invalid paging"}'
+        if not (1 <= limit <= 1000) or offset < 0:
+            return 400, b'{"error":"pageLimit must be 1-1000, pageOffset >= 0"}'
+
+        key = (status, q.get('startDate'), q.get('endDate'), q.get('delta'))
+        rows = self._results.get(key)
+        if rows is None:
+            if 'delta' in q:
+                try:
+                    since = int(q['delta'])
+                except ValueError:
+                    return 400, b'{"error":"invalid delta"}'
+                rows = [t for t, m in zip(self._tickets, self._modified) if m > since]
+            else:
+                try:
+                    end = datetime.strptime(q['endDate'], '%Y-%m-%d') if 'endDate' in q else self.now
+                    start = (datetime.strptime(q['startDate'], '%Y-%m-%d') if 'startDate' in q
+                             else end - timedelta(days=30))
+                except ValueError:
+                    return 400, b'{"error":"dates must be YYYY-MM-DD"}'
+                if 'startDate' in q and 'endDate' in q and (end - start).days >= MAX_RANGE_DAYS:
+                    return 400, b'{"error":"date range exceeds 7 days"}'
+                lo = bisect_left(self._opened, start.strftime('%Y-%m-%d'))
+                hi = bisect_right(self._opened, end.strftime('%Y-%m-%d') + ' 99')
+                rows = self._tickets[lo:hi]
+            wanted = STATUS_MATCH[status]
+            if wanted is not None:
+                rows = [t for t in rows if t['ticketStatus'] in wanted]
+            with self._lock:
+                if len(self._results) >= RESULT_CACHE_SIZE:
+                    self._results.pop(next(iter(self._results)))
+                self._results[key] = rows
+        return 200, json.dumps(rows[offset:offset + limit], separators=(',', ':')).encode()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _send(self, code: int, body: bytes, headers: dict = None) -> None:
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if self.close_connection:
+                    # Echo the client's 'Connection: close', as a real server
+                    # does, so the client drops the socket instead of pooling
+                    # it and racing the server's close on the next request.
+                    self.send_header('Connection', 'close')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                raw = self.rfile.read(length)
+                if urlparse(self.path).path != '/api/web/auth/token':
+                    return self._send(404, b'{}')
+                server._count('auth')
+                try:
+                    creds = json.loads(raw)
+                    email, password = creds['email'], creds['password']
+                except (ValueError, KeyError, TypeError):
+                    return self._send(400, b'{"error":"email and password required"}')
+                if not email or (server.password is not None and password != server.password):
+                    return self._send(401, b'{"error":"invalid credentials"}')
+                self._send(200, json.dumps({'token': server._issue_token()}).encode())
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if url.path != '/api/external/ticket':
+                    return self._send(404, b'{}')
+                if not server._authorized(self.headers.get('Authorization')):
+                    server._count('unauthorized')
+                    return self._send(401, b'{"error":"unauthorized"}')
+                server._count('requests')
+                delay = server.latency + (server._rng.random() * server.jitter if server.jitter else 0.0)
+                if delay:
+                    time.sleep(delay)
+                roll = server._rng.random()
+                if roll < server.throttle_rate:
+                    server._count('throttled')
+                    return self._send(429, b'{}', {'Retry-After': f'{server.retry_after:g}'})
+                if roll < server.throttle_rate + server.error_rate:
+                    server._count('errors')
+                    return self._send(500, b'{}')
+                q = {k: v[0] for k, v in parse_qs(url.query).items()}
+                code, body = server._query(q)
+                if code == 400:
+                    server._count('bad_request')
+                self._send(code, body)
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Local mock of the Site-IQ ticket API.')
+    parser.add_argument('--tickets', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080, help='0 picks a free port')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added per ticket request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency, seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of HTTP 500s')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of HTTP 429s')
+    parser.add_argument('--retry-after', type=float, default=0.0)
+    parser.add_argument('--token-ttl', type=int, default=3600)
+    parser.add_argument('--password', default=None, help='only accept this password')
+    args = parser.parse_args()
+
+    server = MockSiteIQServer(
+        args.tickets, seed=args.seed, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+        token_ttl=args.token_ttl, password=args.password, host=args.host, port=args.port,
+    )
+    # First line is the base URI, so scripts can start the server with port 0.
+    print(server.base_uri, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
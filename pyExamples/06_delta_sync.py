@@ -1,4 +1,4 @@
-# Incremental sync using epoch timestamps.
+# Incremental sync using a durable delta checkpoint.
 # Good for scheduled jobs that only need what changed since last run.
 import pathlib, sys
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
@@ -6,28 +6,31 @@ sys.path.insert(0, str(pathlib.Path(__file__).parent))
 
 from datetime import datetime, timezone
 try:
-    from pySiteIQ import SiteIQClient
+    from pySiteIQ import SiteIQClient, DeltaCheckpoint
 except ModuleNotFoundError as e:
     sys.exit(f'Missing dependency: {e}\nRun: pip install -r requirements.txt')
 from _creds import get_credential
 
 email, password = get_credential()
 
-last_sync = datetime(2025, 8, 1, tzinfo=timezone.utc)
-epoch = int(last_sync.timestamp())
+# The checkpoint file remembers when the last run started. Each run re-reads a
+# 10-minute overlap before that point and skips tickets it has already seen.
+checkpoint = DeltaCheckpoint(pathlib.Path(__file__).parent / 'delta_checkpoint.json', overlap=600)
 
-print(f'Fetching changes since {last_sync.isoformat()} (epoch {epoch})')
+# First run only: start from this date
+first_run = int(datetime(2025, 8, 1, tzinfo=timezone.utc).timestamp())
+since = checkpoint.since('All') or first_run
+print(f'Fetching changes since {datetime.fromtimestamp(since, timezone.utc).isoformat()} (epoch {since})')
 
 with SiteIQClient() as client:
     client.connect(email, password)
-    changed = client.get_tickets(status='All', delta=epoch, all_pages=True)
+    changed = client.get_changes(checkpoint, status='All', initial=first_run)
 
-print(f'Got {len(changed)} tickets\n')
+print(f'Got {len(changed)} new or changed tickets '
+      f'({checkpoint.last_run["skipped"]} unchanged from the overlap skipped)\n')
 print(f'{"ID":>8}  {"Site":<35}  {"Status":<18}  Component')
 print('-' * 85)
 for t in changed:
     print(f'{t["ticketID"]:>8}  {t["siteName"]:<35}  {t["ticketStatus"]:<18}  {t["component"]}')
 
-# Record current time as the next delta marker
-next_delta = int(datetime.now(timezone.utc).timestamp())
-print(f'\nNext run, use delta={next_delta}')
+print(f'\nCheckpoint saved to {checkpoint.path} (next delta={checkpoint.since("All")})')
@@ -4,9 +4,9 @@ sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
 sys.path.insert(0, str(pathlib.Path(__file__).parent))
 
 from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime
 try:
-    from pySiteIQ import SiteIQClient
+    from pySiteIQ import SiteIQClient, WarrantyIndex, to_epoch
 except ModuleNotFoundError as e:
     sys.exit(f'Missing dependency: {e}\nRun: pip install -r requirements.txt')
 from _creds import get_credential
@@ -24,19 +24,25 @@ print(f'Under warranty:  {len(in_warranty)}')
 print(f'Out of warranty: {len(out_warranty)}')
 print()
 
-# Expiring within 30 days
-cutoff = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
-expiring_soon = [
-    t for t in in_warranty
-    if t.get('warrantyDate') and t['warrantyDate'] <= cutoff
-]
+# One index sorted by warrantyDate answers every horizon with two bisects,
+# instead of rescanning the tickets per horizon. Each range starts open, so
+# tickets still marked In whose warrantyDate has already passed are listed
+# too, as the original `warrantyDate <= cutoff` scan did.
+index = WarrantyIndex(tickets)
+today = to_epoch(datetime.now().strftime('%Y-%m-%d'))
+print('Warranties expiring within:')
+for days in (7, 30, 60, 90):
+    print(f'  {days:>3} days: {index.count(None, today + (days + 1) * 86400, status="In")}')
+print()
 
+expiring_soon = index.between(None, today + 31 * 86400, status='In')
 if expiring_soon:
     print(f'{len(expiring_soon)} warranties expiring within 30 days:')
-    print(f'  {"ID":>8}  {"Site":<35}  {"Warranty Date":<15}  Component')
-    print('  ' + '-' * 75)
+    print(f'  {"ID":>8}  {"Site":<35}  {"Warranty Date":<15}  {"Days":>5}  Component')
+    print('  ' + '-' * 82)
     for t in expiring_soon:
-        print(f'  {t["ticketID"]:>8}  {t["siteName"]:<35}  {t.get("warrantyDate", ""):<15}  {t["component"]}')
+        days = (to_epoch(t['warrantyDate']) - today) // 86400
+        print(f'  {t["ticketID"]:>8}  {t["siteName"]:<35}  {t["warrantyDate"]:<15}  {days:>5}  {t["component"]}')
     print()
 
 # Out-of-warranty by site
@@ -21,12 +21,12 @@ with SiteIQClient() as client:
     if not session['connected']:
         raise RuntimeError('Failed to connect')
 
-    open_tickets   = client.get_tickets(status='InProgress', start_date=week_ago, all_pages=True)
-    closed_tickets = client.get_tickets(status='Closed',     start_date=week_ago, all_pages=True)
+    # Both statuses are fetched concurrently and merged into one list
+    all_tickets = client.get_tickets(status={'InProgress', 'Closed'}, start_date=week_ago, all_pages=True)
 
-print(f'Last 7 days — Open: {len(open_tickets)}, Closed: {len(closed_tickets)}\n')
-
-all_tickets = open_tickets + closed_tickets
+by_status = Counter(t.get('ticketStatus') for t in all_tickets)
+print(f'Last 7 days — {len(all_tickets)} tickets: '
+      + ', '.join(f'{status}: {n}' for status, n in by_status.most_common()) + '\n')
 
 report = []
 for t in all_tickets:
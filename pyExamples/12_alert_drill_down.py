@@ -4,51 +4,77 @@ sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
 sys.path.insert(0, str(pathlib.Path(__file__).parent))
 
 from collections import Counter
+from itertools import islice
 try:
-    from pySiteIQ import SiteIQClient
+    from pySiteIQ import AlertDurations, SiteIQClient
 except ModuleNotFoundError as e:
     sys.exit(f'Missing dependency: {e}\nRun: pip install -r requirements.txt')
 from _creds import get_credential
 
 email, password = get_credential()
 
+# One streaming pass over the alerts, 1000 at a time; only counters and
+# per-group duration sketches are kept between batches
+error_counts = Counter()
+by_position = Counter()
+total = still_open = 0
+by_error = AlertDurations(by='error')
+by_site = AlertDurations(by='siteName')
+
 with SiteIQClient() as client:
     client.connect(email, password)
-    tickets = client.get_tickets(status='All', all_pages=True)
-
-all_alerts = []
-for t in tickets:
-    for a in (t.get('alerts') or []):
-        all_alerts.append({
-            'TicketID':        t['ticketID'],
-            'SiteName':        t.get('siteName'),
-            'Component':       t.get('component'),
-            'Dispenser':       t.get('dispenser'),
-            'Error':           a.get('error'),
-            'FuelingPosition': a.get('fuelingPosition'),
-            'AlertOpened':     a.get('alertOpenTimestamp'),
-            'AlertClosed':     a.get('alertCloseTimestamp'),
-            'StillOpen':       a.get('alertCloseTimestamp') is None,
-        })
-
-print(f'Total alerts: {len(all_alerts)}\n')
+    alerts = client.iter_alerts(status='All')
+    while True:
+        batch = list(islice(alerts, 1000))
+        if not batch:
+            break
+        by_error.update_alerts(batch)
+        by_site.update_alerts(batch)
+        total += len(batch)
+        for a in batch:
+            error_counts[a['error']] += 1
+            if a['alertCloseTimestamp'] is None:
+                still_open += 1
+            if a['fuelingPosition'] is not None:
+                by_position[str(a['fuelingPosition'])] += 1
+
+print(f'Total alerts: {total}\n')
 
 # Top 10 error types
 print('Top 10 error types:')
-error_counts = Counter(a['Error'] for a in all_alerts)
 for error, count in error_counts.most_common(10):
     print(f'  {count:>5}  {error}')
 
 print()
 
 # Still-open alerts
-open_alerts = [a for a in all_alerts if a['StillOpen']]
-print(f'Still open: {len(open_alerts)}\n')
+print(f'Still open: {still_open}\n')
 
 # Fueling positions with 5+ alerts
 print('Fueling positions with 5+ alerts:')
-by_position = Counter(str(a['FuelingPosition']) for a in all_alerts if a['FuelingPosition'] is not None)
 for pos, count in by_position.most_common():
     if count < 5:
         break
     print(f'  {count:>5}  position {pos}')
+
+print()
+
+
+def hours(seconds):
+    return '' if seconds is None else f'{seconds / 3600:.1f}'
+
+
+# Time to close per error type. Open alerts are censored: they count toward
+# km_p50 (the Kaplan-Meier median) but not toward the closed-only MTTR.
+print('Time to close by error type (hours):')
+print(f'  {"Error":<30} {"Closed":>7} {"Open":>6} {"MTTR":>7} {"p50":>7} {"p90":>7} {"KM p50":>7}')
+for row in by_error.report(sort='closed'):
+    print(f'  {str(row["error"]):<30} {row["closed"]:>7} {row["open"]:>6} {hours(row["mttr"]):>7} '
+          f'{hours(row["p50"]):>7} {hours(row["p90"]):>7} {hours(row["km_p50"]):>7}')
+
+print()
+
+# Slowest sites by 90th percentile time to close
+print('Slowest 10 sites by p90 time to close (hours):')
+for row in by_site.report(sort='p90')[:10]:
+    print(f'  {hours(row["p90"]):>7}  {row["siteName"]}  ({row["closed"]} closed, {row["open"]} open)')
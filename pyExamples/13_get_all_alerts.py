@@ -11,39 +11,25 @@ from _creds import get_credential
 
 email, password = get_credential()
 
-with SiteIQClient() as client:
-    client.connect(email, password)
-    tickets = client.get_tickets(status='All', all_pages=True)
-
-all_alerts = []
-for t in tickets:
-    for a in (t.get('alerts') or []):
-        all_alerts.append({
-            'TicketID':        t['ticketID'],
-            'SiteName':        t.get('siteName'),
-            'Component':       t.get('component'),
-            'Dispenser':       t.get('dispenser'),
-            'Error':           a.get('error'),
-            'FuelingPosition': a.get('fuelingPosition'),
-            'AlertOpened':     a.get('alertOpenTimestamp'),
-            'AlertClosed':     a.get('alertCloseTimestamp'),
-            'StillOpen':       a.get('alertCloseTimestamp') is None,
-        })
-
-print(f'Total alerts: {len(all_alerts)}\n')
-
 header = f"{'TicketID':>10}  {'SiteName':<20}  {'Component':<15}  {'Dispenser':<10}  {'FP':>3}  {'StillOpen':<9}  {'AlertOpened':<19}  Error"
 print(header)
 print('-' * len(header))
 
-for a in all_alerts:
-    print(
-        f"{a['TicketID']:>10}  "
-        f"{str(a['SiteName'] or ''):<20}  "
-        f"{str(a['Component'] or ''):<15}  "
-        f"{str(a['Dispenser'] or ''):<10}  "
-        f"{str(a['FuelingPosition'] or ''):>3}  "
-        f"{str(a['StillOpen']):<9}  "
-        f"{str(a['AlertOpened'] or ''):<19}  "
-        f"{a['Error'] or ''}"
-    )
+# iter_alerts streams one flat row per alert, so rows print as pages arrive
+total = 0
+with SiteIQClient() as client:
+    client.connect(email, password)
+    for a in client.iter_alerts(status='All'):
+        total += 1
+        print(
+            f"{a['ticketID']:>10}  "
+            f"{str(a['siteName'] or ''):<20}  "
+            f"{str(a['component'] or ''):<15}  "
+            f"{str(a['dispenser'] or ''):<10}  "
+            f"{str(a['fuelingPosition'] or ''):>3}  "
+            f"{str(a['alertCloseTimestamp'] is None):<9}  "
+            f"{str(a['alertOpenTimestamp'] or ''):<19}  "
+            f"{a['error'] or ''}"
+        )
+
+print(f'\nTotal alerts: {total}')
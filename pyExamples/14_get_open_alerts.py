@@ -13,23 +13,10 @@ email, password = get_credential()
 
 with SiteIQClient() as client:
     client.connect(email, password)
-    tickets = client.get_tickets(status='All', all_pages=True)
+    # Closed alerts are dropped as each page is decoded; only open ones are kept
+    open_alerts = list(client.iter_alerts(open_only=True, status='All'))
 
-open_alerts = []
-for t in tickets:
-    for a in (t.get('alerts') or []):
-        if a.get('alertCloseTimestamp') is None:
-            open_alerts.append({
-                'TicketID':        t['ticketID'],
-                'SiteName':        t.get('siteName'),
-                'Component':       t.get('component'),
-                'Dispenser':       t.get('dispenser'),
-                'Error':           a.get('error'),
-                'FuelingPosition': a.get('fuelingPosition'),
-                'AlertOpened':     a.get('alertOpenTimestamp'),
-            })
-
-open_alerts.sort(key=lambda a: a['SiteName'] or '')
+open_alerts.sort(key=lambda a: a['siteName'] or '')
 
 print(f'Open alerts: {len(open_alerts)}\n')
 
@@ -39,11 +26,11 @@ print('-' * len(header))
 
 for a in open_alerts:
     print(
-        f"{a['TicketID']:>10}  "
-        f"{str(a['SiteName'] or ''):<20}  "
-        f"{str(a['Component'] or ''):<15}  "
-        f"{str(a['Dispenser'] or ''):<10}  "
-        f"{str(a['FuelingPosition'] or ''):>3}  "
-        f"{str(a['AlertOpened'] or ''):<19}  "
-        f"{a['Error'] or ''}"
+        f"{a['ticketID']:>10}  "
+        f"{str(a['siteName'] or ''):<20}  "
+        f"{str(a['component'] or ''):<15}  "
+        f"{str(a['dispenser'] or ''):<10}  "
+        f"{str(a['fuelingPosition'] or ''):>3}  "
+        f"{str(a['alertOpenTimestamp'] or ''):<19}  "
+        f"{a['error'] or ''}"
     )
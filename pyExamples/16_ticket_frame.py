@@ -0,0 +1,44 @@
+# Columnar reporting with TicketFrame — the 08/09/12 reports without per-ticket loops
+import pathlib, sys
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from datetime import datetime
+try:
+    from pySiteIQ import SiteIQClient
+except ModuleNotFoundError as e:
+    sys.exit(f'Missing dependency: {e}\nRun: pip install -r requirements.txt')
+from _creds import get_credential
+
+email, password = get_credential()
+
+with SiteIQClient() as client:
+    client.connect(email, password)
+    frame = client.get_frame(status='All')
+
+print(f'{frame}\n')
+
+print('Tickets by component:')
+for component, count in frame.count_by('component').most_common():
+    print(f'  {count:>5}  {component}')
+print()
+
+print('Top 10 sites:')
+for site, count in frame.top('siteName', 10):
+    print(f'  {count:>5}  {site}')
+print()
+
+print('Out-of-warranty by site:')
+for site, count in frame.top('siteName', 10, warrantyStatus='Out'):
+    print(f'  {count:>5}  {site}')
+print()
+
+heavy = frame.count(alertCount=lambda n: n >= 3)
+print(f'Tickets with 3+ alerts: {heavy}')
+today_str = datetime.now().strftime('%Y-%m-%d')
+print(f'Opened today: {frame.count(openDate=today_str)}')
+print()
+
+print('Top 10 open alert errors:')
+for error, count in frame.alerts.top('error', 10, stillOpen=True):
+    print(f'  {count:>5}  {error}')
@@ -1,6 +1,31 @@
 """pySiteIQ — Python client for the DFS Site-IQ Tickets External API."""
 
 from ._client import SiteIQClient, SiteIQError, SiteIQAuthError
+from ._async import AsyncSiteIQClient
+from ._cache import ResponseCache
+from ._checkpoint import DeltaCheckpoint
+from ._decode import PageDecoder
+from ._durations import AlertDurations, DurationStats, QuantileSketch
+from ._frame import AlertTable, Categorical, TicketFrame
+from ._harvest import Harvester
+from ._metrics import MetricsCollector
+from ._records import Alert, Ticket
+from ._retry import AdaptiveLimiter, RetryPolicy
+from ._store import TicketStore
+from ._timestamps import NO_TIME, durations, to_datetime, to_epoch, to_epochs
+from ._tokens import TokenCache
+from ._transport import ReplayTransport, RequestsTransport, Transport, UrllibTransport
+from ._warranty import WarrantyIndex
+from ._where import Where
 
-__all__ = ['SiteIQClient', 'SiteIQError', 'SiteIQAuthError']
+__all__ = [
+    'SiteIQClient', 'AsyncSiteIQClient', 'SiteIQError', 'SiteIQAuthError',
+    'RetryPolicy', 'AdaptiveLimiter', 'Ticket', 'Alert',
+    'TicketFrame', 'AlertTable', 'Categorical', 'TicketStore', 'ResponseCache',
+    'TokenCache', 'DeltaCheckpoint', 'Harvester', 'MetricsCollector',
+    'Transport', 'RequestsTransport', 'UrllibTransport', 'ReplayTransport', 'PageDecoder',
+    'NO_TIME', 'to_epoch', 'to_epochs', 'to_datetime', 'durations',
+    'AlertDurations', 'DurationStats', 'QuantileSketch', 'Where',
+    'WarrantyIndex',
+]
 __version__ = '1.0.0'
@@ -0,0 +1,380 @@
+import asyncio
+from collections import deque
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Iterable, Optional, Union
+
+from ._client import SiteIQAuthError, SiteIQClient, SiteIQError, _plan_queries
+from ._records import Ticket
+from ._retry import AdaptiveLimiter, RetryPolicy
+from ._where import Where, compile_where
+
+try:
+    import aiohttp
+    _HAS_AIOHTTP = True
+except ImportError:
+    _HAS_AIOHTTP = False
+
+
+class AsyncSiteIQClient:
+    """
+    asyncio client for the DFS Site-IQ Tickets External API. Requires aiohttp.
+
+    Mirrors SiteIQClient, with coroutine methods::
+
+        async with AsyncSiteIQClient() as client:
+            await client.connect('user@example.com', 'password')
+            async for ticket in client.iter_tickets(status='All'):
+                print(ticket['ticketID'])
+
+    All requests share one aiohttp connection pool. Auto-paging keeps up to
+    `concurrency` page requests in flight, and a client-wide AIMD limiter caps
+    in-flight requests across every concurrent consumer of the client,
+    backing off when the server throttles. Transient failures are retried
+    as in SiteIQClient.
+
+    base_uri     -- API base URL
+    concurrency  -- max page requests in flight at once, across all callers
+    pool_maxsize -- max connections kept open per host
+    keep_alive   -- reuse connections between requests
+    timeout      -- per-request timeout in seconds
+    retry        -- RetryPolicy; RetryPolicy(0) disables retrying
+    records      -- return compact Ticket/Alert records instead of dicts
+    """
+
+    DEFAULT_BASE_URI = SiteIQClient.DEFAULT_BASE_URI
+    MAX_RANGE_DAYS = SiteIQClient.MAX_RANGE_DAYS
+    _VALID_STATUSES = SiteIQClient._VALID_STATUSES
+    _build_params = SiteIQClient._build_params
+
+    def __init__(
+        self,
+        base_uri: str = DEFAULT_BASE_URI,
+        *,
+        concurrency: int = 4,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: float = 30,
+        retry: Optional[RetryPolicy] = None,
+        records: bool = False,
+    ) -> None:
+        if not _HAS_AIOHTTP:
+            raise SiteIQError('AsyncSiteIQClient requires aiohttp: pip install aiohttp')
+        if concurrency < 1:
+            raise ValueError('concurrency must be >= 1')
+        if pool_maxsize < 1:
+            raise ValueError('pool_maxsize must be >= 1')
+        self.base_uri: str = base_uri.rstrip('/')
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.records = records
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._limiter = _AsyncLimiter(concurrency)
+        self._retry_counts = {'retries': 0, 'throttled': 0, 'gave_up': 0}
+        self._token: Optional[str] = None
+        self._email: Optional[str] = None
+
+    async def connect(self, email: str, password: str) -> dict:
+        """Authenticate and store the bearer token. Raises SiteIQAuthError on 401/403."""
+        async with self._http().post(
+            f'{self.base_uri}/api/web/auth/token',
+            json={'email': email, 'password': password},
+        ) as resp:
+            if resp.status in (401, 403):
+                raise SiteIQAuthError(
+                    f'Authentication failed (HTTP {resp.status}): check email and password'
+                )
+            resp.raise_for_status()
+            self._token = (await resp.json(content_type=None))['token']
+        self._email = email
+        return {'connected': True, 'email': email, 'base_uri': self.base_uri}
+
+    async def disconnect(self) -> None:
+        """Clear the stored session token and close pooled connections."""
+        self._token = None
+        self._email = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def is_connected(self) -> bool:
+        """Return True if a token is currently stored."""
+        return self._token is not None
+
+    def retry_stats(self) -> dict:
+        """Return retry and adaptive-concurrency counters, as SiteIQClient.retry_stats()."""
+        stats = dict(self._retry_counts)
+        stats['concurrency_limit'] = self._limiter.limit
+        stats['in_flight'] = self._limiter.in_flight
+        return stats
+
+    async def get_tickets(
+        self,
+        *,
+        status: Union[str, Iterable[str], None] = None,
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
+        delta: Optional[int] = None,
+        page_limit: int = 1000,
+        page_offset: int = 0,
+        all_pages: bool = False,
+        where: Any = None,
+        limit: Optional[int] = None,
+    ) -> list:
+        """Retrieve tickets. Same keyword-only parameters as SiteIQClient.get_tickets()."""
+        self._require_connected()
+        params = self._build_params(status, start_date, end_date, delta)
+        where = compile_where(where)
+        if limit is not None and limit < 0:
+            raise ValueError('limit must be >= 0')
+
+        if all_pages:
+            return [t async for t in self._iter_filtered(params, where, limit)]
+        if isinstance(params.get('status'), tuple):
+            raise ValueError('several statuses can only be fetched with all_pages=True')
+
+        if not (1 <= page_limit <= 1000):
+            raise ValueError('page_limit must be between 1 and 1000')
+        if page_offset < 0:
+            raise ValueError('page_offset must be >= 0')
+
+        if len(_plan_queries(params, self.MAX_RANGE_DAYS)) > 1:
+            tickets = await self._get_sharded(params, page_offset, page_limit)
+        else:
+            params['pageLimit'] = str(page_limit)
+            params['pageOffset'] = str(page_offset)
+            tickets = await self._get(params)
+        if where is not None:
+            tickets = list(filter(where.match, tickets))
+        if limit is not None:
+            tickets = tickets[:limit]
+        return [Ticket.from_dict(t) for t in tickets] if self.records else tickets
+
+    async def iter_tickets(
+        self,
+        *,
+        status: Union[str, Iterable[str], None] = None,
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
+        delta: Optional[int] = None,
+        where: Any = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream all matching tickets one at a time, auto-paging.
+
+        Pages are requested concurrently (up to `concurrency` ahead) but yielded
+        in order. Outstanding requests are cancelled once the last short page
+        arrives or the consumer stops iterating. Date ranges longer than 7 days
+        are split into shards, and a set of statuses into one query per
+        status, as in SiteIQClient. where and limit filter and stop early as
+        in SiteIQClient.iter_tickets(); tickets are tested before records are
+        built.
+        """
+        self._require_connected()
+        params = self._build_params(status, start_date, end_date, delta)
+        where = compile_where(where)
+        if limit is not None and limit < 0:
+            raise ValueError('limit must be >= 0')
+        async for ticket in self._iter_filtered(params, where, limit):
+            yield ticket
+
+    async def _iter_filtered(self, params: dict, where: Optional[Where], limit: Optional[int]) -> AsyncIterator[Any]:
+        if limit == 0:
+            return
+        match = where.match if where is not None else None
+        records = self.records
+        left = limit
+        tickets = self._iter_query(params)
+        try:
+            async for ticket in tickets:
+                if match is not None and not match(ticket):
+                    continue
+                yield Ticket.from_dict(ticket) if records else ticket
+                if left is not None:
+                    left -= 1
+                    if not left:
+                        break
+        finally:
+            # Cancels the outstanding page requests once the limit is reached.
+            await tickets.aclose()
+
+    def _require_connected(self) -> None:
+        if not self._token:
+            raise SiteIQError('Not connected. Call connect() first.')
+
+    def _http(self) -> 'aiohttp.ClientSession':
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_maxsize,
+                limit_per_host=self._pool_maxsize,
+                force_close=not self._keep_alive,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _get(self, params: dict) -> list:
+        policy = self.retry
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                async with self._limiter:
+                    async with self._http().get(
+                        f'{self.base_uri}/api/external/ticket',
+                        params=params,
+                        headers={'Authorization': f'Bearer {self._token}', 'Accept': '*/*'},
+                    ) as resp:
+                        if resp.status not in policy.retry_statuses:
+                            resp.raise_for_status()
+                            self._limiter.on_success()
+                            return await resp.json(content_type=None)
+                        if resp.status in policy.throttle_statuses:
+                            self._retry_counts['throttled'] += 1
+                            self._limiter.on_throttle()
+                        if attempt >= policy.max_retries:
+                            self._retry_counts['gave_up'] += 1
+                            resp.raise_for_status()
+                        retry_after = resp.headers.get('Retry-After')
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= policy.max_retries:
+                    self._retry_counts['gave_up'] += 1
+                    raise
+            self._retry_counts['retries'] += 1
+            await asyncio.sleep(policy.delay(attempt, retry_after))
+            attempt += 1
+
+    async def _get_sharded(self, params: dict, offset: int, count: int) -> list:
+        # One page of a range the API would reject, cut from the merged shards.
+        tickets, skipped = [], 0
+        query = self._iter_query(params)
+        try:
+            async for ticket in query:
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                tickets.append(ticket)
+                if len(tickets) == count:
+                    break
+        finally:
+            await query.aclose()
+        return tickets
+
+    async def _iter_query(self, params: dict) -> AsyncIterator[dict]:
+        queries = _plan_queries(params, self.MAX_RANGE_DAYS)
+        if len(queries) == 1:
+            async for ticket in self._iter_pages(queries[0]):
+                yield ticket
+            return
+
+        async def fetch(query: dict) -> list:
+            return [t async for t in self._iter_pages(query)]
+
+        # Every shard / status query starts at once; the client limiter bounds the requests.
+        shards = [asyncio.ensure_future(fetch(query)) for query in queries]
+        seen = set()
+        try:
+            for shard in shards:
+                for ticket in await shard:
+                    ticket_id = ticket.get('ticketID')
+                    if ticket_id in seen:
+                        continue
+                    seen.add(ticket_id)
+                    yield ticket
+        finally:
+            for shard in shards:
+                shard.cancel()
+            await asyncio.gather(*shards, return_exceptions=True)
+
+    async def _iter_pages(self, base_params: dict) -> AsyncIterator[dict]:
+        def fetch(offset: int) -> asyncio.Task:
+            params = {**base_params, 'pageLimit': '1000', 'pageOffset': str(offset)}
+            return asyncio.ensure_future(self._get(params))
+
+        # Page 0 goes alone: most queries (and most date shards) fit in one
+        # page. Only once a full page comes back are `concurrency` pages kept
+        # in flight, so short queries cost one request, as in SiteIQClient.
+        pending: deque = deque([fetch(0)])
+        next_offset = 1000
+        try:
+            while True:
+                batch = await pending.popleft()
+                if len(batch) == 1000:
+                    while len(pending) < self.concurrency:
+                        pending.append(fetch(next_offset))
+                        next_offset += 1000
+                for ticket in batch:
+                    yield ticket
+                if len(batch) < 1000:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __aenter__(self) -> 'AsyncSiteIQClient':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.disconnect()
+
+    def __repr__(self) -> str:
+        state = f'connected as {self._email}' if self.is_connected() else 'disconnected'
+        return f'AsyncSiteIQClient({self.base_uri!r}, {state})'
+
+
+class _AsyncLimiter(AdaptiveLimiter):
+    """AdaptiveLimiter gate for coroutines running on a single event loop."""
+
+    def __init__(self, max_limit: int, **kwargs) -> None:
+        super().__init__(max_limit, **kwargs)
+        self._async_cond: Optional[asyncio.Condition] = None
+        self._wakers: set = set()
+
+    def on_success(self) -> None:
+        limit = self.limit
+        super().on_success()
+        if self.limit > limit:
+            self._notify()
+
+    def on_throttle(self) -> None:
+        super().on_throttle()
+        self._notify()
+
+    def _notify(self) -> None:
+        # Called synchronously from a coroutine, so the condition's lock
+        # cannot be taken here; a short task takes it and wakes the waiters,
+        # which then re-check in_flight against the new limit.
+        cond = self._waiters()
+
+        async def wake() -> None:
+            async with cond:
+                cond.notify_all()
+
+        task = asyncio.ensure_future(wake())
+        self._wakers.add(task)
+        task.add_done_callback(self._wakers.discard)
+
+    def _waiters(self) -> asyncio.Condition:
+        if self._async_cond is None:
+            self._async_cond = asyncio.Condition()
+        return self._async_cond
+
+    async def __aenter__(self) -> '_AsyncLimiter':
+        cond = self._waiters()
+        async with cond:
+            await cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        cond = self._waiters()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify_all()
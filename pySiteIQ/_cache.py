@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key        TEXT PRIMARY KEY,
+    body       BLOB NOT NULL,
+    size       INTEGER NOT NULL,
+    expires    REAL NOT NULL,
+    lastAccess REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_responses_access ON responses(lastAccess);
+"""
+
+
+def default_cache_path() -> Path:
+    """~/.cache/pySiteIQ/responses.db (or under $XDG_CACHE_HOME when set)."""
+    root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(root) / 'pySiteIQ' / 'responses.db'
+
+
+class ResponseCache:
+    """
+    On-disk cache of raw ticket-page responses, shared across processes.
+
+    Entries are keyed by account, base URI and the normalized query
+    parameters, so identical get_tickets() calls within the TTL are served
+    locally instead of going over the network. Each entry's TTL depends on
+    how likely the answer is to change:
+
+    - a Closed query whose endDate is already in the past -> past_closed_ttl
+    - otherwise the status's entry in status_ttls, falling back to ttl
+    - delta queries always use ttl
+
+    When the total stored size exceeds max_bytes the least recently used
+    entries are evicted. stats() reports hits, misses and evictions.
+
+    path            -- SQLite file (default ~/.cache/pySiteIQ/responses.db),
+                       or ':memory:' for a per-process cache
+    max_bytes       -- size cap for stored response bodies
+    ttl             -- default TTL in seconds
+    status_ttls     -- per-status TTL overrides, e.g. {'InProgress': 30}
+    past_closed_ttl -- TTL for Closed windows that have fully ended
+    """
+
+    DEFAULT_STATUS_TTLS = {'InProgress': 60, 'Dispatch': 60, 'Pending Closed': 120, 'Closed': 600}
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike, None] = None,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 60,
+        status_ttls: Optional[Dict[str, float]] = None,
+        past_closed_ttl: float = 7 * 86400,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError('max_bytes must be >= 1')
+        if path is None:
+            path = default_cache_path()
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.status_ttls = {**self.DEFAULT_STATUS_TTLS, **(status_ttls or {})}
+        self.past_closed_ttl = past_closed_ttl
+        self._lock = threading.Lock()
+        self._counts = {'hits': 0, 'misses': 0, 'expired': 0, 'stores': 0, 'evictions': 0}
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ':memory:':
+            self._db.execute('PRAGMA journal_mode = WAL')
+        self._db.executescript(_SCHEMA)
+
+    @staticmethod
+    def key(account: Optional[str], base_uri: str, params: dict) -> str:
+        """Stable cache key for one request."""
+        normalized = json.dumps(
+            [account or '', base_uri, sorted((str(k), str(v)) for k, v in params.items())],
+            separators=(',', ':'),
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def ttl_for(self, params: dict) -> float:
+        """TTL in seconds for a response to these query parameters."""
+        if 'delta' in params:
+            return self.ttl
+        status = params.get('status')
+        if status == 'Closed' and _is_past(params.get('endDate')):
+            return self.past_closed_ttl
+        return self.status_ttls.get(status, self.ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT body, expires FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self._counts['misses'] += 1
+                return None
+            body, expires = row
+            if expires <= now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._counts['misses'] += 1
+                self._counts['expired'] += 1
+                return None
+            self._db.execute('UPDATE responses SET lastAccess = ? WHERE key = ?', (now, key))
+            self._counts['hits'] += 1
+            return bytes(body)
+
+    def put(self, key: str, body: bytes, ttl: float) -> None:
+        """Store a response body, then evict least recently used entries over the size cap."""
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, body, size, expires, lastAccess) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, body, len(body), now + ttl, now),
+            )
+            self._counts['stores'] += 1
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters for this process plus current entry count and size."""
+        with self._lock:
+            entries, size = self._db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+            stats = dict(self._counts)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['entries'] = entries
+        stats['bytes'] = size
+        return stats
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _evict(self) -> None:
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        self._db.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),))
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        victims = []
+        for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY lastAccess'):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._db.executemany('DELETE FROM responses WHERE key = ?', victims)
+        self._counts['evictions'] += len(victims)
+
+    def __enter__(self) -> 'ResponseCache':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'ResponseCache({self.path!r}, max_bytes={self.max_bytes})'
+
+
+def _is_past(end_date: Optional[str]) -> bool:
+    if not end_date:
+        return False
+    try:
+        return datetime.strptime(end_date, '%Y-%m-%d').date() < datetime.now().date()
+    except ValueError:
+        return False
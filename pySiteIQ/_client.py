@@ -1,6 +1,26 @@
-import requests
-from datetime import datetime
-from typing import Iterator, Optional, Union
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ._cache import ResponseCache
+from ._checkpoint import DeltaCheckpoint, fingerprint, last_activity
+from ._decode import PageDecoder
+from ._export import export_tickets, flatten_alerts
+from ._frame import TicketFrame
+from ._metrics import MetricsCollector
+from ._records import Ticket
+from ._store import TicketStore
+from ._retry import AdaptiveLimiter, RetryPolicy
+from ._stream import iter_json_array
+from ._tokens import TokenCache, _jwt_exp
+from ._transport import TRANSIENT_ERRORS, Transport, default_transport
+from ._where import Where, compile_where
 
 
 class SiteIQError(Exception):
@@ -28,95 +48,541 @@ class SiteIQClient:
             client.connect('user@example.com', 'password')
             for ticket in client.iter_tickets(status='All'):
                 print(ticket['ticketID'])
+
+    All requests made by one client share a pooled keep-alive session, so
+    auto-paging reuses the same TCP/TLS connection instead of opening a new
+    one per page. The pool is closed by disconnect().
+
+    HTTP goes through a Transport: RequestsTransport (the default, built from
+    the pool options below), UrllibTransport (standard library only, used
+    when requests is not installed) or ReplayTransport, which records real
+    responses to disk and serves them back offline.
+
+    base_uri         -- API base URL
+    pool_connections -- number of per-host connection pools to keep
+    pool_maxsize     -- max connections kept open per host
+    pool_block       -- block when the per-host pool is exhausted instead of
+                        opening throwaway connections
+    keep_alive       -- reuse connections between requests; False sends
+                        'Connection: close' on every request
+    timeout          -- per-request timeout in seconds
+    max_workers      -- upper bound on parallel requests (sharded date ranges)
+    retry            -- RetryPolicy for transient 429/5xx and connection
+                        errors; RetryPolicy(0) disables retrying
+    stream_decode    -- decode auto-paged responses incrementally as they
+                        arrive instead of loading each page with resp.json()
+    records          -- return compact Ticket/Alert records instead of dicts
+    decoder          -- PageDecoder that turns each page's bytes straight into
+                        Ticket records (msgspec when installed); implies
+                        records=True
+    cache            -- optional ResponseCache; identical ticket queries within
+                        the cache TTL are answered from disk
+    token_cache      -- optional TokenCache; connect() reuses a stored token
+                        for the account until it is close to expiry
+    refresh_margin   -- re-authenticate this many seconds before the token
+                        expires
+    limiter          -- AdaptiveLimiter to share with other clients, so several
+                        accounts stay within one concurrency budget; by default
+                        each client has its own, bounded by max_workers
+    metrics          -- optional MetricsCollector to attach (see add_hook)
+    transport        -- Transport to send requests with; the pool options
+                        apply only to the default transport
+
+    The API rejects date ranges longer than 7 days, so when auto-paging a
+    longer start_date/end_date range (or a start_date alone, which runs to
+    today) the client splits it into 7-day shards,
+    fetches up to max_workers shards at once, and merges them in date order
+    with duplicate ticketIDs removed.
+
+    Parallel requests pass through an AIMD limiter: the number allowed in
+    flight grows while the server answers normally and is halved whenever it
+    throttles (429/503). retry_stats() reports the current limit and counts.
     """
 
     DEFAULT_BASE_URI = 'https://dfs.site-iq.com'
+    MAX_RANGE_DAYS = 7
     _VALID_STATUSES = frozenset({'InProgress', 'Closed', 'Pending Closed', 'Dispatch', 'All'})
+    HOOK_EVENTS = ('request_start', 'request_end', 'page_decoded', 'retry')
 
-    def __init__(self, base_uri: str = DEFAULT_BASE_URI) -> None:
+    def __init__(
+        self,
+        base_uri: str = DEFAULT_BASE_URI,
+        *,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: float = 30,
+        max_workers: int = 4,
+        retry: Optional[RetryPolicy] = None,
+        stream_decode: bool = False,
+        records: bool = False,
+        cache: Optional[ResponseCache] = None,
+        token_cache: Optional[TokenCache] = None,
+        refresh_margin: float = 300,
+        limiter: Optional[AdaptiveLimiter] = None,
+        metrics: Optional[MetricsCollector] = None,
+        transport: Optional[Transport] = None,
+        decoder: Optional[PageDecoder] = None,
+    ) -> None:
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError('pool_connections and pool_maxsize must be >= 1')
+        if max_workers < 1:
+            raise ValueError('max_workers must be >= 1')
         self.base_uri: str = base_uri.rstrip('/')
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.stream_decode = stream_decode
+        self.records = records or decoder is not None
+        self.decoder = decoder if decoder is not None else PageDecoder('json')
+        self.cache = cache
+        self.token_cache = token_cache
+        self.refresh_margin = refresh_margin
+        self._limiter = limiter if limiter is not None else AdaptiveLimiter(max_workers)
+        self._stats_lock = threading.Lock()
+        self._retry_counts = {'retries': 0, 'throttled': 0, 'gave_up': 0, 'reauths': 0}
+        self._auth_lock = threading.Lock()
+        self._password: Optional[str] = None
+        self._token_expires: Optional[float] = None
+        self.transport: Transport = transport if transport is not None else default_transport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
         self._token: Optional[str] = None
         self._email: Optional[str] = None
+        self._hooks: Dict[str, List[Callable[[dict], None]]] = {}
+        if metrics is not None:
+            metrics.attach(self)
 
     def connect(self, email: str, password: str) -> dict:
-        """Authenticate and store the bearer token. Raises SiteIQAuthError on 401/403."""
-        resp = requests.post(
-            f'{self.base_uri}/api/web/auth/token',
-            json={'email': email, 'password': password},
-            timeout=30,
-        )
-        if resp.status_code in (401, 403):
-            raise SiteIQAuthError(
-                f'Authentication failed (HTTP {resp.status_code}): check email and password'
-            )
-        resp.raise_for_status()
-        self._token = resp.json()['token']
+        """
+        Authenticate and store the bearer token. Raises SiteIQAuthError on 401/403.
+
+        With a token_cache, a stored token for this account that is not within
+        refresh_margin of expiry is reused without contacting the auth
+        endpoint; the result then has 'cached': True. A token is reused only
+        with the password it was obtained with: any other password goes to
+        the auth endpoint, so wrong credentials fail here. The password is
+        kept in memory until disconnect() so the client can refresh the token
+        itself.
+        """
+        cached = False
+        if self.token_cache is not None:
+            entry = self.token_cache.load(self.base_uri, email, password)
+            if entry is not None and entry[1] - self.refresh_margin > time.time():
+                self._token, self._token_expires = entry
+                cached = True
+        if not cached:
+            self._authenticate(email, password)
         self._email = email
-        return {'connected': True, 'email': email, 'base_uri': self.base_uri}
+        self._password = password
+        return {'connected': True, 'email': email, 'base_uri': self.base_uri, 'cached': cached}
 
     def disconnect(self) -> None:
-        """Clear the stored session token."""
+        """Clear the stored session token and close pooled connections."""
         self._token = None
         self._email = None
+        self._password = None
+        self._token_expires = None
+        self.transport.close()
 
     def is_connected(self) -> bool:
         """Return True if a token is currently stored."""
         return self._token is not None
 
+    def add_hook(self, event: str, callback: Callable[[dict], None]) -> None:
+        """
+        Call `callback(info)` on every `event`. Callbacks run on the thread
+        making the request; exceptions they raise propagate to the caller.
+
+        request_start -- params, attempt
+        request_end   -- params, attempt, status (None on a connection error),
+                         seconds, error
+        page_decoded  -- params, page, tickets, bytes, seconds (whole page),
+                         decode_seconds (None when streamed), cached
+        retry         -- params, attempt, status, error, delay
+
+        With no hooks registered the request path only checks an empty dict.
+        """
+        if event not in self.HOOK_EVENTS:
+            raise ValueError(f'event must be one of {self.HOOK_EVENTS}')
+        self._hooks.setdefault(event, []).append(callback)
+
+    def remove_hook(self, event: str, callback: Callable[[dict], None]) -> None:
+        """Unregister a callback added with add_hook()."""
+        callbacks = self._hooks.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._hooks.pop(event, None)
+
+    def connection_stats(self) -> dict:
+        """
+        Return cumulative connection-pool counters for this client.
+
+        requests           -- HTTP requests sent
+        connections_opened -- new TCP/TLS connections established
+        connections_reused -- requests served over an already-open connection
+        """
+        stats = self.transport.stats()
+        sent, opened = stats['requests'], stats['connections_opened']
+        return {'requests': sent, 'connections_opened': opened, 'connections_reused': sent - opened}
+
+    def retry_stats(self) -> dict:
+        """
+        Return retry and adaptive-concurrency counters for this client.
+
+        retries           -- requests re-sent after a transient failure
+        throttled         -- 429/503 responses received
+        gave_up           -- requests that failed after exhausting retries
+        reauths           -- token refreshes (proactive or after a 401)
+        concurrency_limit -- requests currently allowed in flight
+        in_flight         -- requests in flight right now
+        """
+        with self._stats_lock:
+            stats = dict(self._retry_counts)
+        stats['concurrency_limit'] = self._limiter.limit
+        stats['in_flight'] = self._limiter.in_flight
+        return stats
+
     def get_tickets(
         self,
         *,
-        status: Optional[str] = None,
-        start_date: Optional[Union[str, datetime]] = None,
-        end_date: Optional[Union[str, datetime]] = None,
+        status: Union[str, Iterable[str], None] = None,
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
         delta: Optional[int] = None,
         page_limit: int = 1000,
         page_offset: int = 0,
         all_pages: bool = False,
+        prefetch: int = 0,
+        where: Any = None,
+        limit: Optional[int] = None,
     ) -> list:
         """
         Retrieve tickets from the API. All parameters are keyword-only.
 
-        status     -- 'InProgress', 'Closed', 'Pending Closed', 'Dispatch', or 'All'
-        start_date -- 'YYYY-MM-DD' string or datetime; ignored when delta is set
-        end_date   -- 'YYYY-MM-DD' string or datetime; ignored when delta is set
+        status     -- 'InProgress', 'Closed', 'Pending Closed', 'Dispatch', or 'All',
+                      or a set of these; with all_pages=True each status is
+                      fetched concurrently and the results merged by ticketID
+        start_date -- 'YYYY-MM-DD' string, date or datetime; ignored when delta is set
+        end_date   -- 'YYYY-MM-DD' string, date or datetime; ignored when delta is set
         delta      -- Unix epoch (int); returns tickets modified after this timestamp;
                       mutually exclusive with start_date/end_date
         page_limit -- tickets per request, 1-1000 (ignored when all_pages=True)
         page_offset -- zero-based page offset (ignored when all_pages=True)
-        all_pages  -- auto-page through everything and return a single list
+        all_pages  -- auto-page through everything and return a single list;
+                      ranges longer than 7 days are fetched as parallel shards
+                      (without all_pages, the page is cut from those shards,
+                      merged in the same order)
+        prefetch   -- with all_pages=True, fetch up to this many pages ahead in a
+                      background thread (0 disables prefetching); for date
+                      shards and several statuses, how many pages each shard
+                      may run ahead (0: no bound)
+        where      -- client-side ticket filter, as for iter_tickets()
+        limit      -- return at most this many tickets, fetching no further
+                      pages once they are found
         """
         self._require_connected()
         params = self._build_params(status, start_date, end_date, delta)
+        where = compile_where(where)
+        if limit is not None and limit < 0:
+            raise ValueError('limit must be >= 0')
 
         if all_pages:
-            return list(self._iter_pages(params))
+            return list(self._iter_limited(params, prefetch, self.records, where, limit))
+        if isinstance(params.get('status'), tuple):
+            raise ValueError('several statuses can only be fetched with all_pages=True')
 
         if not (1 <= page_limit <= 1000):
             raise ValueError('page_limit must be between 1 and 1000')
         if page_offset < 0:
             raise ValueError('page_offset must be >= 0')
 
-        params['pageLimit'] = str(page_limit)
-        params['pageOffset'] = str(page_offset)
-        return self._get(params)
+        if len(_plan_queries(params, self.MAX_RANGE_DAYS)) > 1:
+            tickets = self._get_sharded(params, page_offset, page_limit)
+            if where is not None:
+                tickets = [t for t in tickets if where.match(t)]
+        else:
+            params['pageLimit'] = str(page_limit)
+            params['pageOffset'] = str(page_offset)
+            tickets = self._get_page(params, self.records, where)[1]
+        return tickets if limit is None else tickets[:limit]
 
     def iter_tickets(
         self,
         *,
-        status: Optional[str] = None,
-        start_date: Optional[Union[str, datetime]] = None,
-        end_date: Optional[Union[str, datetime]] = None,
+        status: Union[str, Iterable[str], None] = None,
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
         delta: Optional[int] = None,
+        prefetch: int = 0,
+        where: Any = None,
+        limit: Optional[int] = None,
     ) -> Iterator[dict]:
         """
         Stream all matching tickets one at a time, auto-paging.
 
         Accepts the same filter parameters as get_tickets(). More memory-efficient
         than get_tickets(all_pages=True) when working with very large result sets.
+        Date ranges longer than 7 days are split into shards, and a set of
+        statuses into one query per status, as in get_tickets().
+
+        With prefetch=K a background thread fetches up to K pages ahead of the
+        consumer, overlapping network time with processing. The worker blocks
+        once K pages are waiting, and stops as soon as the last short page
+        arrives or the consumer stops iterating. Date shards and per-status
+        queries run in parallel, each at most K pages ahead (unbounded with
+        prefetch=0); each stops at its next page once iteration stops.
+
+        With stream_decode, sequential paging yields each ticket as it is
+        parsed. Prefetched pages, date shards and multi-status queries are
+        parsed from the stream too, but each page is collected before it is
+        handed over.
+
+        where filters on fields the API cannot: a Where, or the conditions to
+        build one, e.g. where={'component': 'Printer', 'alertCount': lambda n: n >= 3}.
+        It is compiled once and applied as each page is decoded, before
+        records are built (see Where), so rejected tickets cost only the
+        parse. limit stops paging once that many tickets have matched.
+        """
+        self._require_connected()
+        params = self._build_params(status, start_date, end_date, delta)
+        where = compile_where(where)
+        if limit is not None and limit < 0:
+            raise ValueError('limit must be >= 0')
+        yield from self._iter_limited(params, prefetch, self.records, where, limit)
+
+    def iter_alerts(
+        self,
+        *,
+        open_only: bool = False,
+        error: Any = None,
+        fueling_position: Any = None,
+        status: Union[str, Iterable[str], None] = None,
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
+        delta: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[dict]:
+        """
+        Stream alerts as flat rows, each carrying its parent ticket's fields.
+
+        Rows have the same keys as export(flatten='alert'): the ticket's
+        fields, alertSeq, then error, fuelingPosition, alertOpenTimestamp and
+        alertCloseTimestamp. Alerts are filtered as each ticket is decoded,
+        and neither a ticket list nor an alert list is built, so memory stays
+        flat however many alerts match.
+
+        open_only        -- only alerts that have not closed
+        error            -- error text: a value, a collection, or a callable
+        fueling_position -- fuelingPosition: a value, a collection, or a callable
+        The remaining parameters select tickets as for iter_tickets().
+        """
+        self._require_connected()
+        params = self._build_params(status, start_date, end_date, delta)
+        yield from flatten_alerts(
+            self._iter_query(params, prefetch),
+            open_only=open_only, error=error, fueling_position=fueling_position,
+        )
+
+    def get_frame(
+        self,
+        *,
+        status: Union[str, Iterable[str], None] = None,
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
+        delta: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> TicketFrame:
+        """
+        Fetch all matching tickets into a columnar TicketFrame.
+
+        Takes the same filter parameters as iter_tickets(). Tickets are
+        appended to the frame's columns as pages arrive; no intermediate list
+        of ticket dicts is kept.
+        """
+        self._require_connected()
+        params = self._build_params(status, start_date, end_date, delta)
+        return TicketFrame(self._iter_query(params, prefetch))
+
+    def export(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        format: Optional[str] = None,
+        flatten: str = 'ticket',
+        compress: Optional[bool] = None,
+        columns: Optional[Sequence[str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **filters: Any,
+    ) -> dict:
+        """
+        Stream matching tickets straight to a CSV or JSON Lines file.
+
+        Tickets are written as pages arrive via iter_tickets(), so memory
+        stays flat however many tickets match. Returns rows, bytes written,
+        seconds and rows_per_sec.
+
+        path     -- output file; a .csv/.jsonl suffix sets the format and a
+                    trailing .gz turns on gzip
+        format   -- 'csv' or 'jsonl', overriding the suffix
+        flatten  -- 'ticket', 'alert' (one row per alert with its ticket's
+                    fields) or 'nested' (JSONL only)
+        compress -- force gzip on or off
+        columns  -- subset and order of columns
+        headers  -- column -> output name, e.g. {'ticketID': 'TicketID'}
+        filters  -- status, start_date, end_date, delta, prefetch, where, limit
+                    as for iter_tickets()
+        """
+        self._require_connected()
+        return export_tickets(
+            self.iter_tickets(**filters), path,
+            format=format, flatten=flatten, compress=compress, columns=columns, headers=headers,
+        )
+
+    def iter_changes(
+        self,
+        checkpoint: DeltaCheckpoint,
+        *,
+        status: Union[str, Iterable[str], None] = 'All',
+        initial: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[dict]:
+        """
+        Stream tickets new or changed since the checkpoint's last run.
+
+        The request uses delta = checkpoint high-water mark minus its overlap.
+        Tickets the overlap returns again with identical content are skipped;
+        the checkpoint keeps content hashes only for tickets whose last
+        activity falls inside the next run's overlap window.
+        The run's start time, taken before the first request, becomes the
+        new high-water mark once the iterator is exhausted; stopping early
+        leaves the checkpoint where it was.
+
+        checkpoint -- DeltaCheckpoint holding the high-water mark
+        status     -- status scope; each scope has its own mark
+        initial    -- delta epoch for the first run of a scope; without it the
+                      first run pulls the API's default date window
+        prefetch   -- as for iter_tickets()
         """
         self._require_connected()
-        yield from self._iter_pages(self._build_params(status, start_date, end_date, delta))
+        scope = _status_scope(status)
+        since = checkpoint.since(scope)
+        if since is None:
+            since = initial
+        params = self._build_params(status, None, None, since)
+        previous = checkpoint.seen(scope)
+
+        started = int(time.time())
+        window = started - checkpoint.overlap
+        fetched: set = set()
+        keep: dict = {}
+        skipped = 0
+        for ticket in self._iter_query(params, prefetch, typed=self.records):
+            ticket_id = ticket.get('ticketID')
+            if ticket_id in fetched:
+                continue
+            fetched.add(ticket_id)
+            digest = fingerprint(ticket)
+            # Only a ticket the next run's overlap can return again is worth remembering.
+            active = last_activity(ticket)
+            if ticket_id is not None and (active is None or active >= window):
+                keep[ticket_id] = digest
+            if previous.get(ticket_id) == digest:
+                skipped += 1
+                continue
+            yield ticket
+
+        checkpoint.commit(scope, started, keep)
+        checkpoint.last_run = {
+            'scope': scope,
+            'since': since,
+            'fetched': len(fetched),
+            'skipped': skipped,
+            'changed': len(fetched) - skipped,
+            'high_water': started,
+        }
+
+    def get_changes(
+        self,
+        checkpoint: DeltaCheckpoint,
+        *,
+        status: Union[str, Iterable[str], None] = 'All',
+        initial: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> list:
+        """List form of iter_changes(); the checkpoint advances before it returns."""
+        return list(self.iter_changes(checkpoint, status=status, initial=initial, prefetch=prefetch))
+
+    def sync(
+        self,
+        store: TicketStore,
+        *,
+        status: Union[str, Iterable[str], None] = 'All',
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
+        full: bool = False,
+        overlap: int = 0,
+        prefetch: int = 0,
+    ) -> dict:
+        """
+        Bring a local TicketStore up to date and return a summary.
+
+        The first sync of a status scope (or any sync with full=True) is a
+        backfill over start_date/end_date. Later syncs ask only for tickets
+        modified since the previous sync began (delta) and upsert them by
+        ticketID. The sync time is recorded only after every ticket has been
+        stored, so an interrupted sync is simply repeated next time.
+
+        status     -- status scope to sync; each scope tracks its own sync time
+        start_date -- backfill window start; ignored for delta syncs
+        end_date   -- backfill window end; ignored for delta syncs
+        full       -- force a backfill even if the scope was synced before
+        overlap    -- seconds to re-fetch before the last sync time, to cover
+                      clock skew; re-fetched tickets are upserted in place
+        prefetch   -- as for iter_tickets()
+        """
+        self._require_connected()
+        scope = _status_scope(status)
+        since = None if full else store.last_sync(scope)
+        if since is not None:
+            since = max(0, since - overlap)
+        if since is None:
+            params = self._build_params(status, start_date, end_date, None)
+        else:
+            params = self._build_params(status, None, None, since)
+
+        started = time.time()
+        summary = {
+            'mode': 'backfill' if since is None else 'delta',
+            'since': since,
+            'fetched': 0,
+            'inserted': 0,
+            'updated': 0,
+        }
+        batch: list = []
+
+        def flush() -> None:
+            counts = store.upsert(batch, synced_at=int(started))
+            summary['inserted'] += counts['inserted']
+            summary['updated'] += counts['updated']
+            batch.clear()
+
+        for ticket in self._iter_query(params, prefetch):
+            batch.append(ticket)
+            summary['fetched'] += 1
+            if len(batch) >= 1000:
+                flush()
+        flush()
+
+        store.set_last_sync(int(started), scope)
+        summary['synced_at'] = int(started)
+        summary['seconds'] = round(time.time() - started, 3)
+        return summary
 
     def _require_connected(self) -> None:
         if not self._token:
@@ -125,8 +591,7 @@ class SiteIQClient:
     def _build_params(self, status, start_date, end_date, delta) -> dict:
         if delta is not None and (start_date is not None or end_date is not None):
             raise ValueError('delta cannot be combined with start_date or end_date')
-        if status is not None and status not in self._VALID_STATUSES:
-            raise ValueError(f'status must be one of {sorted(self._VALID_STATUSES)}')
+        status = _normalize_status(status, self._VALID_STATUSES)
 
         params: dict = {}
         if status:
@@ -140,25 +605,349 @@ class SiteIQClient:
                 params['endDate'] = _fmt_date(end_date)
         return params
 
-    def _get(self, params: dict) -> list:
-        resp = requests.get(
-            f'{self.base_uri}/api/external/ticket',
-            params=params,
-            headers={'Authorization': f'Bearer {self._token}', 'Accept': '*/*'},
-            timeout=30,
+    def _authenticate(self, email: str, password: str) -> None:
+        resp = self.transport.post(
+            f'{self.base_uri}/api/web/auth/token',
+            json={'email': email, 'password': password},
+            timeout=self.timeout,
         )
+        if resp.status_code in (401, 403):
+            if self.token_cache is not None:
+                self.token_cache.discard(self.base_uri, email)
+            raise SiteIQAuthError(
+                f'Authentication failed (HTTP {resp.status_code}): check email and password'
+            )
         resp.raise_for_status()
-        return resp.json()
+        token = resp.json()['token']
+        if self.token_cache is not None:
+            expires = self.token_cache.save(self.base_uri, email, token, password=password)
+        else:
+            # Without a cache only a JWT 'exp' drives proactive refresh; a 401
+            # still triggers re-auth either way.
+            exp = _jwt_exp(token)
+            expires = float(exp) if exp is not None else None
+        self._token, self._token_expires = token, expires
+
+    def _refresh_token(self, stale: Optional[str]) -> None:
+        # Re-authenticate once per stale token, however many threads noticed.
+        if self._password is None or self._email is None:
+            raise SiteIQAuthError('Session token expired and no credentials are held to refresh it')
+        with self._auth_lock:
+            if self._token != stale:
+                return
+            self._authenticate(self._email, self._password)
+            self._count('reauths')
+
+    def _token_expiring(self) -> bool:
+        expires = self._token_expires
+        return expires is not None and expires - self.refresh_margin <= time.time()
+
+    def _get_page(self, params: dict, typed: bool = False, where: Optional[Where] = None) -> Tuple[int, list]:
+        # (tickets on the page, tickets kept): paging needs the first even
+        # when `where` drops most of the page.
+        hooks = self._hooks
+        started = time.perf_counter() if hooks else 0.0
+        cache = self.cache
+        cached = False
+        if cache is None:
+            body = self._request(params).content
+        else:
+            key = cache.key(self._email, self.base_uri, params)
+            body = cache.get(key)
+            if body is None:
+                body = self._request(params).content
+                cache.put(key, body, cache.ttl_for(params))
+            else:
+                cached = True
+        if 'page_decoded' not in hooks:
+            return self._decode(body, typed, where)
+        decode_start = time.perf_counter()
+        size, tickets = self._decode(body, typed, where)
+        now = time.perf_counter()
+        self._emit('page_decoded', {
+            'params': params, 'page': _page_number(params), 'tickets': size,
+            'bytes': len(body), 'seconds': now - started, 'decode_seconds': now - decode_start,
+            'cached': cached,
+        })
+        return size, tickets
+
+    def _decode(self, body: bytes, typed: bool, where: Optional[Where]) -> Tuple[int, list]:
+        if typed:
+            return self.decoder.decode_page(body, where)
+        tickets = json.loads(body)
+        if where is None:
+            return len(tickets), tickets
+        return len(tickets), list(filter(where.match, tickets))
+
+    def _get_stream(self, params: dict) -> Iterator[dict]:
+        # Cached pages are served from disk; streamed pages are not stored,
+        # since that would mean holding the whole body in memory.
+        if self.cache is not None:
+            body = self.cache.get(self.cache.key(self._email, self.base_uri, params))
+            if body is not None:
+                yield from json.loads(body)
+                return
+        started = time.perf_counter()
+        resp = self._request(params, stream=True)
+        try:
+            chunks = resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+            if 'page_decoded' not in self._hooks:
+                yield from iter_json_array(chunks)
+                return
+            size = [0]
+            count = 0
+            for ticket in iter_json_array(_counted(chunks, size)):
+                count += 1
+                yield ticket
+            self._emit('page_decoded', {
+                'params': params, 'page': _page_number(params), 'tickets': count,
+                'bytes': size[0], 'seconds': time.perf_counter() - started, 'decode_seconds': None,
+                'cached': False,
+            })
+        finally:
+            resp.close()
+
+    def _request(self, params: dict, stream: bool = False) -> Any:
+        policy = self.retry
+        hooks = self._hooks
+        attempt = 0
+        reauthed = False
+        while True:
+            retry_after = None
+            status = None
+            error = None
+            token = self._token
+            if self._token_expiring() and self._password is not None:
+                self._refresh_token(token)
+                token = self._token
+            try:
+                with self._limiter:
+                    if hooks:
+                        self._emit('request_start', {'params': params, 'attempt': attempt})
+                        sent = time.perf_counter()
+                    try:
+                        resp = self.transport.get(
+                            f'{self.base_uri}/api/external/ticket',
+                            params=params,
+                            headers={'Authorization': f'Bearer {token}', 'Accept': '*/*'},
+                            timeout=self.timeout,
+                            stream=stream,
+                        )
+                    except Exception as exc:
+                        if hooks:
+                            self._emit('request_end', {
+                                'params': params, 'attempt': attempt, 'status': None,
+                                'seconds': time.perf_counter() - sent, 'error': type(exc).__name__,
+                            })
+                        raise
+                    if hooks:
+                        self._emit('request_end', {
+                            'params': params, 'attempt': attempt, 'status': resp.status_code,
+                            'seconds': time.perf_counter() - sent, 'error': None,
+                        })
+            except TRANSIENT_ERRORS as exc:
+                if attempt >= policy.max_retries:
+                    self._count('gave_up')
+                    raise
+                error = type(exc).__name__
+            else:
+                if resp.status_code == 401 and not reauthed and self._password is not None:
+                    # Token revoked or expired early: re-authenticate once and resend.
+                    resp.close()
+                    self._refresh_token(token)
+                    reauthed = True
+                    continue
+                if resp.status_code not in policy.retry_statuses:
+                    if not resp.ok:
+                        resp.close()
+                    resp.raise_for_status()
+                    self._limiter.on_success()
+                    return resp
+                status = resp.status_code
+                if status in policy.throttle_statuses:
+                    self._count('throttled')
+                    self._limiter.on_throttle()
+                retry_after = resp.headers.get('Retry-After')
+                resp.close()
+                if attempt >= policy.max_retries:
+                    self._count('gave_up')
+                    resp.raise_for_status()
+            self._count('retries')
+            delay = policy.delay(attempt, retry_after)
+            if hooks:
+                self._emit('retry', {
+                    'params': params, 'attempt': attempt, 'status': status, 'error': error, 'delay': delay,
+                })
+            time.sleep(delay)
+            attempt += 1
+
+    def _emit(self, event: str, info: dict) -> None:
+        for callback in self._hooks.get(event, ()):
+            callback(info)
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._retry_counts[key] += 1
 
-    def _iter_pages(self, base_params: dict) -> Iterator[dict]:
+    def _iter_limited(
+        self, params: dict, prefetch: int, typed: bool, where: Optional[Where], limit: Optional[int],
+    ) -> Iterator[Any]:
+        tickets = self._iter_query(params, prefetch, typed, where)
+        if limit is None:
+            yield from tickets
+            return
+        # Closing the query generator stops its prefetch thread or shard pool
+        # as soon as the limit is reached.
+        try:
+            yield from islice(tickets, limit)
+        finally:
+            tickets.close()
+
+    def _get_sharded(self, params: dict, offset: int, count: int) -> list:
+        # One page of a range the API would reject: the slice of the merged
+        # shards that paging through them would return at that offset.
+        tickets = self._iter_query(params, typed=self.records)
+        try:
+            return list(islice(tickets, offset, offset + count))
+        finally:
+            tickets.close()
+
+    def _iter_query(
+        self, params: dict, prefetch: int = 0, typed: bool = False, where: Optional[Where] = None,
+    ) -> Iterator[Any]:
+        # typed=True yields Ticket records, decoded page by page by self.decoder.
+        queries = _plan_queries(params, self.MAX_RANGE_DAYS)
+        if len(queries) > 1:
+            yield from self._iter_fanout(queries, prefetch, typed, where)
+        else:
+            yield from self._iter_pages(queries[0], prefetch, typed, where)
+
+    def _iter_fanout(
+        self, queries: List[dict], prefetch: int = 0, typed: bool = False, where: Optional[Where] = None,
+    ) -> Iterator[Any]:
+        # Date shards and per-status queries run in parallel over the shared
+        # pool, each handing its pages over through its own queue; tickets are
+        # yielded in query order, and one matched by more than one query is
+        # yielded once. prefetch bounds each queue (0: unbounded).
+        if prefetch < 0:
+            raise ValueError('prefetch must be >= 0')
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=prefetch) for _ in queries]
+
+        def fetch(query: dict, pages: queue.Queue) -> None:
+            try:
+                for batch in self._page_batches(query, typed, where):
+                    if not _put(pages, batch, stop):
+                        return
+            except Exception as exc:
+                _put(pages, exc, stop)
+            _put(pages, _END_OF_PAGES, stop)
+
+        seen = set()
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(queries)),
+            thread_name_prefix='siteiq-shard',
+        )
+        try:
+            # Shards start in order, so the one being read is always running.
+            for query, pages in zip(queries, queues):
+                pool.submit(fetch, query, pages)
+            for pages in queues:
+                while True:
+                    item = pages.get()
+                    if item is _END_OF_PAGES:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    for ticket in item:
+                        ticket_id = ticket.get('ticketID')
+                        if ticket_id in seen:
+                            continue
+                        seen.add(ticket_id)
+                        yield ticket
+        finally:
+            # Running shards stop at their next page; queued ones never start.
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_pages(
+        self, base_params: dict, prefetch: int = 0, typed: bool = False, where: Optional[Where] = None,
+    ) -> Iterator[Any]:
+        if prefetch < 0:
+            raise ValueError('prefetch must be >= 0')
+        if prefetch:
+            yield from self._iter_pages_prefetched(base_params, prefetch, typed, where)
+            return
         offset = 0
         while True:
-            batch = self._get({**base_params, 'pageLimit': '1000', 'pageOffset': str(offset)})
-            yield from batch
-            if len(batch) < 1000:
+            params = {**base_params, 'pageLimit': '1000', 'pageOffset': str(offset)}
+            if self.stream_decode:
+                seen = [0]
+                yield from self._stream_page(params, typed, where, seen)
+                count = seen[0]
+            else:
+                count, batch = self._get_page(params, typed, where)
+                yield from batch
+            if count < 1000:
                 break
             offset += 1000
 
+    def _stream_page(self, params: dict, typed: bool, where: Optional[Where], seen: list) -> Iterator[Any]:
+        # Tickets of one page as they are parsed; seen[0] counts every ticket
+        # on the page, matched or not, for paging.
+        match = where.match if where is not None else None
+        for ticket in self._get_stream(params):
+            seen[0] += 1
+            if match is not None and not match(ticket):
+                continue
+            yield Ticket.from_dict(ticket) if typed else ticket
+
+    def _iter_pages_prefetched(
+        self, base_params: dict, depth: int, typed: bool = False, where: Optional[Where] = None,
+    ) -> Iterator[Any]:
+        pages: queue.Queue = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def worker() -> None:
+            try:
+                for batch in self._page_batches(base_params, typed, where):
+                    if not _put(pages, batch, stop):
+                        return
+            except Exception as exc:
+                _put(pages, exc, stop)
+            _put(pages, _END_OF_PAGES, stop)
+
+        thread = threading.Thread(target=worker, name='siteiq-prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is _END_OF_PAGES:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield from item
+        finally:
+            stop.set()
+            thread.join()
+
+    def _page_batches(self, base_params: dict, typed: bool, where: Optional[Where]) -> Iterator[list]:
+        # Each page's kept tickets as one list. The next page is requested
+        # only when asked for, so a worker that stops asking stops fetching.
+        offset = 0
+        while True:
+            params = {**base_params, 'pageLimit': '1000', 'pageOffset': str(offset)}
+            if self.stream_decode:
+                seen = [0]
+                batch = list(self._stream_page(params, typed, where, seen))
+                size = seen[0]
+            else:
+                size, batch = self._get_page(params, typed, where)
+            yield batch
+            if size < 1000:
+                return
+            offset += 1000
+
     def __enter__(self) -> 'SiteIQClient':
         return self
 
@@ -170,5 +959,113 @@ class SiteIQClient:
         return f'SiteIQClient({self.base_uri!r}, {state})'
 
 
-def _fmt_date(d: Union[str, datetime]) -> str:
-    return d.strftime('%Y-%m-%d') if isinstance(d, datetime) else d
+_END_OF_PAGES = object()
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _put(pages: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    # Bounded put that gives up once the consumer has gone away.
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _fmt_date(d: Union[str, date, datetime]) -> str:
+    return d.strftime('%Y-%m-%d') if isinstance(d, date) else d
+
+
+def _page_number(params: dict) -> int:
+    return int(params.get('pageOffset', 0)) // max(1, int(params.get('pageLimit', 1000)))
+
+
+def _counted(chunks: Iterable[bytes], size: list) -> Iterator[bytes]:
+    # Pass chunks through, adding their length to size[0].
+    for chunk in chunks:
+        size[0] += len(chunk)
+        yield chunk
+
+
+def _normalize_status(status: Union[str, Iterable[str], None], valid: frozenset) -> Union[str, tuple, None]:
+    """
+    Validate a status or collection of statuses. A collection collapses to a
+    single status when it holds one (or includes 'All', which covers the rest),
+    and otherwise to a sorted tuple.
+    """
+    if status is None or isinstance(status, str):
+        if status is not None and status not in valid:
+            raise ValueError(f'status must be one of {sorted(valid)}')
+        return status
+    statuses = set(status)
+    if not statuses:
+        raise ValueError('status must not be an empty collection')
+    unknown = statuses - valid
+    if unknown:
+        raise ValueError(f'unknown status {sorted(unknown)}; choose from {sorted(valid)}')
+    if 'All' in statuses:
+        return 'All'
+    if len(statuses) == 1:
+        return statuses.pop()
+    return tuple(sorted(statuses))
+
+
+def _status_scope(status: Union[str, Iterable[str], None]) -> str:
+    """Sync-state key for a status filter: 'InProgress' when unset, 'A,B' for a set."""
+    if status is None or isinstance(status, str):
+        return status or 'InProgress'
+    statuses = set(status)
+    return 'All' if 'All' in statuses else ','.join(sorted(statuses))
+
+
+def _plan_queries(params: dict, days: int) -> List[dict]:
+    """Expand request params into one query per (status, date window)."""
+    statuses = params.get('status')
+    if not isinstance(statuses, tuple):
+        statuses = (statuses,)
+    windows = _plan_windows(params.get('startDate'), params.get('endDate'), days)
+    queries = []
+    for status in statuses:
+        base = dict(params)
+        if status is not None:
+            base['status'] = status
+        if len(windows) > 1:
+            queries.extend({**base, 'startDate': start, 'endDate': end} for start, end in windows)
+        else:
+            queries.append(base)
+    return queries
+
+
+def _plan_windows(
+    start: Union[str, date, datetime, None],
+    end: Union[str, date, datetime, None],
+    days: int,
+    today: Optional[date] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Split an inclusive 'YYYY-MM-DD' range into consecutive windows of at most
+    `days` days. A start without an end runs to `today` (the API measures it
+    the same way). Returns a single window (or none) when there is nothing to
+    split: a range without a start or an unparseable one is left for the API
+    to judge.
+    """
+    if start is None:
+        return []
+    start = _fmt_date(start)
+    end = _fmt_date(end if end is not None else today or date.today())
+    try:
+        first = datetime.strptime(start, '%Y-%m-%d')
+        last = datetime.strptime(end, '%Y-%m-%d')
+    except ValueError:
+        return [(start, end)]
+    if last < first:
+        return [(start, end)]
+
+    windows = []
+    while first <= last:
+        stop = min(first + timedelta(days=days - 1), last)
+        windows.append((first.strftime('%Y-%m-%d'), stop.strftime('%Y-%m-%d')))
+        first = stop + timedelta(days=1)
+    return windows
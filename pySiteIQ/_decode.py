@@ -0,0 +1,137 @@
+import json
+import sys
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from ._records import Alert, Ticket
+from ._schema import SCHEMA
+from ._where import Where
+
+try:
+    import msgspec
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+BACKENDS = ('msgspec', 'json')
+
+_TYPES = {'string': str, 'number': Union[int, float], 'integer': int, 'boolean': bool}
+
+
+class PageDecoder:
+    """
+    Decodes the raw bytes of a ticket page straight into Ticket records.
+
+    The msgspec backend parses each page into private structs typed from the
+    API schema (see _schema.py), so no intermediate dict is built per ticket
+    or alert. A compiled Where is tested on the structs, and only the
+    matches are copied into Ticket/Alert records, interning the same text
+    fields Ticket.from_dict does; intern=False skips that for pages that
+    are processed and dropped. The structs never leave the decoder. The json
+    backend uses the standard library: json.loads, then Ticket.from_dict.
+    Both produce equal records.
+
+        client = SiteIQClient(decoder=PageDecoder())   # implies records=True
+
+    A page that does not match the schema (a field of an unexpected type) is
+    decoded with the json backend instead and counted in `fallbacks`. The
+    msgspec backend keeps only the fields in the schema; use the json backend
+    to keep undocumented fields.
+
+    backend -- 'msgspec', 'json', or None for msgspec when it is installed
+    intern  -- intern text fields of msgspec-decoded records (json always does)
+    """
+
+    def __init__(self, backend: Optional[str] = None, intern: bool = True) -> None:
+        if backend is None:
+            backend = 'msgspec' if _HAS_MSGSPEC else 'json'
+        if backend not in BACKENDS:
+            raise ValueError(f'backend must be one of {BACKENDS}')
+        if backend == 'msgspec' and not _HAS_MSGSPEC:
+            raise ImportError('the msgspec backend needs msgspec: pip install msgspec')
+        self.backend = backend
+        self.intern = intern
+        self.fallbacks = 0
+        self._decoder = _page_decoder() if backend == 'msgspec' else None
+        self._copy = _copiers()[intern] if backend == 'msgspec' else None
+
+    def decode(self, body: Union[bytes, str]) -> List[Ticket]:
+        """Decode one page (a JSON array of tickets) into Ticket records."""
+        return self.decode_page(body)[1]
+
+    def decode_page(self, body: Union[bytes, str], where: Optional[Where] = None) -> Tuple[int, List[Ticket]]:
+        """
+        (tickets on the page, records) for one page. With a compiled Where,
+        the msgspec backend tests each struct's attributes before building
+        its record; the json backend tests each dict before Ticket.from_dict.
+        A plain-callable Where is tested on the built records.
+        """
+        if self._decoder is not None:
+            try:
+                structs = self._decoder.decode(body)
+            except msgspec.ValidationError:
+                self.fallbacks += 1
+            else:
+                if where is None:
+                    return len(structs), list(map(self._copy, structs))
+                if where.match_attrs is not None:
+                    return len(structs), list(map(self._copy, filter(where.match_attrs, structs)))
+                return len(structs), list(filter(where.match, map(self._copy, structs)))
+        tickets = json.loads(body)
+        if where is not None:
+            return len(tickets), [Ticket.from_dict(t) for t in tickets if where.match(t)]
+        return len(tickets), [Ticket.from_dict(t) for t in tickets]
+
+    def __repr__(self) -> str:
+        return f'PageDecoder({self.backend!r})'
+
+
+_CACHE: dict = {}
+
+
+def _page_decoder() -> 'msgspec.json.Decoder':
+    # Every field is optional and nullable: the API does not always send the
+    # full documented shape, and a missing field must decode as None, like
+    # Ticket.from_dict. Type mismatches still raise ValidationError.
+    if 'decoder' not in _CACHE:
+        structs: dict = {}
+        for name in ('Alert', 'Ticket'):
+            fields = []
+            for field, kind, _ in SCHEMA[name]:
+                if kind.startswith('array:'):
+                    annotation = Tuple[structs[kind[6:]], ...]
+                else:
+                    annotation = _TYPES[kind]
+                fields.append((field, Optional[annotation], None))
+            structs[name] = msgspec.defstruct(f'_{name}Struct', fields, gc=False)
+        _CACHE['decoder'] = msgspec.json.Decoder(List[structs['Ticket']])
+    return _CACHE['decoder']
+
+
+def _copiers() -> dict:
+    # intern -> function copying a Ticket struct into a Ticket record.
+    if 'copiers' not in _CACHE:
+        _CACHE['copiers'] = {
+            intern: _compile_copy(Ticket, 'alerts', _compile_copy(Alert, None, None, intern), intern)
+            for intern in (True, False)
+        }
+    return _CACHE['copiers']
+
+
+def _compile_copy(cls: type, nested: Optional[str], copy_item: Optional[Callable], intern: bool) -> Callable[[Any], Any]:
+    # Generated and unrolled like a Where: one attribute copy per schema
+    # field, which is most of the per-page cost once msgspec has parsed it.
+    # Struct fields are typed str-or-None, so interning only checks for None.
+    lines = ['    self = _new(_cls)', '    self._extra = None']
+    for field in cls._fields:
+        if intern and field in cls._interned:
+            lines.append(f'    value = s.{field}')
+            lines.append(f'    self.{field} = _intern(value) if value is not None else None')
+        elif field == nested:
+            lines.append(f'    value = s.{field}')
+            lines.append(f'    self.{field} = tuple(map(_item, value)) if value is not None else None')
+        else:
+            lines.append(f'    self.{field} = s.{field}')
+    source = 'def copy(s, _new=_new, _cls=_cls, _intern=_intern, _item=_item):\n' + '\n'.join(lines) + '\n    return self\n'
+    namespace = {'_new': object.__new__, '_cls': cls, '_intern': sys.intern, '_item': copy_item}
+    exec(compile(source, f'<copy:{cls.__name__}>', 'exec'), namespace)
+    return namespace['copy']
@@ -0,0 +1,437 @@
+import math
+from array import array
+from collections import Counter
+from datetime import datetime
+from itertools import chain, repeat
+from operator import truediv
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ._metrics import Histogram
+from ._timestamps import NO_TIME, to_epoch, to_epochs
+
+# Upper bounds, in seconds, of the duration histogram buckets (+Inf is implicit):
+# 5m, 15m, 1h, 4h, 12h, 1d, 3d, 7d, 14d, 30d.
+DURATION_BUCKETS = (300, 900, 3600, 14400, 43200, 86400, 259200, 604800, 1209600, 2592000)
+
+# Alert and ticket fields an AlertDurations can group by.
+GROUP_FIELDS = (
+    'error', 'fuelingPosition', 'siteID', 'siteName', 'companyName', 'address',
+    'dispenser', 'component', 'ticketStatus', 'warrantyStatus',
+)
+_ALERT_GROUP_FIELDS = frozenset({'error', 'fuelingPosition'})
+# Alert timestamps are held per group and folded into the groups' stats once
+# this many are pending: each group is then converted and updated with a few
+# calls per fold rather than several per alert.
+_FOLD_AT = 1 << 15
+
+# A sketch keeps its values exactly, packed 8 bytes each, up to this many,
+# then switches to log buckets. Most groups are small, and a bucket costs a
+# dict entry and an int key, several times the size of a packed value.
+_EXACT_LIMIT = 1024
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error (DDSketch-style).
+
+    The first 1024 values are kept exactly in a packed array, so small
+    sketches are compact and their quantiles exact. Past that, values are
+    counted in logarithmic buckets: any quantile is returned within
+    `relative_accuracy` of the true value, and memory depends on the range of
+    values (at most about 900 buckets from one second to a year at 1%), not
+    on how many were added. Two sketches with the same accuracy merge
+    exactly, so partial results from threads, accounts or days combine.
+    """
+
+    __slots__ = ('relative_accuracy', '_gamma', '_log_gamma', '_exact', '_bins', 'zeros', 'count')
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy must be between 0 and 1')
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._exact: Optional[array] = array('d')
+        self._bins: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+
+    @property
+    def exact(self) -> bool:
+        """True while every value is still held exactly."""
+        return self._exact is not None
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value >= 0 (values <= 0 are counted as 0)."""
+        if value > 0:
+            self._add_positive([value] * count)
+        else:
+            self.zeros += count
+        self.count += count
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add many values at once; much faster than add() in a loop."""
+        if not isinstance(values, list):
+            values = list(values)
+        positive = list(filter((0).__lt__, values))
+        self._add_positive(positive)
+        self.zeros += len(values) - len(positive)
+        self.count += len(values)
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Fold another sketch with the same relative_accuracy into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('can only merge sketches with the same relative_accuracy')
+        if other._exact is not None:
+            self._add_positive(other._exact)
+        else:
+            if self._exact is not None:
+                self._to_bins()
+            bins = self._bins
+            for key, n in other._bins.items():
+                bins[key] = bins.get(key, 0) + n
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def value(self, key: int) -> float:
+        """Representative value of a bucket key."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        [(value, count), ...] in ascending order, zeros first: distinct values
+        while the sketch is exact, bucket representatives after.
+        """
+        out = [(0.0, self.zeros)] if self.zeros else []
+        if self._exact is not None:
+            out.extend(sorted(Counter(self._exact).items()))
+        else:
+            out.extend((self.value(key), self._bins[key]) for key in sorted(self._bins))
+        return out
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), or None if empty."""
+        if not self.count:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError('q must be between 0 and 1')
+        rank = q * (self.count - 1)
+        seen = 0
+        buckets = self.buckets()
+        for value, n in buckets:
+            seen += n
+            if seen > rank:
+                return value
+        return buckets[-1][0]
+
+    def _add_positive(self, values: Sequence[float]) -> None:
+        exact = self._exact
+        if exact is None:
+            self._count_keys(values)
+            return
+        exact.extend(values)
+        if len(exact) > _EXACT_LIMIT:
+            self._to_bins()
+
+    def _to_bins(self) -> None:
+        self._count_keys(self._exact)
+        self._exact = None
+
+    def _count_keys(self, values: Sequence[float]) -> None:
+        bins = self._bins
+        keys = map(math.ceil, map(truediv, map(math.log, values), repeat(self._log_gamma)))
+        for key, n in Counter(keys).items():
+            bins[key] = bins.get(key, 0) + n
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        held = 'exact' if self._exact is not None else f'{len(self._bins)} buckets'
+        return f'QuantileSketch({self.count} values, {held})'
+
+
+class DurationStats:
+    """
+    Open-to-close durations for one group of alerts.
+
+    closed alerts are complete observations; still-open alerts are censored
+    at their current age. Both are kept as sums, extremes and a
+    QuantileSketch, with a Histogram of closed durations, so memory stops
+    growing once each sketch has switched to buckets.
+    """
+
+    __slots__ = ('closed', 'open', 'closed_sum', 'open_sum', 'closed_max', 'open_max', 'histogram')
+
+    def __init__(self, relative_accuracy: float = 0.01, buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        self.closed = QuantileSketch(relative_accuracy)
+        self.open = QuantileSketch(relative_accuracy)
+        self.closed_sum = 0
+        self.open_sum = 0
+        self.closed_max = 0
+        self.open_max = 0
+        self.histogram = Histogram(buckets)
+
+    def add_closed(self, seconds: int) -> None:
+        self.closed.add(seconds)
+        self.closed_sum += seconds
+        if seconds > self.closed_max:
+            self.closed_max = seconds
+        self.histogram.observe(seconds)
+
+    def add_open(self, age: int) -> None:
+        self.open.add(age)
+        self.open_sum += age
+        if age > self.open_max:
+            self.open_max = age
+
+    def extend_closed(self, seconds: List[int]) -> None:
+        """add_closed() for a non-empty list of durations."""
+        self.closed.extend(seconds)
+        self.closed_sum += sum(seconds)
+        self.closed_max = max(self.closed_max, max(seconds))
+        self.histogram.observe_many(seconds)
+
+    def extend_open(self, ages: List[int]) -> None:
+        """add_open() for a non-empty list of ages."""
+        self.open.extend(ages)
+        self.open_sum += sum(ages)
+        self.open_max = max(self.open_max, max(ages))
+
+    def merge(self, other: 'DurationStats') -> None:
+        self.closed.merge(other.closed)
+        self.open.merge(other.open)
+        self.closed_sum += other.closed_sum
+        self.open_sum += other.open_sum
+        self.closed_max = max(self.closed_max, other.closed_max)
+        self.open_max = max(self.open_max, other.open_max)
+        h, o = self.histogram, other.histogram
+        if h.bounds != o.bounds:
+            raise ValueError('can only merge stats with the same histogram buckets')
+        h.counts = [a + b for a, b in zip(h.counts, o.counts)]
+        h.sum += o.sum
+        h.count += o.count
+
+    def survival_quantile(self, q: float) -> Optional[float]:
+        """
+        Kaplan-Meier estimate of the time by which a fraction q of alerts
+        close, counting open alerts as censored at their age. None if the
+        estimate never reaches q (too many alerts are still open).
+        """
+        events = self.closed
+        censored = self.open
+        at_risk = events.count + censored.count
+        if not events.count:
+            return None
+        timeline = [(value, n, 0) for value, n in events.buckets()]
+        timeline.extend((value, 0, n) for value, n in censored.buckets())
+        # Ties count events before censoring.
+        timeline.sort(key=lambda step: (step[0], not step[1]))
+        survival = 1.0
+        for value, d, c in timeline:
+            if d and at_risk > 0:
+                survival *= 1 - d / at_risk
+                if 1 - survival >= q:
+                    return value
+            at_risk -= d + c
+        return None
+
+    def summary(self) -> dict:
+        """Counts, mean and percentiles of closed durations, open ages, and censoring-aware estimates."""
+        closed, open_ = self.closed.count, self.open.count
+        total = closed + open_
+        return {
+            'closed': closed,
+            'open': open_,
+            'mttr': round(self.closed_sum / closed, 1) if closed else None,
+            'p50': _round(self.closed.quantile(0.5)),
+            'p90': _round(self.closed.quantile(0.9)),
+            'p99': _round(self.closed.quantile(0.99)),
+            'max': self.closed_max if closed else None,
+            'open_mean_age': round(self.open_sum / open_, 1) if open_ else None,
+            'open_max_age': self.open_max if open_ else None,
+            # Counting open alerts at their age so far: a lower bound on the true mean.
+            'mean_lower_bound': round((self.closed_sum + self.open_sum) / total, 1) if total else None,
+            'km_p50': _round(self.survival_quantile(0.5)),
+            'km_p90': _round(self.survival_quantile(0.9)),
+        }
+
+
+class AlertDurations:
+    """
+    Single-pass alert open→close duration analytics, grouped by any mix of
+    ticket and alert fields.
+
+        durations = AlertDurations(by=('siteName', 'error'))
+        durations.update(client.iter_tickets(status='All'))
+        for row in durations.report(sort='p90')[:10]:
+            print(row['siteName'], row['error'], row['mttr'], row['p90'], row['open'])
+
+    Alerts are buffered per group, up to 32768 at a time across all groups,
+    then converted with one to_epochs() pass and folded into each group's
+    DurationStats with one bulk update. A group holds up to 1024 closed and
+    1024 open durations exactly, 8 bytes each, then a bounded bucket sketch,
+    so memory is capped per group however many alerts arrive; with thousands
+    of small groups it is about half of keeping the raw durations in lists.
+    Alerts still open are censored at `now`: they add to the open counts and
+    ages and to the Kaplan-Meier estimates (km_p50, km_p90), but not to mttr
+    or the closed percentiles, which would otherwise be biased low. Results
+    from several instances with the same settings combine with merge().
+
+    by                -- field name or tuple of names from GROUP_FIELDS;
+                         () for a single overall group
+    now               -- epoch seconds open alerts are aged to; default the
+                         current local wall-clock time, read like the API's
+                         zone-less timestamps
+    relative_accuracy -- quantile sketch accuracy
+    buckets           -- histogram bucket upper bounds, in seconds
+    """
+
+    def __init__(
+        self,
+        by: Union[str, Sequence[str]] = (),
+        *,
+        now: Optional[int] = None,
+        relative_accuracy: float = 0.01,
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> None:
+        self.by: Tuple[str, ...] = (by,) if isinstance(by, str) else tuple(by)
+        unknown = [f for f in self.by if f not in GROUP_FIELDS]
+        if unknown:
+            raise ValueError(f'cannot group by {unknown}; choose from {GROUP_FIELDS}')
+        if now is None:
+            now = to_epoch(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self.now = now
+        self.relative_accuracy = relative_accuracy
+        self.buckets = tuple(buckets)
+        self.groups: Dict[tuple, DurationStats] = {}
+        self.skipped = 0
+
+    def update(self, tickets: Iterable[Any]) -> 'AlertDurations':
+        """Fold the alerts of tickets (dicts or Ticket records) in, e.g. from iter_tickets()."""
+        plan = [(f in _ALERT_GROUP_FIELDS, f) for f in self.by]
+        per_alert = any(from_alert for from_alert, _ in plan)
+        pending: Dict[tuple, Tuple[list, list]] = {}
+        held = 0
+        for ticket in tickets:
+            alerts = ticket.get('alerts')
+            if not alerts:
+                continue
+            if per_alert:
+                for alert in alerts:
+                    key = tuple([alert.get(f) if from_alert else ticket.get(f) for from_alert, f in plan])
+                    lists = pending.get(key)
+                    if lists is None:
+                        lists = pending[key] = ([], [])
+                    lists[0].append(alert.get('alertOpenTimestamp'))
+                    lists[1].append(alert.get('alertCloseTimestamp'))
+            else:
+                key = tuple([ticket.get(f) for _, f in plan])
+                lists = pending.get(key)
+                if lists is None:
+                    lists = pending[key] = ([], [])
+                for alert in alerts:
+                    lists[0].append(alert.get('alertOpenTimestamp'))
+                    lists[1].append(alert.get('alertCloseTimestamp'))
+            held += len(alerts)
+            if held >= _FOLD_AT:
+                self._fold(pending)
+                held = 0
+        self._fold(pending)
+        return self
+
+    def update_alerts(self, rows: Iterable[Any]) -> 'AlertDurations':
+        """Fold in flat alert rows that carry their ticket's fields, e.g. from iter_alerts()."""
+        by = self.by
+        pending: Dict[tuple, Tuple[list, list]] = {}
+        held = 0
+        for row in rows:
+            get = row.get
+            key = tuple([get(f) for f in by])
+            lists = pending.get(key)
+            if lists is None:
+                lists = pending[key] = ([], [])
+            lists[0].append(get('alertOpenTimestamp'))
+            lists[1].append(get('alertCloseTimestamp'))
+            held += 1
+            if held >= _FOLD_AT:
+                self._fold(pending)
+                held = 0
+        self._fold(pending)
+        return self
+
+    def merge(self, other: 'AlertDurations') -> 'AlertDurations':
+        """Combine another instance's groups into this one (same by, accuracy and buckets)."""
+        if other.by != self.by:
+            raise ValueError('can only merge AlertDurations grouped by the same fields')
+        for key, stats in other.groups.items():
+            self._stats(key).merge(stats)
+        self.skipped += other.skipped
+        return self
+
+    def stats(self, *key: Any) -> Optional[DurationStats]:
+        """DurationStats for one group, keyed by its field values in `by` order."""
+        return self.groups.get(key)
+
+    def report(self, sort: str = 'closed', descending: bool = True) -> List[dict]:
+        """
+        One summary dict per group (see DurationStats.summary), with the group
+        fields first, sorted by any summary key; groups lacking that value
+        sort last.
+        """
+        rows = []
+        for key, stats in self.groups.items():
+            row = dict(zip(self.by, key))
+            row.update(stats.summary())
+            rows.append(row)
+        present = [r for r in rows if r.get(sort) is not None]
+        missing = [r for r in rows if r.get(sort) is None]
+        present.sort(key=lambda r: r[sort], reverse=descending)
+        return present + missing
+
+    def total(self) -> DurationStats:
+        """All groups merged into one DurationStats."""
+        out = DurationStats(self.relative_accuracy, self.buckets)
+        for stats in self.groups.values():
+            out.merge(stats)
+        return out
+
+    def _stats(self, key: tuple) -> DurationStats:
+        stats = self.groups.get(key)
+        if stats is None:
+            stats = self.groups[key] = DurationStats(self.relative_accuracy, self.buckets)
+        return stats
+
+    def _fold(self, pending: Dict[tuple, Tuple[list, list]]) -> None:
+        # Every pending timestamp is converted in one to_epochs() pass per
+        # column; each group then takes its slice in one bulk update.
+        now = self.now
+        starts = to_epochs(list(chain.from_iterable(opened for opened, _ in pending.values())))
+        ends = to_epochs(list(chain.from_iterable(closed for _, closed in pending.values())))
+        at = 0
+        for key, (opened, _) in pending.items():
+            first, at = at, at + len(opened)
+            group_starts, group_ends = starts[first:at], ends[first:at]
+            done = [end - start for start, end in zip(group_starts, group_ends) if start != NO_TIME and end >= start]
+            ages = [
+                now - start if now > start else 0
+                for start, end in zip(group_starts, group_ends) if end == NO_TIME and start != NO_TIME
+            ] if NO_TIME in group_ends else []
+            self.skipped += len(opened) - len(done) - len(ages)
+            if done or ages:
+                stats = self._stats(key)
+                if done:
+                    stats.extend_closed(done)
+                if ages:
+                    stats.extend_open(ages)
+        pending.clear()
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __repr__(self) -> str:
+        return f'AlertDurations(by={self.by!r}, {len(self.groups)} groups)'
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 1)
@@ -0,0 +1,196 @@
+import csv
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from ._records import ALERT_FIELDS, TICKET_FIELDS
+
+# Ticket-level rows: every scalar ticket field plus the number of alerts.
+TICKET_COLUMNS = tuple(f for f in TICKET_FIELDS if f != 'alerts') + ('alertCount',)
+
+# Alert-level rows: the parent ticket's fields, then the alert's own.
+ALERT_COLUMNS = tuple(f for f in TICKET_FIELDS if f != 'alerts') + ('alertSeq',) + ALERT_FIELDS
+
+_FORMATS = ('csv', 'jsonl')
+_FLATTEN = ('ticket', 'alert', 'nested')
+
+
+def flatten_tickets(tickets: Iterable[Any]) -> Iterator[dict]:
+    """One flat dict per ticket with TICKET_COLUMNS keys; alerts are counted, not kept."""
+    fields = TICKET_COLUMNS[:-1]
+    for t in tickets:
+        get = t.get
+        row = {name: get(name) for name in fields}
+        row['alertCount'] = len(get('alerts') or ())
+        yield row
+
+
+def flatten_alerts(
+    tickets: Iterable[Any],
+    *,
+    open_only: bool = False,
+    error: Any = None,
+    fueling_position: Any = None,
+) -> Iterator[dict]:
+    """
+    One flat dict per alert with ALERT_COLUMNS keys, carrying its parent
+    ticket's fields. Tickets without alerts produce no rows.
+
+    The filters are checked against each alert before its row is built, and
+    the parent fields are only copied for tickets with a matching alert.
+    error and fueling_position take a value, a list/tuple/set of values, or
+    a callable, as TicketFrame filters do.
+
+    open_only        -- only alerts with no alertCloseTimestamp
+    error            -- match on the alert's error text
+    fueling_position -- match on the alert's fuelingPosition
+    """
+    fields = ALERT_COLUMNS[:ALERT_COLUMNS.index('alertSeq')]
+    match_error = _matcher(error)
+    match_position = _matcher(fueling_position)
+    for t in tickets:
+        alerts = t.get('alerts')
+        if not alerts:
+            continue
+        parent = None
+        for seq, a in enumerate(alerts):
+            get = a.get
+            if open_only and get('alertCloseTimestamp') is not None:
+                continue
+            if match_error is not None and not match_error(get('error')):
+                continue
+            if match_position is not None and not match_position(get('fuelingPosition')):
+                continue
+            if parent is None:
+                tget = t.get
+                parent = {name: tget(name) for name in fields}
+            row = dict(parent)
+            row['alertSeq'] = seq
+            for name in ALERT_FIELDS:
+                row[name] = get(name)
+            yield row
+
+
+def _matcher(condition: Any) -> Optional[Callable[[Any], bool]]:
+    if condition is None:
+        return None
+    if callable(condition):
+        return condition
+    if isinstance(condition, (list, tuple, set, frozenset)):
+        return frozenset(condition).__contains__
+    return lambda value: value == condition
+
+
+def resolve_format(path: Union[str, os.PathLike], format: Optional[str], compress: Optional[bool]) -> tuple:
+    """(format, compress) from explicit arguments or the file suffix, e.g. tickets.jsonl.gz."""
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    if compress is None:
+        compress = bool(suffixes) and suffixes[-1] == '.gz'
+    if format is None:
+        stem = [s for s in suffixes if s != '.gz']
+        ext = stem[-1] if stem else ''
+        format = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}.get(ext)
+        if format is None:
+            raise ValueError(f'cannot infer export format from {str(path)!r}; pass format=')
+    if format not in _FORMATS:
+        raise ValueError(f'format must be one of {_FORMATS}')
+    return format, compress
+
+
+def export_tickets(
+    tickets: Iterable[Any],
+    path: Union[str, os.PathLike],
+    *,
+    format: Optional[str] = None,
+    flatten: str = 'ticket',
+    compress: Optional[bool] = None,
+    columns: Optional[Sequence[str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    compresslevel: int = 6,
+) -> dict:
+    """
+    Write tickets to CSV or JSON Lines as they arrive, optionally gzip-compressed.
+
+    Rows go to disk one at a time, so memory use does not grow with the
+    number of tickets. Returns {'path', 'format', 'compressed', 'flatten',
+    'rows', 'bytes', 'seconds', 'rows_per_sec'}, where bytes is the size of
+    the file written (after compression).
+
+    format        -- 'csv' or 'jsonl'; inferred from the suffix when None
+    flatten       -- 'ticket' (one row per ticket), 'alert' (one row per
+                     alert) or 'nested' (API-shaped tickets, JSONL only)
+    compress      -- gzip the output; inferred from a .gz suffix when None
+    columns       -- subset and order of columns for flattened rows
+    headers       -- column -> name written in its place (the CSV header,
+                     or the JSONL key), e.g. {'ticketID': 'TicketID'};
+                     columns not in it keep their own name
+    compresslevel -- gzip level, 1 (fastest) to 9 (smallest)
+    """
+    format, compress = resolve_format(path, format, compress)
+    if flatten not in _FLATTEN:
+        raise ValueError(f'flatten must be one of {_FLATTEN}')
+    if flatten == 'nested' and (format == 'csv' or columns is not None or headers is not None):
+        raise ValueError("flatten='nested' writes whole tickets and is only supported for jsonl")
+
+    if flatten == 'ticket':
+        rows: Iterable[Any] = flatten_tickets(tickets)
+        header: List[str] = list(TICKET_COLUMNS)
+    elif flatten == 'alert':
+        rows = flatten_alerts(tickets)
+        header = list(ALERT_COLUMNS)
+    else:
+        rows = (t.to_dict() if hasattr(t, 'to_dict') else t for t in tickets)
+        header = []
+    if columns is not None:
+        unknown = [c for c in columns if c not in header]
+        if unknown:
+            raise ValueError(f'unknown columns {unknown}; choose from {header}')
+        header = list(columns)
+    names = None
+    if headers:
+        unknown = [c for c in headers if c not in header]
+        if unknown:
+            raise ValueError(f'headers name unknown columns {unknown}; choose from {header}')
+        names = [headers.get(c, c) for c in header]
+
+    started = time.perf_counter()
+    count = 0
+    if compress:
+        f = gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=compresslevel)
+    else:
+        f = open(path, 'w', encoding='utf-8', newline='')
+    with f:
+        if format == 'csv':
+            writer = csv.DictWriter(f, fieldnames=header, extrasaction='ignore')
+            if names is None:
+                writer.writeheader()
+            else:
+                writer.writerow(dict(zip(header, names)))
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+            write = f.write
+            for row in rows:
+                if names is not None:
+                    row = {name: row.get(c) for c, name in zip(header, names)}
+                elif columns is not None:
+                    row = {c: row.get(c) for c in header}
+                write(dumps(row))
+                write('\n')
+                count += 1
+    seconds = time.perf_counter() - started
+    return {
+        'path': str(path),
+        'format': format,
+        'compressed': compress,
+        'flatten': flatten,
+        'rows': count,
+        'bytes': os.path.getsize(path),
+        'seconds': round(seconds, 3),
+        'rows_per_sec': round(count / seconds) if seconds > 0 else 0,
+    }
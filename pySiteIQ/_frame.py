@@ -0,0 +1,340 @@
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._timestamps import durations, to_epochs
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(n: int) -> int:
+        return bin(n).count('1')
+
+# Byte value -> eight 0/1 bytes, least significant bit first.
+_EXPAND = [bytes((b >> i) & 1 for i in range(8)) for b in range(256)]
+
+# Code -> translate table mapping that byte to '1' and every other byte to '0'.
+_ONE_HOT = [bytes(49 if i == code else 48 for i in range(256)) for code in range(256)]
+
+# Above this many categories a filtered group-by walks the codes once instead
+# of intersecting one bitmap per category.
+_BITMAP_GROUP_LIMIT = 32
+
+
+def expand_mask(mask: int, rows: int) -> bytes:
+    """One 0/1 byte per row for a row bitmap, for use with itertools.compress."""
+    data = mask.to_bytes((rows + 7) // 8, 'little')
+    return b''.join([_EXPAND[b] for b in data])[:rows]
+
+
+class Categorical:
+    """
+    Dictionary-encoded column: one small int code per row plus the list of
+    distinct values. Each category also gets a row bitmap (a Python int with
+    bit r set for every row r holding that value), built lazily on first
+    query, so equality filters and group-by counts are bitwise operations
+    over whole columns rather than per-row Python work.
+    """
+
+    __slots__ = ('codes', 'categories', '_lookup', '_bitmaps')
+
+    def __init__(self, categories: Optional[List[Any]] = None) -> None:
+        self.codes = array('i')
+        self.categories: List[Any] = list(categories or ())
+        self._lookup: Dict[Any, int] = {v: i for i, v in enumerate(self.categories)}
+        self._bitmaps: Optional[List[int]] = None
+
+    def append(self, value: Any) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+        self._bitmaps = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.categories[self.codes[row]]
+
+    def bitmaps(self) -> List[int]:
+        """Row bitmap for each category, in category order."""
+        if self._bitmaps is None:
+            if not self.codes:
+                self._bitmaps = [0] * len(self.categories)
+            elif len(self.categories) <= 256:
+                # One byte per row, reversed so row 0 is the lowest bit; each
+                # bitmap is then a translate to '0'/'1' and an int(..., 2).
+                row_bytes = array('B', reversed(self.codes)).tobytes()
+                self._bitmaps = [
+                    int(row_bytes.translate(_ONE_HOT[code]), 2)
+                    for code in range(len(self.categories))
+                ]
+            else:
+                width = (len(self.codes) + 7) // 8
+                buffers = [bytearray(width) for _ in self.categories]
+                for row, code in enumerate(self.codes):
+                    buffers[code][row >> 3] |= 1 << (row & 7)
+                self._bitmaps = [int.from_bytes(b, 'little') for b in buffers]
+        return self._bitmaps
+
+    def mask(self, condition: Any) -> int:
+        """
+        Bitmap of rows matching `condition`: a value (equality), a list/tuple/
+        set/frozenset of values (membership), or a callable evaluated once per
+        distinct value.
+        """
+        if callable(condition):
+            wanted = [i for i, v in enumerate(self.categories) if condition(v)]
+        elif isinstance(condition, (list, tuple, set, frozenset)):
+            wanted = [self._lookup[v] for v in condition if v in self._lookup]
+        else:
+            code = self._lookup.get(condition)
+            wanted = [] if code is None else [code]
+        bitmaps = self.bitmaps()
+        result = 0
+        for code in wanted:
+            result |= bitmaps[code]
+        return result
+
+    def value_counts(self, mask: Optional[int] = None) -> Counter:
+        """Counter of value -> rows, optionally restricted to a row bitmap."""
+        if mask is None or len(self.categories) > _BITMAP_GROUP_LIMIT:
+            codes = self.codes if mask is None else compress(self.codes, expand_mask(mask, len(self.codes)))
+            counts = Counter(codes)
+            return Counter({self.categories[c]: n for c, n in counts.items()})
+        return Counter({
+            value: n
+            for value, bitmap in zip(self.categories, self.bitmaps())
+            if (n := _popcount(bitmap & mask))
+        })
+
+
+class _Table:
+    """Shared query surface for TicketFrame and AlertTable."""
+
+    _categorical: Tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, Any] = {}
+        self._rows = 0
+        self._epochs: Dict[str, Tuple[int, array]] = {}
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _all(self) -> int:
+        return (1 << self._rows) - 1
+
+    def mask(self, **conditions: Any) -> int:
+        """
+        Row bitmap for rows matching every condition. Keys are categorical
+        column names; values are as for Categorical.mask(). A ready bitmap can
+        be passed as mask=... to further narrow it.
+        """
+        result = conditions.pop('mask', None)
+        if result is None:
+            result = self._all()
+        for name, condition in conditions.items():
+            column = self.columns.get(name)
+            if not isinstance(column, Categorical):
+                raise KeyError(f'{name!r} is not a filterable column; choose from {sorted(self._categorical)}')
+            result &= column.mask(condition)
+        return result
+
+    def count(self, **conditions: Any) -> int:
+        """Number of rows matching the conditions."""
+        return _popcount(self.mask(**conditions))
+
+    def count_by(self, column: str, **conditions: Any) -> Counter:
+        """Group-by-count over a categorical column, after filtering."""
+        col = self.columns.get(column)
+        if not isinstance(col, Categorical):
+            raise KeyError(f'{column!r} is not a categorical column; choose from {sorted(self._categorical)}')
+        if not conditions:
+            return col.value_counts()
+        return col.value_counts(self.mask(**conditions))
+
+    def top(self, column: str, k: int = 10, **conditions: Any) -> List[Tuple[Any, int]]:
+        """The k most common values of `column` among matching rows."""
+        return self.count_by(column, **conditions).most_common(k)
+
+    def row_indices(self, mask: int) -> Iterator[int]:
+        """Row numbers set in a bitmap, in ascending order."""
+        return compress(range(self._rows), expand_mask(mask, self._rows))
+
+    def epochs(self, column: str) -> array:
+        """
+        A timestamp column as an array('q') of epoch seconds (NO_TIME where
+        missing), converted in one pass on first use and memoized until rows
+        are added. Categorical columns convert each distinct value once.
+        """
+        cached = self._epochs.get(column)
+        if cached is not None and cached[0] == self._rows:
+            return cached[1]
+        col = self.columns[column]
+        if isinstance(col, Categorical):
+            per_category = to_epochs(col.categories)
+            values = array('q', map(per_category.__getitem__, col.codes))
+        else:
+            values = to_epochs(col)
+        self._epochs[column] = (self._rows, values)
+        return values
+
+    def row(self, index: int) -> dict:
+        return {name: col[index] for name, col in self.columns.items()}
+
+    def rows(self, **conditions: Any) -> Iterator[dict]:
+        """Materialise matching rows as dicts, in table order."""
+        for index in self.row_indices(self.mask(**conditions)):
+            yield self.row(index)
+
+
+class AlertTable(_Table):
+    """
+    Flattened child table with one row per alert. ticketRow links each alert
+    to its parent row in the TicketFrame; ticketID, siteName, component and
+    dispenser are copied from the parent so alerts can be grouped by them
+    directly.
+    """
+
+    _categorical = ('error', 'fuelingPosition', 'stillOpen', 'siteName', 'component', 'dispenser')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.columns = {
+            'ticketRow': array('i'),
+            'ticketID': array('q'),
+            'alertOpenTimestamp': [],
+            'alertCloseTimestamp': [],
+        }
+        for name in self._categorical:
+            self.columns[name] = Categorical()
+
+    def _append(self, row: int, ticket: Any, alert: Any) -> None:
+        c = self.columns
+        closed = alert.get('alertCloseTimestamp')
+        c['ticketRow'].append(row)
+        c['ticketID'].append(ticket.get('ticketID') or 0)
+        c['alertOpenTimestamp'].append(alert.get('alertOpenTimestamp'))
+        c['alertCloseTimestamp'].append(closed)
+        c['error'].append(alert.get('error'))
+        c['fuelingPosition'].append(alert.get('fuelingPosition'))
+        c['stillOpen'].append(closed is None)
+        c['siteName'].append(ticket.get('siteName'))
+        c['component'].append(ticket.get('component'))
+        c['dispenser'].append(ticket.get('dispenser'))
+        self._rows += 1
+
+    def seconds_to_close(self, now: Optional[int] = None) -> array:
+        """
+        Per-alert open-to-close time in seconds, as an array('q') aligned with
+        the rows. Alerts still open are censored at `now` (epoch seconds) when
+        given, and NO_TIME otherwise.
+        """
+        return durations(self.epochs('alertOpenTimestamp'), self.epochs('alertCloseTimestamp'), now=now)
+
+
+class TicketFrame(_Table):
+    """
+    Columnar, array-backed container for tickets.
+
+    Build it straight from the client (client.get_frame(...)) or from any
+    iterable of ticket dicts/records. Text fields with few distinct values
+    are dictionary-encoded Categorical columns; ticketID and alertCount are
+    typed arrays. Alerts are flattened into frame.alerts, an AlertTable.
+
+        frame = client.get_frame(status='All')
+        frame.count_by('component')
+        frame.top('siteName', 10, warrantyStatus='Out')
+        frame.count(alertCount=lambda n: n >= 3)
+        frame.alerts.top('error', 10, stillOpen=True)
+    """
+
+    _categorical = (
+        'siteID', 'siteName', 'companyName', 'address', 'warrantyDate', 'warrantyStatus',
+        'dispenser', 'ticketStatus', 'component', 'alertCount', 'openDate',
+    )
+
+    def __init__(self, tickets: Iterable[Any] = ()) -> None:
+        super().__init__()
+        self.columns = {
+            'ticketID': array('q'),
+            'ticketOpenTimestamp': [],
+            'integrationID1': [],
+            'integrationID2': [],
+            'integrationID3': [],
+        }
+        for name in self._categorical:
+            self.columns[name] = Categorical()
+        self.alerts = AlertTable()
+        self.extend(tickets)
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Iterable[Any]]) -> 'TicketFrame':
+        """Build a frame from an iterable of ticket pages (lists of tickets)."""
+        frame = cls()
+        for page in pages:
+            frame.extend(page)
+        return frame
+
+    def extend(self, tickets: Iterable[Any]) -> None:
+        """Append tickets (dicts or Ticket records) as new rows."""
+        c = self.columns
+        ids, opened = c['ticketID'], c['ticketOpenTimestamp']
+        int1, int2, int3 = c['integrationID1'], c['integrationID2'], c['integrationID3']
+        categorical: List[Tuple[str, Categorical]] = [
+            (name, c[name]) for name in self._categorical if name not in ('alertCount', 'openDate')
+        ]
+        alert_count, open_date = c['alertCount'], c['openDate']
+        alert_table = self.alerts
+        for ticket in tickets:
+            get = ticket.get
+            row = self._rows
+            ids.append(get('ticketID') or 0)
+            stamp = get('ticketOpenTimestamp')
+            opened.append(stamp)
+            int1.append(get('integrationID1'))
+            int2.append(get('integrationID2'))
+            int3.append(get('integrationID3'))
+            for name, column in categorical:
+                column.append(get(name))
+            open_date.append(stamp[:10] if stamp else None)
+            alerts = get('alerts') or ()
+            alert_count.append(len(alerts))
+            for alert in alerts:
+                alert_table._append(row, ticket, alert)
+            self._rows += 1
+
+    def filter(self, **conditions: Any) -> 'TicketFrame':
+        """New TicketFrame holding only the matching rows (and their alerts)."""
+        return TicketFrame(self.tickets(**conditions))
+
+    def tickets(self, **conditions: Any) -> Iterator[dict]:
+        """Reconstruct matching rows as ticket dicts in the API's shape."""
+        alert_rows = self._alerts_by_ticket()
+        names = [n for n in self.columns if n not in ('alertCount', 'openDate')]
+        for index in self.row_indices(self.mask(**conditions)):
+            ticket = {name: self.columns[name][index] for name in names}
+            ticket['alerts'] = [
+                {
+                    'error': self.alerts.columns['error'][a],
+                    'fuelingPosition': self.alerts.columns['fuelingPosition'][a],
+                    'alertOpenTimestamp': self.alerts.columns['alertOpenTimestamp'][a],
+                    'alertCloseTimestamp': self.alerts.columns['alertCloseTimestamp'][a],
+                }
+                for a in alert_rows.get(index, ())
+            ]
+            yield ticket
+
+    def _alerts_by_ticket(self) -> Dict[int, List[int]]:
+        by_ticket: Dict[int, List[int]] = {}
+        for alert_index, ticket_row in enumerate(self.alerts.columns['ticketRow']):
+            by_ticket.setdefault(ticket_row, []).append(alert_index)
+        return by_ticket
+
+    def __repr__(self) -> str:
+        return f'TicketFrame({self._rows} tickets, {len(self.alerts)} alerts)'
+
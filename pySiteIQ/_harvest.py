@@ -0,0 +1,191 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+from ._client import SiteIQClient
+from ._retry import AdaptiveLimiter
+from ._store import TicketStore
+
+_DONE = object()
+
+
+class Harvester:
+    """
+    Pulls tickets from several Site-IQ accounts at once and merges them.
+
+    Each account gets its own authenticated SiteIQClient, run on its own
+    thread. Every client shares one AdaptiveLimiter, so max_concurrency caps
+    the requests in flight across all accounts together, and a throttling
+    response from any account slows all of them. Each ticket is tagged with
+    its source account under 'account'.
+
+        accounts = [
+            {'name': 'acme', 'email': 'ops@acme.example', 'password': '...'},
+            ('ops@globex.example', '...'),
+        ]
+        harvester = Harvester(accounts, max_concurrency=8)
+        for t in harvester.iter_tickets(status='All'):
+            print(t['account'], t['ticketID'])
+        print(harvester.summary)
+
+    accounts        -- (email, password) tuples or dicts with 'email',
+                       'password' and optional 'name' / 'base_uri'
+    base_uri        -- default API base URL for accounts that do not set one
+    max_concurrency -- requests in flight across every account combined
+    max_accounts    -- accounts harvested at the same time
+    client_options  -- passed to each SiteIQClient (retry, token_cache, ...)
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Union[tuple, dict]],
+        *,
+        base_uri: str = SiteIQClient.DEFAULT_BASE_URI,
+        max_concurrency: int = 8,
+        max_accounts: int = 4,
+        **client_options: Any,
+    ) -> None:
+        if max_concurrency < 1 or max_accounts < 1:
+            raise ValueError('max_concurrency and max_accounts must be >= 1')
+        self.accounts: List[dict] = [_account(a, base_uri) for a in accounts]
+        names = [a['name'] for a in self.accounts]
+        if len(set(names)) != len(names):
+            raise ValueError('account names must be unique')
+        self.max_concurrency = max_concurrency
+        self.max_accounts = max_accounts
+        self.client_options = client_options
+        self.limiter = AdaptiveLimiter(max_concurrency)
+        self.summary: Optional[dict] = None
+
+    def iter_tickets(self, **filters: Any) -> Iterator[Any]:
+        """
+        Stream tickets from every account as they arrive, tagged with 'account'.
+
+        filters are passed to each client's iter_tickets() (status, dates,
+        delta, prefetch). An account that fails to log in or errors part way
+        is recorded in summary['accounts'] with its error; the others carry on.
+        summary is set once the stream is exhausted.
+        """
+        results: queue.Queue = queue.Queue(maxsize=max(4, 2 * self.max_accounts))
+        stop = threading.Event()
+        started = time.perf_counter()
+        report = {
+            a['name']: {'tickets': 0, 'requests': 0, 'retries': 0, 'seconds': 0.0, 'error': None}
+            for a in self.accounts
+        }
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def harvest(account: dict) -> None:
+            name = account['name']
+            entry = report[name]
+            t0 = time.perf_counter()
+            batch: list = []
+            try:
+                with SiteIQClient(account['base_uri'], limiter=self.limiter, **self.client_options) as client:
+                    client.connect(account['email'], account['password'])
+                    for ticket in client.iter_tickets(**filters):
+                        ticket['account'] = name
+                        batch.append(ticket)
+                        if len(batch) >= 1000:
+                            entry['tickets'] += len(batch)
+                            if not put(batch):
+                                return
+                            batch = []
+                        if stop.is_set():
+                            return
+                    entry['tickets'] += len(batch)
+                    if batch:
+                        put(batch)
+                    entry['requests'] = client.connection_stats()['requests']
+                    entry['retries'] = client.retry_stats()['retries']
+            except Exception as exc:
+                entry['error'] = f'{type(exc).__name__}: {exc}'
+            finally:
+                entry['seconds'] = round(time.perf_counter() - t0, 3)
+                put(_DONE)
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_accounts, len(self.accounts)) or 1,
+            thread_name_prefix='siteiq-harvest',
+        )
+        try:
+            for account in self.accounts:
+                pool.submit(harvest, account)
+            remaining = len(self.accounts)
+            while remaining:
+                item = results.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield from item
+        finally:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        self.summary = {
+            'tickets': sum(e['tickets'] for e in report.values()),
+            'seconds': round(time.perf_counter() - started, 3),
+            'failed': sorted(n for n, e in report.items() if e['error']),
+            'accounts': report,
+        }
+
+    def get_tickets(self, **filters: Any) -> list:
+        """List form of iter_tickets()."""
+        return list(self.iter_tickets(**filters))
+
+    def harvest(self, store: TicketStore, **filters: Any) -> dict:
+        """
+        Upsert every account's tickets into a TicketStore, in batches, and
+        return the summary with inserted/updated counts added. Each stored
+        ticket keeps its account, so store.get_tickets(account='acme') works.
+
+        The store is keyed on ticketID alone, so a ticket that several
+        accounts can see is stored once, under whichever account's copy was
+        upserted last. summary['shared'] counts those tickets.
+        """
+        synced_at = int(time.time())
+        counts = {'inserted': 0, 'updated': 0}
+        owners: dict = {}
+        shared = set()
+        batch: list = []
+        for ticket in self.iter_tickets(**filters):
+            ticket_id = ticket.get('ticketID')
+            if owners.setdefault(ticket_id, ticket['account']) != ticket['account']:
+                shared.add(ticket_id)
+            # upsert() keeps the last copy of a ticketID repeated in a batch.
+            batch.append(ticket)
+            if len(batch) >= 1000:
+                for k, v in store.upsert(batch, synced_at=synced_at).items():
+                    counts[k] += v
+                batch.clear()
+        for k, v in store.upsert(batch, synced_at=synced_at).items():
+            counts[k] += v
+        self.summary.update(counts)
+        self.summary['shared'] = len(shared)
+        return self.summary
+
+    def __repr__(self) -> str:
+        return f'Harvester({len(self.accounts)} accounts, max_concurrency={self.max_concurrency})'
+
+
+def _account(spec: Union[tuple, dict], base_uri: str) -> dict:
+    if isinstance(spec, dict):
+        if 'email' not in spec or 'password' not in spec:
+            raise ValueError('account dicts need email and password')
+        email, password = spec['email'], spec['password']
+        name = spec.get('name') or email
+        base_uri = spec.get('base_uri') or base_uri
+    else:
+        email, password = spec
+        name = email
+    return {'name': name, 'email': email, 'password': password, 'base_uri': base_uri}
@@ -0,0 +1,188 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence
+
+# Upper bounds, in seconds, of the latency histogram buckets (+Inf is implicit).
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def observe_many(self, values: Sequence[float]) -> None:
+        counts = self.counts
+        for index, n in Counter(map(bisect_left, repeat(self.bounds), values)).items():
+            counts[index] += n
+        self.sum += sum(values)
+        self.count += len(values)
+
+    def cumulative(self) -> List[tuple]:
+        """[(upper_bound, observations <= bound), ...] ending with ('+Inf', count)."""
+        out, running = [], 0
+        for bound, n in zip(self.bounds + ('+Inf',), self.counts):
+            running += n
+            out.append((bound, running))
+        return out
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile, or None if empty."""
+        if not self.count:
+            return None
+        target = q * self.count
+        for bound, running in self.cumulative():
+            if running >= target:
+                return float('inf') if bound == '+Inf' else bound
+        return None
+
+
+class MetricsCollector:
+    """
+    Built-in consumer of SiteIQClient hook events.
+
+    Records request latency and page decode time as histograms, HTTP status
+    counts, errors, retries, pages (network vs cache), tickets and response
+    bytes. snapshot() returns the numbers as a dict; to_prometheus() renders
+    them in the Prometheus text exposition format.
+
+        metrics = MetricsCollector()
+        client = SiteIQClient(metrics=metrics)   # or metrics.attach(client)
+        ...
+        print(metrics.to_prometheus())
+
+    One collector can be attached to several clients (e.g. every client of a
+    Harvester) to aggregate them.
+
+    buckets -- latency histogram bucket upper bounds, in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def attach(self, client) -> 'MetricsCollector':
+        """Register this collector's hooks on a client."""
+        client.add_hook('request_end', self.on_request_end)
+        client.add_hook('page_decoded', self.on_page_decoded)
+        client.add_hook('retry', self.on_retry)
+        return self
+
+    def detach(self, client) -> None:
+        client.remove_hook('request_end', self.on_request_end)
+        client.remove_hook('page_decoded', self.on_page_decoded)
+        client.remove_hook('retry', self.on_retry)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.request_seconds = Histogram(self._buckets)
+            self.page_seconds = Histogram(self._buckets)
+            self.decode_seconds = Histogram(self._buckets)
+            self.statuses: Dict[str, int] = {}
+            self.errors = 0
+            self.retries: Dict[str, int] = {}
+            self.pages = {'network': 0, 'cache': 0}
+            self.tickets = 0
+            self.bytes = 0
+            self._first: Optional[float] = None
+            self._last: Optional[float] = None
+
+    def on_request_end(self, info: dict) -> None:
+        with self._lock:
+            self.request_seconds.observe(info['seconds'])
+            if info['status'] is None:
+                self.errors += 1
+            else:
+                key = str(info['status'])
+                self.statuses[key] = self.statuses.get(key, 0) + 1
+
+    def on_page_decoded(self, info: dict) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            if self._first is None:
+                self._first = now - info['seconds']
+            self._last = now
+            self.page_seconds.observe(info['seconds'])
+            if info.get('decode_seconds') is not None:
+                self.decode_seconds.observe(info['decode_seconds'])
+            self.pages['cache' if info['cached'] else 'network'] += 1
+            self.tickets += info['tickets']
+            self.bytes += info['bytes'] or 0
+
+    def on_retry(self, info: dict) -> None:
+        reason = str(info['status']) if info['status'] is not None else info['error'] or 'error'
+        with self._lock:
+            self.retries[reason] = self.retries.get(reason, 0) + 1
+
+    def snapshot(self) -> dict:
+        """Current counters plus derived rates and latency quantiles."""
+        with self._lock:
+            elapsed = (self._last - self._first) if self._first is not None else 0.0
+            requests = self.request_seconds.count
+            return {
+                'requests': requests,
+                'statuses': dict(self.statuses),
+                'errors': self.errors,
+                'retries': dict(self.retries),
+                'pages': dict(self.pages),
+                'tickets': self.tickets,
+                'bytes': self.bytes,
+                'seconds': round(elapsed, 3),
+                'tickets_per_sec': round(self.tickets / elapsed, 1) if elapsed > 0 else 0.0,
+                'request_seconds_avg': round(self.request_seconds.sum / requests, 4) if requests else None,
+                'request_seconds_p50': self.request_seconds.quantile(0.5),
+                'request_seconds_p95': self.request_seconds.quantile(0.95),
+                'decode_seconds_total': round(self.decode_seconds.sum, 4),
+            }
+
+    def to_prometheus(self, prefix: str = 'siteiq') -> str:
+        """Metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, doc: str, samples: List[tuple]) -> None:
+            lines.append(f'# HELP {prefix}_{name} {doc}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            for suffix, labels, value in samples:
+                label = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f'{prefix}_{name}{suffix}{{{label}}} {value}' if label else f'{prefix}_{name}{suffix} {value}')
+
+        def histogram(name: str, doc: str, h: Histogram) -> None:
+            samples = [('_bucket', {'le': bound}, n) for bound, n in h.cumulative()]
+            samples += [('_sum', {}, round(h.sum, 6)), ('_count', {}, h.count)]
+            metric(name, 'histogram', doc, samples)
+
+        with self._lock:
+            histogram('request_duration_seconds', 'Time from sending a ticket request to its response.',
+                      self.request_seconds)
+            histogram('page_duration_seconds', 'Time to fetch and decode one page of tickets.',
+                      self.page_seconds)
+            histogram('decode_duration_seconds', 'Time spent decoding page bodies.', self.decode_seconds)
+            metric('requests_total', 'counter', 'Ticket requests by HTTP status.',
+                   [('', {'status': s}, n) for s, n in sorted(self.statuses.items())])
+            metric('request_errors_total', 'counter', 'Ticket requests that got no HTTP response.',
+                   [('', {}, self.errors)])
+            metric('retries_total', 'counter', 'Ticket requests retried, by reason.',
+                   [('', {'reason': r}, n) for r, n in sorted(self.retries.items())])
+            metric('pages_total', 'counter', 'Pages decoded, by source.',
+                   [('', {'source': s}, n) for s, n in sorted(self.pages.items())])
+            metric('tickets_total', 'counter', 'Tickets decoded.', [('', {}, self.tickets)])
+            metric('response_bytes_total', 'counter', 'Response body bytes decoded.', [('', {}, self.bytes)])
+        return '\n'.join(lines) + '\n'
+
+    def __repr__(self) -> str:
+        return f'MetricsCollector({self.request_seconds.count} requests, {self.tickets} tickets)'
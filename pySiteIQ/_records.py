@@ -0,0 +1,220 @@
+import sys
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+from ._timestamps import to_datetime, to_epoch
+
+TICKET_FIELDS = (
+    'ticketID', 'ticketOpenTimestamp', 'siteID', 'siteName', 'companyName', 'address',
+    'integrationID1', 'integrationID2', 'integrationID3', 'warrantyDate', 'warrantyStatus',
+    'dispenser', 'ticketStatus', 'component', 'alerts',
+)
+ALERT_FIELDS = ('error', 'fuelingPosition', 'alertOpenTimestamp', 'alertCloseTimestamp')
+
+# from_dict keeps undocumented keys only when the dict's keys are not a
+# subset of these: a length check alone misses a dict that lacks one field
+# and carries one unknown key.
+_TICKET_KEYS = frozenset(TICKET_FIELDS)
+_ALERT_KEYS = frozenset(ALERT_FIELDS)
+
+_intern = sys.intern
+
+
+class _Record:
+    """
+    Shared read/write mapping behaviour for the slotted record types.
+
+    Records support both attribute access (ticket.siteName) and the dict-style
+    access the rest of the library uses (ticket['siteName'], ticket.get(...),
+    'alerts' in ticket, dict(ticket)). Fields the API sends that are not part
+    of the documented schema are kept in a side dict, allocated only if needed.
+    """
+
+    __slots__ = ('_extra',)
+    _fields: tuple = ()
+    _interned: frozenset = frozenset()
+
+    def __init__(self, **fields: Any) -> None:
+        self._extra: Optional[dict] = None
+        for name in self._fields:
+            setattr(self, name, None)
+        for name, value in fields.items():
+            self[name] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._fields:
+            if key in self._interned and value.__class__ is str:
+                value = _intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields or (self._extra is not None and key in self._extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self._fields) + (len(self._extra) if self._extra else 0)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_Record, dict)):
+            return self.to_dict() == (other.to_dict() if isinstance(other, _Record) else other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> list:
+        return list(self)
+
+    def values(self) -> list:
+        return [self[k] for k in self]
+
+    def items(self) -> list:
+        return [(k, self[k]) for k in self]
+
+    def _collect_extra(self, data: dict) -> None:
+        extra = {k: v for k, v in data.items() if k not in self._fields}
+        self._extra = extra or None
+
+    def to_dict(self) -> dict:
+        """Return a plain dict in the same shape the API returned."""
+        out = {name: getattr(self, name) for name in self._fields}
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+class Alert(_Record):
+    """
+    A single alert on a ticket, stored in __slots__ with the error text interned.
+
+    The *_epoch / *_datetime properties parse the timestamp strings on first
+    use; parsed values are memoized by string across all records.
+    """
+
+    __slots__ = ALERT_FIELDS
+    _fields = ALERT_FIELDS
+    _interned = frozenset({'error'})
+
+    @property
+    def opened_epoch(self) -> Optional[int]:
+        return to_epoch(self.alertOpenTimestamp)
+
+    @property
+    def closed_epoch(self) -> Optional[int]:
+        return to_epoch(self.alertCloseTimestamp)
+
+    @property
+    def opened_datetime(self) -> Optional[datetime]:
+        return to_datetime(self.alertOpenTimestamp)
+
+    @property
+    def closed_datetime(self) -> Optional[datetime]:
+        return to_datetime(self.alertCloseTimestamp)
+
+    @property
+    def seconds_to_close(self) -> Optional[int]:
+        """Seconds from open to close, or None while the alert is open."""
+        opened, closed = self.opened_epoch, self.closed_epoch
+        return closed - opened if opened is not None and closed is not None else None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Alert':
+        self = cls.__new__(cls)
+        self._extra = None
+        error = data.get('error')
+        self.error = _intern(error) if error.__class__ is str else error
+        self.fuelingPosition = data.get('fuelingPosition')
+        self.alertOpenTimestamp = data.get('alertOpenTimestamp')
+        self.alertCloseTimestamp = data.get('alertCloseTimestamp')
+        if not _ALERT_KEYS.issuperset(data):
+            self._collect_extra(data)
+        return self
+
+
+class Ticket(_Record):
+    """
+    A ticket stored in __slots__, with its alerts as a tuple of Alert records.
+
+    Low-cardinality text fields (site, company, address, component, status,
+    warranty and dispenser) are interned, so thousands of tickets from the
+    same site share one copy of each string.
+
+    opened_epoch / opened_datetime and warranty_epoch / warranty_datetime
+    parse ticketOpenTimestamp and warrantyDate lazily, like Alert's.
+    """
+
+    __slots__ = TICKET_FIELDS
+    _fields = TICKET_FIELDS
+    _interned = frozenset({
+        'siteID', 'siteName', 'companyName', 'address', 'warrantyDate',
+        'warrantyStatus', 'dispenser', 'ticketStatus', 'component',
+    })
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Ticket':
+        self = cls.__new__(cls)
+        self._extra = None
+        get = data.get
+        self.ticketID = get('ticketID')
+        self.ticketOpenTimestamp = get('ticketOpenTimestamp')
+        self.integrationID1 = get('integrationID1')
+        self.integrationID2 = get('integrationID2')
+        self.integrationID3 = get('integrationID3')
+        for name in cls._interned:
+            value = get(name)
+            setattr(self, name, _intern(value) if value.__class__ is str else value)
+        alerts = get('alerts')
+        self.alerts = tuple(Alert.from_dict(a) for a in alerts) if alerts is not None else None
+        if not _TICKET_KEYS.issuperset(data):
+            self._collect_extra(data)
+        return self
+
+    @property
+    def opened_epoch(self) -> Optional[int]:
+        return to_epoch(self.ticketOpenTimestamp)
+
+    @property
+    def opened_datetime(self) -> Optional[datetime]:
+        return to_datetime(self.ticketOpenTimestamp)
+
+    @property
+    def warranty_epoch(self) -> Optional[int]:
+        return to_epoch(self.warrantyDate)
+
+    @property
+    def warranty_datetime(self) -> Optional[datetime]:
+        return to_datetime(self.warrantyDate)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == 'alerts' and value is not None:
+            value = tuple(a if isinstance(a, Alert) else Alert.from_dict(a) for a in value)
+        super().__setitem__(key, value)
+
+    def to_dict(self) -> dict:
+        out = super().to_dict()
+        if self.alerts is not None:
+            out['alerts'] = [a.to_dict() for a in self.alerts]
+        return out
@@ -0,0 +1,128 @@
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class RetryPolicy:
+    """
+    How transient ticket-request failures are retried.
+
+    Failed requests are retried up to max_retries times with exponential
+    backoff and full jitter: attempt n sleeps a random time between 0 and
+    min(backoff_max, backoff_base * 2**n) seconds. A Retry-After header on a
+    retryable response is honoured as the minimum wait.
+
+    max_retries    -- retries after the first attempt; 0 disables retrying
+    backoff_base   -- backoff scale in seconds
+    backoff_max    -- cap on a single jittered backoff, in seconds
+    retry_statuses -- HTTP statuses treated as transient
+    throttle_statuses -- statuses that also cut the concurrency limit
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 4,
+        *,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: frozenset = frozenset({429, 500, 502, 503, 504}),
+        throttle_statuses: frozenset = frozenset({429, 503}),
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError('max_retries must be >= 0')
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.throttle_statuses = frozenset(throttle_statuses)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number `attempt` (zero-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        wait = random.uniform(0, ceiling)
+        server_wait = parse_retry_after(retry_after)
+        if server_wait is not None:
+            wait = max(wait, server_wait)
+        return wait
+
+    def __repr__(self) -> str:
+        return (f'RetryPolicy(max_retries={self.max_retries}, backoff_base={self.backoff_base}, '
+                f'backoff_max={self.backoff_max})')
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency gate shared by every request of one client.
+
+    The limit starts at `initial` and grows by one after each `limit`
+    consecutive successes (additive increase). A throttling response
+    multiplies it by `decrease` (multiplicative decrease), never going
+    below min_limit. Use as a context manager around each request.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        initial: Optional[int] = None,
+        decrease: float = 0.5,
+    ) -> None:
+        if not (1 <= min_limit <= max_limit):
+            raise ValueError('limits must satisfy 1 <= min_limit <= max_limit')
+        if not (0 < decrease < 1):
+            raise ValueError('decrease must be between 0 and 1')
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease = decrease
+        self.limit = initial if initial is not None else max(min_limit, max_limit // 2)
+        self.limit = min(max(self.limit, min_limit), max_limit)
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def on_success(self) -> None:
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def on_throttle(self) -> None:
+        with self._cond:
+            self.limit = max(self.min_limit, int(self.limit * self.decrease))
+            self._successes = 0
+
+    def __enter__(self) -> 'AdaptiveLimiter':
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, *args) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def __repr__(self) -> str:
+        return f'AdaptiveLimiter(limit={self.limit}, max_limit={self.max_limit}, in_flight={self.in_flight})'
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,81 @@
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Ticket and Alert field types, generated from the API schema in Site-IQ.json
+# (the same definitions as docs/openapi.yaml). Regenerate after a schema change:
+#
+#   python -m pySiteIQ._schema Site-IQ.json
+#
+# Each field is (name, type, nullable); type is a JSON Schema type name, or
+# 'array:<Name>' for a list of another schema object.
+
+# BEGIN GENERATED
+SCHEMA = {
+    'Alert': (
+        ('error', 'string', False),
+        ('fuelingPosition', 'number', False),
+        ('alertOpenTimestamp', 'string', False),
+        ('alertCloseTimestamp', 'string', True),
+    ),
+    'Ticket': (
+        ('ticketID', 'number', False),
+        ('ticketOpenTimestamp', 'string', False),
+        ('siteID', 'string', False),
+        ('siteName', 'string', False),
+        ('companyName', 'string', False),
+        ('address', 'string', False),
+        ('integrationID1', 'string', False),
+        ('integrationID2', 'string', False),
+        ('integrationID3', 'string', False),
+        ('warrantyDate', 'string', True),
+        ('warrantyStatus', 'string', False),
+        ('dispenser', 'string', False),
+        ('ticketStatus', 'string', False),
+        ('component', 'string', False),
+        ('alerts', 'array:Alert', False),
+    ),
+}
+# END GENERATED
+
+
+def generate(path: str) -> Dict[str, Tuple[tuple, ...]]:
+    """Read the Alert and Ticket definitions from a Site-IQ.json schema file."""
+    with open(path, encoding='utf-8') as f:
+        spec = json.load(f)
+    out = {}
+    for name in ('Alert', 'Ticket'):
+        fields = []
+        for field, prop in spec[name]['properties'].items():
+            types = prop['type'] if isinstance(prop['type'], list) else [prop['type']]
+            nullable = 'null' in types
+            kind = next(t for t in types if t != 'null')
+            if kind == 'array':
+                kind = 'array:' + prop['items']['$ref'].rsplit('/', 1)[-1]
+            fields.append((field, kind, nullable))
+        out[name] = tuple(fields)
+    return out
+
+
+def _main(argv: list) -> None:
+    if len(argv) != 1:
+        sys.exit('usage: python -m pySiteIQ._schema path/to/Site-IQ.json')
+    lines = ['SCHEMA = {']
+    for name, fields in generate(argv[0]).items():
+        lines.append(f'    {name!r}: (')
+        lines.extend(f'        {field!r},' for field in fields)
+        lines.append('    ),')
+    lines.append('}')
+    body = '\n'.join(lines)
+    module = Path(__file__)
+    source = module.read_text(encoding='utf-8')
+    source = re.sub(r'(# BEGIN GENERATED\n).*?(\n# END GENERATED)',
+                    lambda m: m.group(1) + body + m.group(2), source, flags=re.S)
+    module.write_text(source, encoding='utf-8')
+    print(f'updated {module}')
+
+
+if __name__ == '__main__':
+    _main(sys.argv[1:])
@@ -0,0 +1,418 @@
+import json
+import os
+import sqlite3
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from ._records import ALERT_FIELDS, TICKET_FIELDS
+
+_TICKET_COLUMNS = tuple(f for f in TICKET_FIELDS if f != 'alerts')
+
+# Columns iter_tickets() accepts as equality filters.
+_FILTER_COLUMNS = frozenset({
+    'siteID', 'siteName', 'companyName', 'ticketStatus', 'component',
+    'warrantyStatus', 'dispenser', 'account',
+})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    ticketID            INTEGER PRIMARY KEY,
+    ticketOpenTimestamp TEXT,
+    siteID              TEXT,
+    siteName            TEXT,
+    companyName         TEXT,
+    address             TEXT,
+    integrationID1      TEXT,
+    integrationID2      TEXT,
+    integrationID3      TEXT,
+    warrantyDate        TEXT,
+    warrantyStatus      TEXT,
+    dispenser           TEXT,
+    ticketStatus        TEXT,
+    component           TEXT,
+    account             TEXT,
+    alertCount          INTEGER NOT NULL DEFAULT 0,
+    syncedAt            INTEGER
+);
+CREATE TABLE IF NOT EXISTS alerts (
+    ticketID            INTEGER NOT NULL REFERENCES tickets(ticketID) ON DELETE CASCADE,
+    seq                 INTEGER NOT NULL,
+    error               TEXT,
+    fuelingPosition     INTEGER,
+    alertOpenTimestamp  TEXT,
+    alertCloseTimestamp TEXT,
+    PRIMARY KEY (ticketID, seq)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope               TEXT PRIMARY KEY,
+    lastSync            INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_tickets_site      ON tickets(siteID);
+CREATE INDEX IF NOT EXISTS ix_tickets_status    ON tickets(ticketStatus);
+CREATE INDEX IF NOT EXISTS ix_tickets_component ON tickets(component);
+CREATE TABLE IF NOT EXISTS aggregate_views (
+    name                TEXT PRIMARY KEY,
+    columns             TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    view                TEXT NOT NULL,
+    key                 TEXT NOT NULL,
+    tickets             INTEGER NOT NULL,
+    alerts              INTEGER NOT NULL,
+    PRIMARY KEY (view, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_tickets_opened    ON tickets(ticketOpenTimestamp);
+CREATE INDEX IF NOT EXISTS ix_tickets_alerts    ON tickets(alertCount);
+CREATE INDEX IF NOT EXISTS ix_tickets_synced    ON tickets(syncedAt);
+"""
+
+# Columns added after the first release, applied to older databases on open.
+_MIGRATIONS = (
+    ('account', 'ALTER TABLE tickets ADD COLUMN account TEXT'),
+)
+_POST_MIGRATION = 'CREATE INDEX IF NOT EXISTS ix_tickets_account ON tickets(account);'
+
+_UPSERT_TICKET = (
+    f'INSERT INTO tickets ({", ".join(_TICKET_COLUMNS)}, alertCount, syncedAt, account) '
+    f'VALUES ({", ".join("?" * (len(_TICKET_COLUMNS) + 3))}) '
+    f'ON CONFLICT(ticketID) DO UPDATE SET '
+    + ', '.join(f'{c} = excluded.{c}' for c in _TICKET_COLUMNS[1:] + ('alertCount', 'syncedAt'))
+    + ', account = COALESCE(excluded.account, tickets.account)'
+)
+# Materialized views are kept current by triggers on the tickets table, so
+# each inserted, changed or deleted ticket moves its counts between groups in
+# the same transaction as the write. A group's key is the JSON array of its
+# column values, which keeps NULLs distinct and needs one table for every view.
+_ADD_TO_VIEW = (
+    "INSERT INTO aggregates (view, key, tickets, alerts) VALUES ('{name}', {key}, 1, {row}.alertCount) "
+    'ON CONFLICT(view, key) DO UPDATE SET tickets = tickets + 1, alerts = alerts + excluded.alerts;'
+)
+_REMOVE_FROM_VIEW = (
+    "UPDATE aggregates SET tickets = tickets - 1, alerts = alerts - OLD.alertCount "
+    "WHERE view = '{name}' AND key = {key}; "
+    "DELETE FROM aggregates WHERE view = '{name}' AND key = {key} AND tickets = 0;"
+)
+_VIEW_TRIGGERS = (
+    'CREATE TRIGGER agg_{name}_insert AFTER INSERT ON tickets BEGIN {add} END;',
+    'CREATE TRIGGER agg_{name}_update AFTER UPDATE OF {columns}, alertCount ON tickets '
+    'WHEN {changed} BEGIN {remove} {add} END;',
+    'CREATE TRIGGER agg_{name}_delete AFTER DELETE ON tickets BEGIN {remove} END;',
+)
+
+_INSERT_ALERT = (
+    f'INSERT INTO alerts (ticketID, seq, {", ".join(ALERT_FIELDS)}) '
+    f'VALUES ({", ".join("?" * (len(ALERT_FIELDS) + 2))})'
+)
+
+
+class TicketStore:
+    """
+    Local SQLite copy of Site-IQ tickets, kept current by SiteIQClient.sync().
+
+    Tickets are upserted by ticketID; each ticket's alerts live in a child
+    table and are replaced whenever the ticket is. The store remembers when
+    each status scope was last synced so later syncs only ask the API for
+    changes (delta). Tickets tagged with an 'account' (see Harvester) keep
+    it in the account column, which can be filtered on like the others. A
+    ticketID holds one account: the last upsert of that ticket that carries
+    an account sets it, and an upsert without one keeps the stored account.
+    Materialized views (see materialize()) keep per-group counts current as
+    tickets are upserted, for reports that should not rescan the store.
+
+        with TicketStore('siteiq.db') as store:
+            client.sync(store, status='All')
+            for t in store.iter_tickets(ticketStatus='open', component='Printer'):
+                ...
+
+    path -- database file, or ':memory:' for a throwaway store
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ':memory:') -> None:
+        self.path = str(path)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute('PRAGMA foreign_keys = ON')
+        if self.path != ':memory:':
+            self._db.execute('PRAGMA journal_mode = WAL')
+        self._db.executescript(_SCHEMA)
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(tickets)')}
+        for column, ddl in _MIGRATIONS:
+            if column not in columns:
+                self._db.execute(ddl)
+        self._db.executescript(_POST_MIGRATION)
+        self._db.commit()
+
+    def upsert(self, tickets: Iterable[Any], synced_at: Optional[int] = None) -> dict:
+        """
+        Insert or update tickets (dicts or Ticket records) in one transaction.
+        A ticketID that appears more than once in the batch is stored once,
+        from its last copy. Returns {'inserted': n, 'updated': n}.
+        """
+        # Rows are keyed on ticketID: a second copy would re-insert the first
+        # copy's alerts after their DELETE, and violate (ticketID, seq).
+        latest: Dict[Any, Any] = {}
+        for t in tickets:
+            latest[t.get('ticketID')] = t
+        ticket_rows: List[tuple] = []
+        alert_rows: List[tuple] = []
+        ids = list(latest)
+        for ticket_id, t in latest.items():
+            get = t.get
+            alerts = get('alerts') or ()
+            ticket_rows.append(tuple(get(c) for c in _TICKET_COLUMNS) + (len(alerts), synced_at, get('account')))
+            for seq, a in enumerate(alerts):
+                alert_rows.append((ticket_id, seq) + tuple(a.get(f) for f in ALERT_FIELDS))
+        if not ticket_rows:
+            return {'inserted': 0, 'updated': 0}
+
+        with self._db:
+            existing = self._count_existing(ids)
+            self._db.executemany(_UPSERT_TICKET, ticket_rows)
+            self._db.executemany(
+                'DELETE FROM alerts WHERE ticketID = ?', [(i,) for i in ids]
+            )
+            self._db.executemany(_INSERT_ALERT, alert_rows)
+        return {'inserted': len(ids) - existing, 'updated': existing}
+
+    def last_sync(self, scope: str = 'All') -> Optional[int]:
+        """Epoch of the last completed sync for a status scope, or None."""
+        row = self._db.execute('SELECT lastSync FROM sync_state WHERE scope = ?', (scope,)).fetchone()
+        return row[0] if row else None
+
+    def set_last_sync(self, epoch: int, scope: str = 'All') -> None:
+        with self._db:
+            self._db.execute(
+                'INSERT INTO sync_state (scope, lastSync) VALUES (?, ?) '
+                'ON CONFLICT(scope) DO UPDATE SET lastSync = excluded.lastSync',
+                (scope, int(epoch)),
+            )
+
+    def count(self, *, min_alerts: Optional[int] = None, **filters: Any) -> int:
+        """Number of stored tickets matching the filters (see iter_tickets)."""
+        if min_alerts is not None:
+            filters['_min_alerts'] = int(min_alerts)
+        where, args = self._where(filters)
+        return self._db.execute(f'SELECT COUNT(*) FROM tickets{where}', args).fetchone()[0]
+
+    def iter_tickets(
+        self,
+        *,
+        opened_after: Optional[str] = None,
+        opened_before: Optional[str] = None,
+        min_alerts: Optional[int] = None,
+        synced_since: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[dict]:
+        """
+        Stream stored tickets, with alerts, in ticketID order.
+
+        filters       -- equality on siteID, siteName, companyName, ticketStatus,
+                         component, warrantyStatus, dispenser or account; a
+                         list/tuple/set value matches any of its members
+        opened_after  -- 'YYYY-MM-DD[ HH:MM:SS]'; ticketOpenTimestamp >= this
+        opened_before -- ticketOpenTimestamp < this
+        min_alerts    -- only tickets with at least this many alerts (indexed)
+        synced_since  -- only tickets written by a sync at or after this epoch,
+                         e.g. sync()['synced_at'] for what that sync changed
+        """
+        if opened_after is not None:
+            filters['_opened_after'] = opened_after
+        if opened_before is not None:
+            filters['_opened_before'] = opened_before
+        if min_alerts is not None:
+            filters['_min_alerts'] = int(min_alerts)
+        if synced_since is not None:
+            filters['_synced_since'] = int(synced_since)
+        where, args = self._where(filters)
+
+        tickets = self._db.execute(
+            f'SELECT {", ".join(_TICKET_COLUMNS)}, account FROM tickets{where} ORDER BY ticketID', args
+        )
+        alerts = self._db.execute(
+            f'SELECT ticketID, {", ".join(ALERT_FIELDS)} FROM alerts '
+            f'WHERE ticketID IN (SELECT ticketID FROM tickets{where}) ORDER BY ticketID, seq',
+            args,
+        )
+        alert_groups = groupby(alerts, key=lambda row: row[0])
+        pending = next(alert_groups, None)
+        for row in tickets:
+            ticket = dict(zip(_TICKET_COLUMNS, row))
+            if row[-1] is not None:
+                ticket['account'] = row[-1]
+            ticket_alerts = []
+            if pending is not None and pending[0] == ticket['ticketID']:
+                ticket_alerts = [dict(zip(ALERT_FIELDS, a[1:])) for a in pending[1]]
+                pending = next(alert_groups, None)
+            ticket['alerts'] = ticket_alerts
+            yield ticket
+
+    def get_tickets(self, **filters: Any) -> list:
+        """List form of iter_tickets()."""
+        return list(self.iter_tickets(**filters))
+
+    def materialize(self, name: str, by: Union[str, Sequence[str]]) -> None:
+        """
+        Create a materialized view counting tickets and alerts per group of
+        the `by` columns (any iter_tickets() filter column).
+
+        The view is seeded once from the tickets already stored; after that,
+        triggers update it in the same transaction as every upsert, moving a
+        ticket between groups when its status, warranty or other grouped
+        column changes. Reading it with aggregate() costs O(groups) and
+        keeping it current costs O(changed tickets), however large the
+        store. Views persist in the database file; calling materialize()
+        again with the same columns is a no-op.
+
+        name -- view name (letters, digits and underscores)
+        by   -- column name or tuple of names to group by
+        """
+        columns = (by,) if isinstance(by, str) else tuple(by)
+        if not name.isidentifier():
+            raise ValueError(f'view name must be an identifier, not {name!r}')
+        if not columns:
+            raise ValueError('by must name at least one column')
+        unknown = [c for c in columns if c not in _FILTER_COLUMNS]
+        if unknown:
+            raise ValueError(f'cannot group by {unknown}; choose from {sorted(_FILTER_COLUMNS)}')
+        existing = self.views().get(name)
+        if existing is not None:
+            if existing != columns:
+                raise ValueError(f'view {name!r} already groups by {existing}; drop_view() it first')
+            return
+
+        def key(row: str) -> str:
+            return f'json_array({", ".join(f"{row}.{c}" for c in columns)})'
+
+        add = _ADD_TO_VIEW.format(name=name, key=key('NEW'), row='NEW')
+        remove = _REMOVE_FROM_VIEW.format(name=name, key=key('OLD'))
+        changed = ' OR '.join(f'OLD.{c} IS NOT NEW.{c}' for c in columns + ('alertCount',))
+        with self._db:
+            self._db.execute(
+                'INSERT INTO aggregate_views (name, columns) VALUES (?, ?)', (name, json.dumps(columns))
+            )
+            for ddl in _VIEW_TRIGGERS:
+                self._db.execute(ddl.format(
+                    name=name, columns=', '.join(columns), changed=changed, add=add, remove=remove,
+                ))
+            self._seed(name, columns)
+
+    def views(self) -> dict:
+        """{name: columns} of the materialized views in this store."""
+        return {
+            name: tuple(json.loads(columns))
+            for name, columns in self._db.execute('SELECT name, columns FROM aggregate_views ORDER BY name')
+        }
+
+    def aggregate(self, name: str, sort: str = 'tickets', descending: bool = True, **filters: Any) -> List[dict]:
+        """
+        Rows of a materialized view: the group's column values plus 'tickets'
+        (how many) and 'alerts' (their total alert count), sorted by any key.
+
+        filters -- equality (or list membership) on the view's own columns,
+                   e.g. aggregate('open_by_warranty', warrantyStatus='Out')
+        """
+        columns = self.views().get(name)
+        if columns is None:
+            raise KeyError(f'no materialized view named {name!r}')
+        unknown = [f for f in filters if f not in columns]
+        if unknown:
+            raise ValueError(f'view {name!r} groups by {columns}; cannot filter on {unknown}')
+        rows = []
+        for key, tickets, alerts in self._db.execute(
+            'SELECT key, tickets, alerts FROM aggregates WHERE view = ?', (name,)
+        ):
+            row = dict(zip(columns, json.loads(key)))
+            if all(_matches(row[f], v) for f, v in filters.items()):
+                row['tickets'] = tickets
+                row['alerts'] = alerts
+                rows.append(row)
+        present = [r for r in rows if r.get(sort) is not None]
+        missing = [r for r in rows if r.get(sort) is None]
+        present.sort(key=lambda r: r[sort], reverse=descending)
+        return present + missing
+
+    def refresh_view(self, name: str) -> None:
+        """Recompute a view from the stored tickets (only needed after editing tables by hand)."""
+        columns = self.views().get(name)
+        if columns is None:
+            raise KeyError(f'no materialized view named {name!r}')
+        with self._db:
+            self._db.execute('DELETE FROM aggregates WHERE view = ?', (name,))
+            self._seed(name, columns)
+
+    def drop_view(self, name: str) -> None:
+        """Remove a materialized view and its triggers."""
+        if not name.isidentifier():
+            raise ValueError(f'view name must be an identifier, not {name!r}')
+        with self._db:
+            for event in ('insert', 'update', 'delete'):
+                self._db.execute(f'DROP TRIGGER IF EXISTS agg_{name}_{event}')
+            self._db.execute('DELETE FROM aggregates WHERE view = ?', (name,))
+            self._db.execute('DELETE FROM aggregate_views WHERE name = ?', (name,))
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> list:
+        """Run a read-only SQL query against the store and return all rows."""
+        return self._db.execute(sql, tuple(params)).fetchall()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _count_existing(self, ids: List[int]) -> int:
+        found = 0
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            found += self._db.execute(
+                f'SELECT COUNT(*) FROM tickets WHERE ticketID IN ({", ".join("?" * len(chunk))})', chunk
+            ).fetchone()[0]
+        return found
+
+    def _seed(self, name: str, columns: tuple) -> None:
+        group = ', '.join(columns)
+        self._db.execute(
+            f'INSERT INTO aggregates (view, key, tickets, alerts) '
+            f'SELECT ?, json_array({group}), COUNT(*), SUM(alertCount) FROM tickets GROUP BY {group}',
+            (name,),
+        )
+
+    @staticmethod
+    def _where(filters: dict) -> tuple:
+        clauses, args = [], []
+        for name, value in filters.items():
+            if name == '_opened_after':
+                clauses.append('ticketOpenTimestamp >= ?')
+                args.append(value)
+            elif name == '_opened_before':
+                clauses.append('ticketOpenTimestamp < ?')
+                args.append(value)
+            elif name == '_min_alerts':
+                clauses.append('alertCount >= ?')
+                args.append(value)
+            elif name == '_synced_since':
+                clauses.append('syncedAt >= ?')
+                args.append(value)
+            elif name not in _FILTER_COLUMNS:
+                raise ValueError(f'cannot filter on {name!r}; choose from {sorted(_FILTER_COLUMNS)}')
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                values = list(value)
+                clauses.append(f'{name} IN ({", ".join("?" * len(values))})')
+                args.extend(values)
+            elif value is None:
+                clauses.append(f'{name} IS NULL')
+            else:
+                clauses.append(f'{name} = ?')
+                args.append(value)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), args
+
+    def __enter__(self) -> 'TicketStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'TicketStore({self.path!r})'
+
+
+def _matches(value: Any, wanted: Any) -> bool:
+    if isinstance(wanted, (list, tuple, set, frozenset)):
+        return value in wanted
+    return value == wanted
@@ -0,0 +1,66 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = ' \t\r\n'
+_DECODER = json.JSONDecoder()
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Incrementally decode a top-level JSON array from an iterable of byte chunks.
+
+    Yields each element as soon as it is complete, so at most one element plus
+    one chunk is held in memory at a time. Raises ValueError if the body is not
+    a JSON array or ends before the array is closed.
+    """
+    text = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buf = ''
+    pos = 0
+    eof = False
+    started = False
+
+    def refill() -> None:
+        nonlocal buf, pos, eof
+        if eof:
+            raise ValueError('response ended before the JSON array was closed')
+        buf, pos = buf[pos:], 0
+        try:
+            buf += text.decode(next(chunks))
+        except StopIteration:
+            buf += text.decode(b'', final=True)
+            eof = True
+
+    while True:
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buf):
+            refill()
+            continue
+
+        ch = buf[pos]
+        if not started:
+            if ch != '[':
+                raise ValueError('expected a JSON array response')
+            started = True
+            pos += 1
+        elif ch == ']':
+            return
+        elif ch == ',':
+            pos += 1
+        else:
+            try:
+                value, end = _DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                refill()
+                continue
+            # A bare number or literal that runs to the end of the buffer may
+            # continue in the next chunk; objects and strings are self-delimiting.
+            if end == len(buf) and not eof and buf[end - 1] not in '}]"':
+                refill()
+                continue
+            pos = end
+            yield value
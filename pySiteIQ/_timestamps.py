@@ -0,0 +1,103 @@
+from array import array
+from datetime import datetime, timedelta
+from itertools import compress, repeat
+from operator import eq, floordiv, sub
+from typing import Any, Dict, Iterable, Optional
+
+# Epoch value standing in for a missing or unparseable timestamp in epoch
+# arrays (array('q') cannot hold None).
+NO_TIME = -(1 << 63)
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+# Parsed string -> epoch seconds, shared by every caller. Timestamps repeat
+# across pages, alerts and syncs, and date-only fields such as warrantyDate
+# have few distinct values, so most lookups never reach the parser.
+_CACHE: Dict[Any, int] = {None: NO_TIME, '': NO_TIME}
+_CACHE_LIMIT = 1 << 18
+
+
+def to_epoch(value: Optional[str]) -> Optional[int]:
+    """
+    Epoch seconds for a 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD' string, or None
+    if it is missing or unparseable. API timestamps carry no zone; they are
+    read as UTC, so differences between them are exact.
+    """
+    epoch = _CACHE.get(value)
+    if epoch is None:
+        epoch = _parse_one(value)
+        _remember({value: epoch})
+    return None if epoch == NO_TIME else epoch
+
+
+def to_epochs(values: Iterable[Optional[str]]) -> array:
+    """
+    Convert a whole column of timestamp strings to an array('q') of epoch
+    seconds in one pass, with NO_TIME for missing or unparseable values.
+
+    Each distinct string is parsed once (datetime.fromisoformat, mapped over
+    the batch in C); every row is then a cache lookup.
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    cache = _CACHE
+    new = [v for v in dict.fromkeys(values) if v not in cache]
+    if new:
+        parsed = dict(zip(new, _parse_many(new)))
+        _remember(parsed)
+        if _CACHE is not cache:  # cleared to stay bounded, possibly by another thread
+            cache = {**cache, **parsed}
+    return array('q', map(cache.__getitem__, values))
+
+
+def to_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Naive datetime for a timestamp string, or None if missing/unparseable."""
+    epoch = to_epoch(value)
+    return None if epoch is None else _EPOCH + timedelta(seconds=epoch)
+
+
+def durations(starts: array, ends: array, *, now: Optional[int] = None) -> array:
+    """
+    ends - starts, element-wise, as an array('q') of seconds.
+
+    Rows with no end (still open) are censored at `now` (epoch seconds) when
+    given, and NO_TIME otherwise. Rows with no start are NO_TIME.
+    """
+    if len(starts) != len(ends):
+        raise ValueError('starts and ends must have the same length')
+    diffs = list(map(sub, ends, starts))
+    # Only rows with a missing side are visited in Python.
+    rows = range(len(starts))
+    if NO_TIME in ends:
+        for i in compress(rows, map(eq, ends, repeat(NO_TIME))):
+            start = starts[i]
+            diffs[i] = now - start if now is not None and start != NO_TIME else NO_TIME
+    if NO_TIME in starts:
+        for i in compress(rows, map(eq, starts, repeat(NO_TIME))):
+            diffs[i] = NO_TIME
+    return array('q', diffs)
+
+
+def _parse_many(values: list) -> list:
+    try:
+        return list(map(floordiv, map(sub, map(datetime.fromisoformat, values), repeat(_EPOCH)), repeat(_SECOND)))
+    except (TypeError, ValueError):
+        return [_parse_one(v) for v in values]
+
+
+def _parse_one(value: Any) -> int:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return NO_TIME
+    if parsed.tzinfo is not None:
+        return int(parsed.timestamp())
+    return (parsed - _EPOCH) // _SECOND
+
+
+def _remember(parsed: Dict[Any, int]) -> None:
+    global _CACHE
+    if len(_CACHE) + len(parsed) > _CACHE_LIMIT:
+        _CACHE = {None: NO_TIME, '': NO_TIME}
+    _CACHE.update(parsed)
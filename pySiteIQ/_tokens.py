@@ -0,0 +1,173 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from ._cache import default_cache_path
+
+try:
+    import keyring as _keyring
+    _HAS_KEYRING = True
+except ImportError:
+    _HAS_KEYRING = False
+
+_KEYRING_SERVICE = 'SiteIQ-token'
+_CHECK_ITERATIONS = 100_000
+
+
+class TokenCache:
+    """
+    Persists bearer tokens per account so short-lived processes can skip the
+    auth round trip while a previous token is still valid.
+
+    By default tokens live in ~/.cache/pySiteIQ/tokens.json, which is kept
+    owner-only (0600, in a 0700 directory, tightened if it already exists
+    with wider permissions) and rewritten atomically. With an explicit path
+    the file is still 0600, and a missing directory is created 0700, but an
+    existing directory is left as it is. With
+    use_keyring=True and the keyring package installed, tokens go to the
+    system keychain instead, the same store pyExamples uses for passwords.
+
+    Expiry comes from the token's JWT 'exp' claim. Tokens without a readable
+    expiry are assumed to live for default_lifetime seconds from issue.
+
+    A token saved with the password that obtained it is stored with a salted
+    PBKDF2 hash of that password, never the password itself. load() with a
+    password returns the token only when the hash matches, so a wrong or
+    rotated password is not hidden by a still-valid token. load() without a
+    password skips the check.
+
+    path             -- JSON file for the file backend
+    use_keyring      -- store tokens in the system keychain when available
+    default_lifetime -- assumed lifetime, in seconds, of tokens with no 'exp'
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike, None] = None,
+        *,
+        use_keyring: bool = False,
+        default_lifetime: float = 3600,
+    ) -> None:
+        self.path = Path(path) if path is not None else default_cache_path().with_name('tokens.json')
+        self._private_dir = path is None
+        self.use_keyring = use_keyring and _HAS_KEYRING
+        self.default_lifetime = default_lifetime
+        self._lock = threading.Lock()
+
+    def load(self, base_uri: str, email: str, password: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        Return (token, expires_epoch) for an account, or None. With a password,
+        also None unless the token was saved with that same password.
+        """
+        key = _account_key(base_uri, email)
+        if self.use_keyring:
+            raw = _keyring.get_password(_KEYRING_SERVICE, key)
+            entry = json.loads(raw) if raw else None
+        else:
+            with self._lock:
+                entry = self._read().get(key)
+        if not entry:
+            return None
+        if password is not None:
+            salt, check = entry.get('salt'), entry.get('check')
+            if not salt or not check or not hmac.compare_digest(_password_check(password, salt), check):
+                return None
+        return entry['token'], float(entry['expires'])
+
+    def save(
+        self, base_uri: str, email: str, token: str, expires: Optional[float] = None, password: Optional[str] = None,
+    ) -> float:
+        """
+        Store a token; returns the expiry used (from the JWT when not given).
+        A password is kept only as a salted hash, for load() to check.
+        """
+        if expires is None:
+            expires = self.expiry_of(token)
+        key = _account_key(base_uri, email)
+        entry = {'token': token, 'expires': expires}
+        if password is not None:
+            salt = os.urandom(16).hex()
+            entry.update(salt=salt, check=_password_check(password, salt))
+        if self.use_keyring:
+            _keyring.set_password(_KEYRING_SERVICE, key, json.dumps(entry))
+        else:
+            with self._lock:
+                entries = self._read()
+                entries[key] = entry
+                self._write(entries)
+        return expires
+
+    def discard(self, base_uri: str, email: str) -> None:
+        """Forget the stored token for an account."""
+        key = _account_key(base_uri, email)
+        if self.use_keyring:
+            try:
+                _keyring.delete_password(_KEYRING_SERVICE, key)
+            except Exception:
+                pass
+            return
+        with self._lock:
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                self._write(entries)
+
+    def expiry_of(self, token: str) -> float:
+        """Expiry epoch from a JWT 'exp' claim, or now + default_lifetime."""
+        exp = _jwt_exp(token)
+        return float(exp) if exp is not None else time.time() + self.default_lifetime
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self._private_dir:
+            # mkdir's mode only applies to a directory it creates.
+            os.chmod(self.path.parent, 0o700)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix='.tokens-')
+        try:
+            os.chmod(tmp, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def __repr__(self) -> str:
+        backend = 'keyring' if self.use_keyring else str(self.path)
+        return f'TokenCache({backend!r})'
+
+
+def _account_key(base_uri: str, email: str) -> str:
+    return f'{base_uri.rstrip("/")}|{email.lower()}'
+
+
+def _password_check(password: str, salt: str) -> str:
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), bytes.fromhex(salt), _CHECK_ITERATIONS).hex()
+
+
+def _jwt_exp(token: str) -> Optional[int]:
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + '=' * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return int(claims['exp'])
+    except (ValueError, KeyError, TypeError):
+        return None
@@ -0,0 +1,476 @@
+import hashlib
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    _HAS_REQUESTS = True
+    # Every transport raises the requests exception types when requests is
+    # installed, so callers catch the same errors whichever transport is used.
+    HTTPError = requests.HTTPError
+    TransportConnectionError = requests.ConnectionError
+    TransportTimeout = requests.Timeout
+except ImportError:
+    _HAS_REQUESTS = False
+
+    class HTTPError(IOError):
+        """HTTP error status (4xx/5xx) from raise_for_status()."""
+
+        def __init__(self, *args: Any, response: Any = None) -> None:
+            super().__init__(*args)
+            self.response = response
+
+    class TransportConnectionError(IOError):
+        """The connection failed before a response arrived."""
+
+    class TransportTimeout(IOError):
+        """The request timed out."""
+
+# Failures the client retries.
+TRANSIENT_ERRORS = (TransportConnectionError, TransportTimeout)
+# Unread bodies up to this size are drained on close to keep the connection.
+_DRAIN_LIMIT = 64 * 1024
+
+
+class Transport:
+    """
+    How SiteIQClient talks HTTP. Implementations return response objects with
+    the requests.Response surface the client uses: status_code, ok, headers,
+    content, json(), iter_content(chunk_size), raise_for_status() and close().
+
+    get/post raise TransportConnectionError or TransportTimeout (the requests
+    exception types when requests is installed) for transient failures.
+    """
+
+    def get(self, url: str, *, params: dict, headers: dict, timeout: float, stream: bool = False) -> Any:
+        raise NotImplementedError
+
+    def post(self, url: str, *, json: dict, timeout: float) -> Any:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """Cumulative {'requests': n, 'connections_opened': n}."""
+        return {'requests': 0, 'connections_opened': 0}
+
+    def close(self) -> None:
+        """Release connections. The transport stays usable and reconnects on demand."""
+
+
+class RequestsTransport(Transport):
+    """
+    requests.Session with a sized HTTPAdapter pool; the default transport.
+
+    pool_connections -- number of per-host connection pools to keep
+    pool_maxsize     -- max connections kept open per host
+    pool_block       -- block when the pool is exhausted instead of opening
+                        throwaway connections
+    keep_alive       -- reuse connections; False sends 'Connection: close'
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        if not _HAS_REQUESTS:
+            raise ImportError('RequestsTransport needs the requests package; use UrllibTransport instead')
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._session: Optional['requests.Session'] = None
+        self._closed_stats = {'requests': 0, 'connections_opened': 0}
+
+    def get(self, url: str, *, params: dict, headers: dict, timeout: float, stream: bool = False) -> Any:
+        return self._http().get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+
+    def post(self, url: str, *, json: dict, timeout: float) -> Any:
+        return self._http().post(url, json=json, timeout=timeout)
+
+    def stats(self) -> dict:
+        live = self._pool_stats()
+        return {k: self._closed_stats[k] + live[k] for k in live}
+
+    def close(self) -> None:
+        if self._session is not None:
+            live = self._pool_stats()
+            for k in live:
+                self._closed_stats[k] += live[k]
+            self._session.close()
+            self._session = None
+
+    def _http(self) -> 'requests.Session':
+        if self._session is None:
+            session = requests.Session()
+            adapter = _CountingAdapter(
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+                pool_block=self._pool_block,
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            if not self._keep_alive:
+                session.headers['Connection'] = 'close'
+            self._session = session
+        return self._session
+
+    def _pool_stats(self) -> dict:
+        stats = {'requests': 0, 'connections_opened': 0}
+        if self._session is None:
+            return stats
+        seen = set()
+        for adapter in self._session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    stats['requests'] += pool.num_requests
+            stats['connections_opened'] += getattr(adapter, 'connects', 0)
+        return stats
+
+
+if _HAS_REQUESTS:
+    class _CountingAdapter(HTTPAdapter):
+        # urllib3's pool.num_connections counts connection objects, and a
+        # pooled connection the server closed is reconnected in place without
+        # being counted. Count the socket connects themselves instead.
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.connects = 0
+            self._connects_lock = threading.Lock()
+            super().__init__(*args, **kwargs)
+
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            adapter = self
+
+            def counting(pool_cls: type) -> type:
+                class Connection(pool_cls.ConnectionCls):
+                    def connect(self) -> None:
+                        with adapter._connects_lock:
+                            adapter.connects += 1
+                        super().connect()
+                return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': Connection})
+
+            manager = self.poolmanager
+            manager.pool_classes_by_scheme = {
+                scheme: counting(cls) for scheme, cls in manager.pool_classes_by_scheme.items()
+            }
+
+
+class Response:
+    """Minimal requests.Response look-alike used by the non-requests transports."""
+
+    def __init__(self, status_code: int, headers: Any, body: Optional[bytes] = None,
+                 stream: Any = None, url: str = '', on_close: Any = None) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self._body = body
+        self._stream = stream
+        self._on_close = on_close
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        if self._body is None:
+            self._body = self._stream.read() if self._stream is not None else b''
+            self.close()
+        return self._body
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        if self._body is not None:
+            for start in range(0, len(self._body), chunk_size):
+                yield self._body[start:start + chunk_size]
+            return
+        while True:
+            chunk = self._stream.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        self.close()
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise HTTPError(f'{self.status_code} {kind} Error for url: {self.url}', response=self)
+
+    def close(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        # A body closed before it was fully read leaves bytes on the socket,
+        # so its connection cannot be reused.
+        complete = stream.isclosed()
+        if not complete and stream.length is not None and stream.length <= _DRAIN_LIMIT:
+            try:
+                stream.read()
+                complete = stream.isclosed()
+            except (OSError, http.client.HTTPException):
+                pass
+        stream.close()
+        if self._on_close is not None:
+            self._on_close(complete)
+
+
+class UrllibTransport(Transport):
+    """
+    Standard-library transport (urllib.parse + http.client), for installs
+    without requests. Each thread keeps one keep-alive connection per host,
+    so sequential paging still reuses a single connection.
+
+    keep_alive -- reuse connections; False opens one per request
+    """
+
+    def __init__(self, *, keep_alive: bool = True) -> None:
+        self._keep_alive = keep_alive
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {'requests': 0, 'connections_opened': 0}
+
+    def get(self, url: str, *, params: dict, headers: dict, timeout: float, stream: bool = False) -> Any:
+        if params:
+            url = f'{url}?{urlencode(params)}'
+        return self._send('GET', url, None, headers, timeout, stream)
+
+    def post(self, url: str, *, json: dict, timeout: float) -> Any:
+        body = _json_dumps(json)
+        return self._send('POST', url, body, {'Content-Type': 'application/json'}, timeout, False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        # Connections are per thread; bumping the generation makes every
+        # thread drop its connections before the next request.
+        with self._lock:
+            self._generation += 1
+        self._drop_local()
+
+    def _send(self, method: str, url: str, body: Optional[bytes], headers: dict,
+              timeout: float, stream: bool) -> Response:
+        parts = urlsplit(url)
+        path = parts.path + (f'?{parts.query}' if parts.query else '')
+        headers = dict(headers)
+        if not self._keep_alive:
+            headers['Connection'] = 'close'
+        for attempt in (0, 1):
+            conn, fresh = self._connection(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                raw = conn.getresponse()
+            except socket.timeout as exc:
+                self._discard(parts.scheme, parts.netloc)
+                raise TransportTimeout(str(exc)) from exc
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                # A pooled connection the server already closed; retry once on a new one.
+                self._discard(parts.scheme, parts.netloc)
+                if fresh or attempt:
+                    raise TransportConnectionError(str(exc)) from exc
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                self._discard(parts.scheme, parts.netloc)
+                raise TransportConnectionError(str(exc)) from exc
+            with self._lock:
+                self._stats['requests'] += 1
+            if raw.will_close or not self._keep_alive:
+                self._discard(parts.scheme, parts.netloc, close=False)
+            resp = Response(raw.status, raw.headers, stream=raw, url=url,
+                            on_close=self._releaser(conn, parts.scheme, parts.netloc))
+            if not stream:
+                try:
+                    resp.content
+                except socket.timeout as exc:
+                    raise TransportTimeout(str(exc)) from exc
+                except (OSError, http.client.HTTPException) as exc:
+                    raise TransportConnectionError(str(exc)) from exc
+            return resp
+        raise TransportConnectionError('connection closed by server')
+
+    def _connection(self, scheme: str, netloc: str, timeout: float) -> tuple:
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            self._drop_local()
+            local.generation = self._generation
+        conns: Dict[tuple, http.client.HTTPConnection] = local.__dict__.setdefault('conns', {})
+        key = (scheme, netloc)
+        conn = conns.get(key)
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, False
+        cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        conn = conns[key] = cls(netloc, timeout=timeout)
+        with self._lock:
+            self._stats['connections_opened'] += 1
+        return conn, True
+
+    def _releaser(self, conn: http.client.HTTPConnection, scheme: str, netloc: str) -> Any:
+        conns = self._local.__dict__['conns']
+
+        def release(complete: bool) -> None:
+            if not complete:
+                if conns.get((scheme, netloc)) is conn:
+                    del conns[(scheme, netloc)]
+                conn.close()
+        return release
+
+    def _discard(self, scheme: str, netloc: str, close: bool = True) -> None:
+        conn = self._local.__dict__.get('conns', {}).pop((scheme, netloc), None)
+        if conn is not None and close:
+            conn.close()
+
+    def _drop_local(self) -> None:
+        for conn in self._local.__dict__.get('conns', {}).values():
+            conn.close()
+        self._local.__dict__['conns'] = {}
+
+
+class ReplayTransport(Transport):
+    """
+    Records ticket-page responses to a directory, or serves them back.
+
+    In record mode every GET goes through `transport` (the real network) and
+    its status, headers and body are written to `path`. In replay mode the
+    same requests are answered from disk at full speed, without a network,
+    so decode, flatten and export throughput can be profiled in isolation
+    and captured slowdowns reproduced offline.
+
+    Requests are matched on their query parameters, not the host, so a
+    capture replays under any base_uri. Auth requests are never recorded;
+    in replay they return a placeholder token.
+
+        rec = ReplayTransport('capture/', record=True)
+        SiteIQClient(transport=rec).connect(...)       # real traffic, saved
+        SiteIQClient(transport=ReplayTransport('capture/'))  # offline
+
+    path      -- capture directory
+    record    -- True to capture, False to replay
+    transport -- network transport used while recording (default: the
+                 client's usual default)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, record: bool = False,
+                 transport: Optional[Transport] = None) -> None:
+        self.path = Path(path)
+        self.record = record
+        self._inner = transport if transport is not None else (default_transport() if record else None)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._manifest: Dict[str, dict] = {}
+        manifest = self.path / 'manifest.json'
+        if manifest.exists():
+            with open(manifest, encoding='utf-8') as f:
+                self._manifest = json.load(f)
+        elif not record:
+            raise FileNotFoundError(f'no capture found in {self.path}')
+
+    def get(self, url: str, *, params: dict, headers: dict, timeout: float, stream: bool = False) -> Any:
+        key = _request_key(params)
+        with self._lock:
+            self._requests += 1
+        if not self.record:
+            entry = self._manifest.get(key)
+            if entry is None:
+                raise LookupError(f'request not in capture {self.path}: {sorted(params.items())}')
+            body = (self.path / entry['file']).read_bytes()
+            return Response(entry['status'], _Headers(entry['headers']), body=body, url=url)
+
+        resp = self._inner.get(url, params=params, headers=headers, timeout=timeout, stream=False)
+        body = resp.content
+        kept = {k: v for k, v in resp.headers.items() if k.lower() in ('content-type', 'retry-after')}
+        name = f'{key}.json'
+        _atomic_write(self.path / name, body)
+        with self._lock:
+            self._manifest[key] = {
+                'file': name, 'status': resp.status_code, 'headers': kept,
+                'params': {str(k): str(v) for k, v in params.items()},
+            }
+            _atomic_write(self.path / 'manifest.json', _json_dumps(self._manifest, indent=1))
+        return Response(resp.status_code, _Headers(kept), body=body, url=url)
+
+    def post(self, url: str, *, json: dict, timeout: float) -> Any:
+        if self.record:
+            return self._inner.post(url, json=json, timeout=timeout)
+        return Response(200, _Headers({'Content-Type': 'application/json'}), body=b'{"token":"replay"}', url=url)
+
+    def stats(self) -> dict:
+        if self.record:
+            return self._inner.stats()
+        return {'requests': self._requests, 'connections_opened': 0}
+
+    def close(self) -> None:
+        if self._inner is not None:
+            self._inner.close()
+
+    def __len__(self) -> int:
+        return len(self._manifest)
+
+    def __repr__(self) -> str:
+        mode = 'record' if self.record else 'replay'
+        return f'ReplayTransport({str(self.path)!r}, {mode}, {len(self._manifest)} responses)'
+
+
+def default_transport(**options: Any) -> Transport:
+    """RequestsTransport when requests is installed, otherwise UrllibTransport."""
+    if _HAS_REQUESTS:
+        return RequestsTransport(**options)
+    return UrllibTransport(keep_alive=options.get('keep_alive', True))
+
+
+class _Headers(dict):
+    """Case-insensitive get() over a plain dict of headers."""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        lower = key.lower()
+        for k, v in self.items():
+            if k.lower() == lower:
+                return v
+        return default
+
+
+def _request_key(params: dict) -> str:
+    normalized = _json_dumps(sorted((str(k), str(v)) for k, v in params.items()))
+    return hashlib.sha256(normalized).hexdigest()[:24]
+
+
+def _json_dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    return json.dumps(obj, separators=None if indent else (',', ':'), indent=indent).encode()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.replay-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
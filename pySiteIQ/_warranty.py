@@ -0,0 +1,227 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ._timestamps import NO_TIME, to_epoch, to_epochs
+
+DAY = 86400
+
+# Above this many changes to one partition in a batch, the partition is
+# rebuilt with one sort instead of a bisect insert/delete per ticket.
+_REBUILD_AT = 64
+
+Bound = Union[str, date, datetime, int, None]
+
+
+class WarrantyIndex:
+    """
+    Tickets sorted by warranty expiry, partitioned by warrantyStatus and by
+    warrantyStatus + siteName, for range queries without rescanning.
+
+        index = WarrantyIndex(client.iter_tickets(status='InProgress'))
+        for days in (30, 60, 90):
+            print(days, index.count_expiring(days))
+        soon = index.expiring(30)                        # sorted by warrantyDate
+        lapsed = index.expired(site='Trial #12')
+
+    Each partition is a sorted list of (expiry epoch, ticketID), so a range
+    query is two bisects plus the matches, and a count is just the two
+    bisects. update() moves only tickets whose status, site or warrantyDate
+    changed, which keeps the index current from delta syncs:
+
+        summary = client.sync(store)
+        index.update(store.iter_tickets(synced_since=summary['synced_at']))
+
+    Tickets with no warrantyDate are tracked but never match a date query.
+    Dates are 'YYYY-MM-DD' strings, date/datetime objects or epoch seconds,
+    read as UTC like the API's timestamps; ranges include start and exclude end.
+
+    tickets -- tickets (dicts or Ticket records) to index initially
+    """
+
+    def __init__(self, tickets: Iterable[Any] = ()) -> None:
+        self._tickets: Dict[Any, Any] = {}
+        self._entries: Dict[Any, Tuple[Any, Any, int]] = {}
+        self._by_status: Dict[Any, List[Tuple[int, Any]]] = {}
+        self._by_site: Dict[Tuple[Any, Any], List[Tuple[int, Any]]] = {}
+        self.update(tickets)
+
+    def update(self, tickets: Iterable[Any]) -> dict:
+        """
+        Add new tickets and re-file changed ones, by ticketID. A ticketID
+        repeated in one batch counts once, and its last copy wins. Returns
+        {'added': n, 'moved': n, 'unchanged': n}.
+        """
+        tickets = list({t.get('ticketID'): t for t in tickets}.values())
+        expiries = to_epochs([t.get('warrantyDate') for t in tickets])
+        removals: Dict[tuple, list] = {}
+        inserts: Dict[tuple, list] = {}
+        counts = {'added': 0, 'moved': 0, 'unchanged': 0}
+        for ticket, expiry in zip(tickets, expiries):
+            ticket_id = ticket.get('ticketID')
+            entry = (ticket.get('warrantyStatus'), ticket.get('siteName'), expiry)
+            old = self._entries.get(ticket_id)
+            self._tickets[ticket_id] = ticket
+            if old == entry:
+                counts['unchanged'] += 1
+                continue
+            counts['moved' if old is not None else 'added'] += 1
+            if old is not None:
+                self._file(removals, old, ticket_id)
+            self._file(inserts, entry, ticket_id)
+            self._entries[ticket_id] = entry
+        self._apply(removals, inserts)
+        return counts
+
+    def remove(self, ticket_ids: Iterable[Any]) -> int:
+        """Drop tickets by ticketID; returns how many were indexed."""
+        removals: Dict[tuple, list] = {}
+        removed = 0
+        for ticket_id in ticket_ids:
+            entry = self._entries.pop(ticket_id, None)
+            if entry is None:
+                continue
+            del self._tickets[ticket_id]
+            self._file(removals, entry, ticket_id)
+            removed += 1
+        self._apply(removals, {})
+        return removed
+
+    def between(self, start: Bound = None, end: Bound = None, *, status: Any = None, site: Any = None) -> List[Any]:
+        """
+        Tickets whose warranty expires in [start, end), in expiry order.
+        Either bound may be None for an open range.
+
+        status -- warrantyStatus: a value, a collection, or None for all
+        site   -- siteName: a value, a collection, or None for all
+        """
+        lo, hi = _epoch(start), _epoch(end)
+        slices = [keys[i:j] for keys, i, j in self._slices(status, site, lo, hi) if i < j]
+        merged = slices[0] if len(slices) == 1 else heapq.merge(*slices)
+        tickets = self._tickets
+        return [tickets[ticket_id] for _, ticket_id in merged]
+
+    def count(self, start: Bound = None, end: Bound = None, *, status: Any = None, site: Any = None) -> int:
+        """Number of tickets between() would return, from bisects alone."""
+        lo, hi = _epoch(start), _epoch(end)
+        return sum(max(0, j - i) for _, i, j in self._slices(status, site, lo, hi))
+
+    def expiring(self, days: int, *, today: Bound = None, status: Any = 'In', site: Any = None) -> List[Any]:
+        """Warranties expiring from today through `days` days ahead, soonest first."""
+        start = _today(today)
+        return self.between(start, start + (days + 1) * DAY, status=status, site=site)
+
+    def count_expiring(self, days: int, *, today: Bound = None, status: Any = 'In', site: Any = None) -> int:
+        """Number of tickets expiring() would return."""
+        start = _today(today)
+        return self.count(start, start + (days + 1) * DAY, status=status, site=site)
+
+    def expired(self, *, today: Bound = None, status: Any = None, site: Any = None) -> List[Any]:
+        """Warranties that ended before today, oldest first."""
+        return self.between(None, _today(today), status=status, site=site)
+
+    def statuses(self) -> List[Any]:
+        """warrantyStatus values with at least one dated ticket."""
+        return list(self._by_status)
+
+    def sites(self, status: Any = None) -> List[Any]:
+        """siteName values with at least one dated ticket (for a status, or any)."""
+        wanted = _wanted(status)
+        return list(dict.fromkeys(s for st, s in self._by_site if wanted is None or st in wanted))
+
+    def get(self, ticket_id: Any) -> Any:
+        return self._tickets.get(ticket_id)
+
+    def _slices(self, status: Any, site: Any, lo: Optional[int], hi: Optional[int]) -> Iterator[tuple]:
+        wanted_status, wanted_site = _wanted(status), _wanted(site)
+        if wanted_site is None:
+            partitions = [
+                keys for st, keys in self._by_status.items() if wanted_status is None or st in wanted_status
+            ]
+        elif wanted_status is None:
+            partitions = [keys for (_, s), keys in self._by_site.items() if s in wanted_site]
+        else:
+            partitions = [
+                self._by_site[key]
+                for key in ((st, s) for st in wanted_status for s in wanted_site)
+                if key in self._by_site
+            ]
+        for keys in partitions:
+            # (epoch,) sorts before every (epoch, ticketID), so both bounds
+            # land at the first entry for that second.
+            i = 0 if lo is None else bisect_left(keys, (lo,))
+            j = len(keys) if hi is None else bisect_left(keys, (hi,))
+            yield keys, i, j
+
+    @staticmethod
+    def _file(into: Dict[tuple, list], entry: tuple, ticket_id: Any) -> None:
+        status, site, expiry = entry
+        if expiry == NO_TIME:
+            return
+        key = (expiry, ticket_id)
+        into.setdefault(('status', status), []).append(key)
+        into.setdefault(('site', (status, site)), []).append(key)
+
+    def _apply(self, removals: Dict[tuple, list], inserts: Dict[tuple, list]) -> None:
+        for part in removals.keys() | inserts.keys():
+            kind, name = part
+            table = self._by_status if kind == 'status' else self._by_site
+            keys = table.get(name, [])
+            gone = removals.get(part, ())
+            new = inserts.get(part, ())
+            if len(gone) + len(new) > _REBUILD_AT:
+                if gone:
+                    drop = set(gone)
+                    keys = [k for k in keys if k not in drop]
+                keys.extend(new)
+                keys.sort()
+            else:
+                for key in gone:
+                    i = bisect_left(keys, key)
+                    if i < len(keys) and keys[i] == key:
+                        del keys[i]
+                for key in new:
+                    insort(keys, key)
+            if keys:
+                table[name] = keys
+            else:
+                table.pop(name, None)
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: Any) -> bool:
+        return ticket_id in self._tickets
+
+    def __repr__(self) -> str:
+        return f'WarrantyIndex({len(self._tickets)} tickets, {len(self._by_status)} statuses, {len(self._by_site)} sites)'
+
+
+def _wanted(value: Any) -> Optional[Any]:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return frozenset(value)
+    return (value,)
+
+
+def _epoch(value: Bound) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, datetime):
+        text = value.isoformat(' ')
+    elif isinstance(value, date):
+        text = value.isoformat()
+    else:
+        text = value
+    epoch = to_epoch(text)
+    if epoch is None:
+        raise ValueError(f'not a date: {value!r}')
+    return epoch
+
+
+def _today(today: Bound) -> int:
+    if today is None:
+        return to_epoch(datetime.now().strftime('%Y-%m-%d'))
+    return _epoch(today)
@@ -0,0 +1,98 @@
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from ._records import TICKET_FIELDS
+
+# Fields a Where can test: every scalar ticket field, plus alertCount (the
+# number of alerts on the ticket).
+WHERE_FIELDS = tuple(f for f in TICKET_FIELDS if f != 'alerts') + ('alertCount',)
+
+# Cheapest tests first, so most rejected tickets fail on a comparison and
+# never reach a callable.
+_ORDER = {'is': 0, '==': 1, 'in': 2, 'call': 3}
+
+
+class Where:
+    """
+    Ticket filter compiled once into a predicate, for iter_tickets(where=...).
+
+    Each condition tests one field: a value (equality), a list/tuple/set of
+    values (membership) or a callable, as TicketFrame filters do. The
+    conditions are and-ed and generated into one small Python function per
+    input shape: one reading dict keys, one reading attributes, so the
+    msgspec PageDecoder can test its parsed structs and only build Ticket
+    records for tickets that match.
+
+        Where(component='Printer', warrantyStatus='Out', alertCount=lambda n: n >= 3)
+        Where({'siteID': {'1001', '1002'}})
+        Where(lambda t: t['siteName'].startswith('Trial'))
+
+    A plain callable is used as is on ticket dicts or records; it cannot be
+    pushed below record building.
+
+    conditions -- mapping of field -> condition, or a callable(ticket) -> bool
+    fields     -- more field conditions as keyword arguments
+    """
+
+    __slots__ = ('conditions', 'match', 'match_attrs', 'source')
+
+    def __init__(self, conditions: Union[Mapping[str, Any], Callable[[Any], bool], None] = None, **fields: Any) -> None:
+        if callable(conditions):
+            if fields:
+                raise ValueError('pass either a callable or field conditions, not both')
+            self.conditions: Dict[str, Any] = {}
+            self.match: Callable[[Any], bool] = conditions
+            self.match_attrs: Optional[Callable[[Any], bool]] = None
+            self.source = None
+            return
+        merged = dict(conditions or {})
+        merged.update(fields)
+        unknown = [f for f in merged if f not in WHERE_FIELDS]
+        if unknown:
+            raise ValueError(f'cannot filter on {unknown}; choose from {WHERE_FIELDS}')
+        self.conditions = merged
+        self.source, self.match = _compile(merged, 'dict')
+        self.match_attrs = _compile(merged, 'attrs')[1]
+
+    def __call__(self, ticket: Any) -> bool:
+        return self.match(ticket)
+
+    def __repr__(self) -> str:
+        if self.source is None:
+            return f'Where({self.match!r})'
+        return f'Where({self.conditions!r})'
+
+
+def compile_where(where: Any) -> Optional[Where]:
+    """None, a Where, a mapping of field conditions, or a callable -> Optional[Where]."""
+    if where is None or isinstance(where, Where):
+        return where
+    return Where(where)
+
+
+def _compile(conditions: Dict[str, Any], shape: str) -> tuple:
+    namespace: Dict[str, Any] = {}
+    terms = []
+    for i, (field, condition) in enumerate(conditions.items()):
+        if field == 'alertCount':
+            read = "len(t.get('alerts') or ())" if shape == 'dict' else 'len(t.alerts or ())'
+        else:
+            read = f't.get({field!r})' if shape == 'dict' else f't.{field}'
+        name = f'_c{i}'
+        if condition is None:
+            terms.append(('is', f'{read} is None'))
+        elif callable(condition):
+            namespace[name] = condition
+            terms.append(('call', f'{name}({read})'))
+        elif isinstance(condition, (list, tuple, set, frozenset)):
+            namespace[name] = frozenset(condition)
+            terms.append(('in', f'{read} in {name}'))
+        else:
+            namespace[name] = condition
+            terms.append(('==', f'{read} == {name}'))
+    terms.sort(key=lambda term: _ORDER[term[0]])
+    # Constants are bound as default arguments: local lookups, no globals.
+    params = ''.join(f', {name}={name}' for name in namespace)
+    body = ' and '.join(expr for _, expr in terms) or 'True'
+    source = f'def match(t{params}):\n    return {body}\n'
+    exec(compile(source, f'<where:{shape}>', 'exec'), namespace)
+    return source, namespace['match']
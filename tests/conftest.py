@@ -0,0 +1,40 @@
+# Shared fixtures. Tests run from the repo root with `python -m pytest`;
+# like pyExamples and pyBench, they import pySiteIQ from the checkout and
+# the synthetic data and mock server from pyBench/.
+import pathlib, sys
+ROOT = pathlib.Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'pyBench'))
+
+import pytest
+
+from pySiteIQ import SiteIQClient
+from _synthetic import make_tickets
+from mock_server import MockSiteIQServer
+
+
+@pytest.fixture
+def tickets():
+    return make_tickets(200)
+
+
+@pytest.fixture(scope='module')
+def server():
+    with MockSiteIQServer(tickets=3000) as server:
+        yield server
+
+
+@pytest.fixture
+def connect(server):
+    """connect(**options) -> a connected SiteIQClient on the mock server, closed after the test."""
+    clients = []
+
+    def connect(**options):
+        client = SiteIQClient(server.base_uri, **options)
+        client.connect('tester@example.com', 'secret')
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        client.disconnect()
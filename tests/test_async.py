@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from pySiteIQ import AsyncSiteIQClient
+from pySiteIQ._async import _AsyncLimiter
+
+
+def _run(server, query, **options):
+    async def main():
+        async with AsyncSiteIQClient(server.base_uri, **options) as client:
+            await client.connect('tester@example.com', 'secret')
+            return [t['ticketID'] async for t in client.iter_tickets(**query)]
+    return asyncio.run(main())
+
+
+def _requests(server, fetch):
+    before = server.stats['requests']
+    result = fetch()
+    return result, server.stats['requests'] - before
+
+
+def test_matches_the_sync_client(server, connect):
+    query = {'status': 'All', 'delta': 0}
+    assert _run(server, query) == [t['ticketID'] for t in connect().iter_tickets(**query)]
+
+
+def test_short_first_page_is_one_request(server):
+    tickets, requests = _requests(server, lambda: _run(server, {'status': 'All'}, concurrency=8))
+    assert 0 < len(tickets) < 1000
+    assert requests == 1
+
+
+def test_sharded_range_costs_what_the_sync_client_does(server, connect):
+    query = {'status': 'All', 'start_date': '2025-03-01', 'end_date': '2025-05-31'}
+    client = connect()
+    plain, sync_requests = _requests(server, lambda: [t['ticketID'] for t in client.iter_tickets(**query)])
+    ahead, async_requests = _requests(server, lambda: _run(server, query, concurrency=8))
+    assert sorted(ahead) == sorted(plain)
+    assert async_requests == sync_requests
+
+
+def test_full_pages_are_fetched_ahead(server):
+    tickets, requests = _requests(server, lambda: _run(server, {'status': 'All', 'delta': 0}, concurrency=2))
+    assert len(tickets) == 3000
+    # Four pages (the last empty), plus at most `concurrency` - 1 fetched past the end.
+    assert 4 <= requests <= 5
+
+
+def test_limit_increase_wakes_waiters():
+    async def main():
+        limiter = _AsyncLimiter(4, initial=1)
+        await limiter.__aenter__()
+        entered = asyncio.Event()
+
+        async def second():
+            async with limiter:
+                entered.set()
+
+        task = asyncio.ensure_future(second())
+        await asyncio.sleep(0.01)
+        assert not entered.is_set()
+        limiter.on_success()
+        await asyncio.wait_for(entered.wait(), 1)
+        await task
+        await limiter.__aexit__(None, None, None)
+
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from pySiteIQ import ResponseCache
+
+
+@pytest.fixture
+def cache():
+    with ResponseCache(':memory:') as cache:
+        yield cache
+
+
+def test_keys_ignore_param_order_but_not_account():
+    a = ResponseCache.key('a@example.com', 'https://x', {'status': 'All', 'pageOffset': '0'})
+    assert a == ResponseCache.key('a@example.com', 'https://x', {'pageOffset': '0', 'status': 'All'})
+    assert a != ResponseCache.key('b@example.com', 'https://x', {'status': 'All', 'pageOffset': '0'})
+    assert a != ResponseCache.key('a@example.com', 'https://y', {'status': 'All', 'pageOffset': '0'})
+
+
+def test_ttl_rules(cache):
+    assert cache.ttl_for({'status': 'InProgress'}) == 60
+    assert cache.ttl_for({'status': 'Closed', 'endDate': '2020-01-31'}) == cache.past_closed_ttl
+    assert cache.ttl_for({'status': 'Closed', 'endDate': '2999-01-31'}) == 600
+    assert cache.ttl_for({'status': 'Closed', 'delta': '0'}) == cache.ttl
+    assert ResponseCache(':memory:', status_ttls={'InProgress': 5}).ttl_for({'status': 'InProgress'}) == 5
+
+
+def test_hit_miss_and_expiry(cache):
+    assert cache.get('k') is None
+    cache.put('k', b'[]', 60)
+    assert cache.get('k') == b'[]'
+    cache.put('short', b'[1]', 0.01)
+    time.sleep(0.02)
+    assert cache.get('short') is None
+    cache.put('never', b'[2]', 0)
+    assert cache.get('never') is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['expired'], stats['stores']) == (1, 3, 1, 2)
+    assert stats['entries'] == 1 and stats['bytes'] == 2
+
+
+def test_least_recently_used_are_evicted(cache):
+    cache.max_bytes = 30
+    for name in 'abc':
+        cache.put(name, b'x' * 10, 60)
+    cache.get('a')
+    cache.put('d', b'x' * 10, 60)
+    assert cache.get('b') is None
+    assert all(cache.get(name) is not None for name in 'acd')
+    assert cache.stats()['evictions'] == 1
+
+
+def test_client_serves_repeats_from_cache(connect, server):
+    client = connect(cache=ResponseCache(':memory:'))
+    first = client.get_tickets(status='All', delta=0, all_pages=True)
+    before = server.stats['requests']
+    assert client.get_tickets(status='All', delta=0, all_pages=True) == first
+    assert server.stats['requests'] == before
+    assert client.cache.stats()['hits'] == 4
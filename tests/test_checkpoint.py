@@ -0,0 +1,97 @@
+import json
+import time
+
+import pytest
+
+from pySiteIQ import DeltaCheckpoint, Ticket
+from pySiteIQ._checkpoint import fingerprint, last_activity
+
+# Far enough back that the overlap reaches before every mock ticket.
+EVERYTHING = 10 ** 10
+
+
+def test_fingerprint_is_stable_across_shapes(tickets):
+    assert fingerprint(tickets[0]) == fingerprint(Ticket.from_dict(tickets[0]))
+    assert fingerprint(tickets[0]) == fingerprint(json.loads(json.dumps(tickets[0])))
+    assert fingerprint(tickets[0]) != fingerprint(dict(tickets[0], ticketStatus='Closed'))
+
+
+def test_commit_reset_and_reload(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    checkpoint = DeltaCheckpoint(path, overlap=60)
+    assert checkpoint.since() is None
+    checkpoint.commit('All', 1000, {1: 'a'})
+    checkpoint.commit('Closed', 30, {})
+    reloaded = DeltaCheckpoint(path, overlap=60)
+    assert reloaded.since() == 940
+    assert reloaded.since('Closed') == 0
+    assert reloaded.seen() == {1: 'a'}
+    reloaded.reset('All')
+    assert reloaded.high_water() is None and reloaded.high_water('Closed') == 30
+    reloaded.reset()
+    assert reloaded.high_water('Closed') is None
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith('.checkpoint-')]
+    with pytest.raises(ValueError):
+        DeltaCheckpoint(path, overlap=-1)
+
+
+def test_runs_skip_unchanged_tickets(connect, tmp_path):
+    client = connect()
+    checkpoint = DeltaCheckpoint(tmp_path / 'checkpoint.json', overlap=EVERYTHING)
+    started = int(time.time())
+    first = client.get_changes(checkpoint, initial=0)
+    assert len(first) == 3000
+    assert checkpoint.high_water() >= started
+    assert client.get_changes(checkpoint) == []
+    assert checkpoint.last_run['skipped'] == 3000
+
+    seen = checkpoint.seen()
+    changed = first[0]['ticketID']
+    seen[changed] = 'stale'
+    checkpoint.commit('All', checkpoint.high_water(), seen)
+    assert [t['ticketID'] for t in client.get_changes(checkpoint)] == [changed]
+
+
+def test_stopping_early_keeps_the_checkpoint(connect, tmp_path):
+    client = connect()
+    checkpoint = DeltaCheckpoint(tmp_path / 'checkpoint.json')
+    changes = client.iter_changes(checkpoint, initial=0)
+    next(changes)
+    changes.close()
+    assert checkpoint.high_water() is None
+    assert checkpoint.last_run is None
+
+
+def test_missing_ticket_ids_are_not_kept(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    checkpoint = DeltaCheckpoint(path)
+    checkpoint.commit('All', 1000, {None: 'x', 5: 'y'})
+    assert checkpoint.seen() == {5: 'y'}
+    # A file an older version wrote with a 'None' key still loads.
+    path.write_text(json.dumps({'version': 1, 'scopes': {'All': {'highWater': 1000, 'seen': {'None': 'x', '-3': 'z'}}}}))
+    assert checkpoint.seen() == {-3: 'z'}
+
+
+def test_last_activity(tickets):
+    ticket = {'ticketOpenTimestamp': '2025-07-01 08:00:00', 'alerts': [
+        {'alertOpenTimestamp': '2025-07-01 09:00:00', 'alertCloseTimestamp': '2025-07-02 10:00:00'},
+        {'alertOpenTimestamp': '2025-07-01 11:00:00', 'alertCloseTimestamp': None},
+    ]}
+    assert last_activity(ticket) == last_activity(Ticket.from_dict(ticket)) == 1751450400
+    assert last_activity({'ticketOpenTimestamp': None, 'alerts': []}) is None
+
+
+def test_only_the_overlap_window_is_remembered(connect, tmp_path):
+    # Regression: a first full sync wrote every ticket's hash into the file.
+    client = connect()
+    everything = {t['ticketID']: last_activity(t) for t in client.iter_tickets(status='All', delta=0)}
+    cutoff = sorted(everything.values())[len(everything) // 2]
+    checkpoint = DeltaCheckpoint(tmp_path / 'checkpoint.json', overlap=int(time.time()) - cutoff)
+    assert len(client.get_changes(checkpoint, initial=0)) == 3000
+    kept = set(checkpoint.seen())
+    assert {i for i, active in everything.items() if active >= cutoff + 5} <= kept
+    assert kept <= {i for i, active in everything.items() if active >= cutoff - 5}
+
+    small = DeltaCheckpoint(tmp_path / 'small.json', overlap=600)
+    assert len(client.get_changes(small, initial=0)) == 3000
+    assert small.seen() == {} and small.last_run['fetched'] == 3000
@@ -0,0 +1,38 @@
+import pytest
+
+from pySiteIQ import SiteIQClient
+
+
+def test_auto_paging_reuses_one_connection(connect):
+    client = connect()
+    tickets = list(client.iter_tickets(status='All', delta=0))
+    assert len(tickets) == 3000
+    stats = client.connection_stats()
+    assert stats['requests'] == 5            # token + four pages
+    assert stats['connections_opened'] == 1
+    assert stats['connections_reused'] == 4
+
+
+def test_keep_alive_false_opens_a_connection_per_request(connect):
+    client = connect(keep_alive=False)
+    client.get_tickets(status='All', delta=0, all_pages=True)
+    stats = client.connection_stats()
+    assert stats['connections_opened'] == stats['requests']
+
+
+def test_disconnect_keeps_counters_and_reconnects_on_demand(connect):
+    client = connect()
+    client.get_tickets()
+    before = client.connection_stats()
+    client.disconnect()
+    assert not client.is_connected()
+    assert client.connection_stats() == before
+    client.connect('tester@example.com', 'secret')
+    client.get_tickets()
+    assert client.connection_stats()['requests'] == before['requests'] + 2
+
+
+@pytest.mark.parametrize('options', [{'pool_connections': 0}, {'pool_maxsize': 0}, {'max_workers': 0}])
+def test_invalid_pool_options(options):
+    with pytest.raises(ValueError):
+        SiteIQClient(**options)
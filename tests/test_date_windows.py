@@ -0,0 +1,85 @@
+from datetime import date, datetime
+
+import pytest
+
+from pySiteIQ._client import _plan_queries, _plan_windows
+
+QUARTER = [
+    ('2025-03-01', '2025-03-07'),
+    ('2025-03-08', '2025-03-14'),
+    ('2025-03-15', '2025-03-21'),
+    ('2025-03-22', '2025-03-28'),
+    ('2025-03-29', '2025-03-31'),
+]
+
+
+@pytest.mark.parametrize('start, end', [
+    ('2025-03-01', '2025-03-31'),
+    (date(2025, 3, 1), date(2025, 3, 31)),
+    (datetime(2025, 3, 1, 8, 30), datetime(2025, 3, 31, 23, 59)),
+    (date(2025, 3, 1), '2025-03-31'),
+])
+def test_bounds_of_any_type_split_the_same(start, end):
+    assert _plan_windows(start, end, 7) == QUARTER
+
+
+def test_start_alone_runs_to_today():
+    assert _plan_windows('2025-03-01', None, 7, today=date(2025, 3, 31)) == QUARTER
+    assert _plan_windows(date(2025, 3, 25), None, 7, today=date(2025, 3, 31)) == [('2025-03-25', '2025-03-31')]
+
+
+def test_short_or_unsplittable_ranges_are_left_alone():
+    params = {'status': 'All', 'startDate': date.today().isoformat()}
+    assert _plan_queries(params, 7) == [params]
+    assert _plan_windows(None, '2025-03-31', 7) == []
+    assert _plan_windows('March', '2025-03-31', 7) == [('March', '2025-03-31')]
+
+
+def test_client_accepts_date_objects(connect, server):
+    client = connect()
+    by_text = client.get_tickets(status='All', start_date='2025-03-01', end_date='2025-03-31', all_pages=True)
+    by_date = client.get_tickets(status='All', start_date=date(2025, 3, 1), end_date=date(2025, 3, 31), all_pages=True)
+    by_datetime = client.get_tickets(
+        status='All', start_date=datetime(2025, 3, 1), end_date=datetime(2025, 3, 31), all_pages=True
+    )
+    assert by_text and by_date == by_text == by_datetime
+
+
+def test_long_start_only_range_is_sharded(connect, server):
+    client = connect()
+    before = server.stats['requests']
+    start = date.fromordinal(server.now.date().toordinal() - 30)
+    tickets = client.get_tickets(status='All', start_date=start, all_pages=True)
+    assert tickets
+    # Never one 30-day request: at least one shard per week.
+    assert server.stats['requests'] - before >= 5
+
+
+def test_single_page_of_a_long_range(connect, server):
+    # Without all_pages a quarter used to go out as one request and fail with HTTP 400.
+    client = connect()
+    query = {'status': 'All', 'start_date': '2025-03-01', 'end_date': '2025-05-31'}
+    everything = client.get_tickets(all_pages=True, **query)
+    assert len(everything) > 500
+    assert client.get_tickets(**query) == everything
+    assert client.get_tickets(page_limit=50, page_offset=400, **query) == everything[400:450]
+    where = {'warrantyStatus': 'Out'}
+    assert client.get_tickets(page_limit=200, where=where, limit=5, **query) == [
+        t for t in everything[:200] if t['warrantyStatus'] == 'Out'
+    ][:5]
+
+
+def test_single_page_of_a_long_range_async(connect, server):
+    pytest.importorskip('aiohttp')
+    import asyncio
+
+    from pySiteIQ import AsyncSiteIQClient
+
+    query = {'status': 'All', 'start_date': '2025-03-01', 'end_date': '2025-05-31'}
+    everything = connect().get_tickets(all_pages=True, **query)
+
+    async def main():
+        async with AsyncSiteIQClient(server.base_uri) as client:
+            await client.connect('tester@example.com', 'secret')
+            return await client.get_tickets(page_limit=50, page_offset=400, **query)
+    assert asyncio.run(main()) == everything[400:450]
@@ -0,0 +1,97 @@
+import json
+import pickle
+
+import pytest
+
+from pySiteIQ import Alert, PageDecoder, Ticket, Where
+
+msgspec = pytest.importorskip('msgspec')
+
+
+def page(tickets):
+    return json.dumps(tickets).encode()
+
+
+def test_backends_produce_equal_records(tickets):
+    body = page(tickets)
+    records = PageDecoder('msgspec').decode(body)
+    assert records == PageDecoder('json').decode(body)
+    assert all(type(t) is Ticket for t in records)
+    assert [t.to_dict() for t in records] == tickets
+
+
+@pytest.mark.parametrize('backend', ['msgspec', 'json'])
+def test_both_backends_return_the_slotted_records(tickets, backend):
+    # The structs stay inside the decoder: whatever is installed, callers
+    # get the same Ticket/Alert types.
+    record = next(t for t in PageDecoder(backend).decode(page(tickets)) if t.alerts)
+    assert not isinstance(record, msgspec.Struct)
+    assert type(record) is Ticket and type(record.alerts) is tuple and type(record.alerts[0]) is Alert
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(TypeError):
+        vars(record)
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record == Ticket.from_dict(record.to_dict()) and record != Ticket()
+
+
+def test_intern_option(tickets):
+    tickets = [dict(t, siteName='Trial #1') for t in tickets[:2]]
+    a, b = PageDecoder('msgspec').decode(page(tickets))
+    assert a.siteName is b.siteName
+    a, b = PageDecoder('msgspec', intern=False).decode(page(tickets))
+    assert a.siteName == b.siteName and a.siteName is not b.siteName
+
+
+def test_where_pushdown(tickets):
+    where = Where(warrantyStatus='Out', alertCount=lambda n: n >= 1)
+    body = page(tickets)
+    count, matched = PageDecoder('msgspec').decode_page(body, where)
+    assert count == len(tickets)
+    assert matched == [t for t in PageDecoder('json').decode(body) if where.match(t)]
+
+
+def test_schema_mismatch_falls_back_to_json(tickets):
+    decoder = PageDecoder('msgspec')
+    data = [dict(tickets[0], ticketID='not-a-number')] + tickets[1:5]
+    records = decoder.decode(page(data))
+    assert decoder.fallbacks == 1
+    assert records[0].ticketID == 'not-a-number'
+
+
+def test_missing_and_extra_fields(tickets):
+    data = dict(tickets[0], region='north')
+    del data['integrationID3']
+    record, = PageDecoder('msgspec').decode(page([data]))
+    assert record.integrationID3 is None
+    assert 'region' not in record          # the msgspec backend keeps schema fields only
+    record, = PageDecoder('json').decode(page([data]))
+    assert record['region'] == 'north'
+
+
+def test_decoded_records_behave_like_from_dict(tickets):
+    record, = PageDecoder('msgspec').decode(page(tickets[:1]))
+    record['region'] = 'north'
+    record['alerts'] = [{'error': 'Printer Paper Low'}]
+    assert record['region'] == 'north' and record.alerts[0].error == 'Printer Paper Low'
+    copy = pickle.loads(pickle.dumps(record))
+    assert copy == record and copy['region'] == 'north'
+    assert repr(record).startswith("Ticket({'ticketID'")
+
+
+def test_constructor_keeps_undocumented_fields():
+    ticket = Ticket(siteName='Trial #1', region='north')
+    assert ticket.siteName == 'Trial #1' and ticket['region'] == 'north'
+
+
+def test_callable_where_sees_records(tickets):
+    seen = []
+    where = Where(lambda t: seen.append(type(t)) or t['warrantyStatus'] == 'Out')
+    count, matched = PageDecoder('msgspec').decode_page(page(tickets), where)
+    assert count == len(tickets) and set(seen) == {Ticket}
+    assert [t.to_dict() for t in matched] == [t for t in tickets if t['warrantyStatus'] == 'Out']
+
+
+def test_client_decoder_matches_records(connect):
+    plain = connect(records=True).get_tickets(status='All', delta=0, all_pages=True)
+    decoded = connect(decoder=PageDecoder()).get_tickets(status='All', delta=0, all_pages=True)
+    assert decoded == plain
@@ -0,0 +1,173 @@
+import random
+
+import pytest
+
+from pySiteIQ import AlertDurations, DurationStats, QuantileSketch, to_epoch
+from pySiteIQ import _durations
+from pySiteIQ._metrics import Histogram
+
+NOW = to_epoch('2026-01-01 00:00:00')
+
+
+def alert_rows(tickets):
+    for t in tickets:
+        fields = {k: v for k, v in t.items() if k != 'alerts'}
+        for a in t['alerts']:
+            yield dict(fields, **a)
+
+
+def exact_groups(tickets, by):
+    groups = {}
+    for row in alert_rows(tickets):
+        closed, ages = groups.setdefault(tuple(row[f] for f in by), ([], []))
+        start = to_epoch(row['alertOpenTimestamp'])
+        if row['alertCloseTimestamp'] is None:
+            ages.append(max(0, NOW - start))
+        else:
+            closed.append(to_epoch(row['alertCloseTimestamp']) - start)
+    return groups
+
+
+def test_sketch_is_exact_until_the_limit():
+    values = random.Random(1).sample(range(1, 10**6), 1000)
+    sketch = QuantileSketch()
+    sketch.extend(values)
+    assert sketch.exact
+    ordered = sorted(values)
+    for q in (0, 0.5, 0.9, 0.99, 1):
+        assert sketch.quantile(q) == ordered[int(q * (len(values) - 1))]
+
+
+def test_sketch_switches_to_buckets_within_accuracy():
+    values = [random.Random(2).randint(1, 10**6) for _ in range(5000)]
+    sketch = QuantileSketch(0.01)
+    for value in values:
+        sketch.add(value)
+    assert not sketch.exact and len(sketch) == 5000
+    ordered = sorted(values)
+    for q in (0.1, 0.5, 0.9, 0.99):
+        true = ordered[int(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q) - true) <= 0.01 * true
+
+
+def test_sketch_zeros_and_empty():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None
+    sketch.extend([0, -5, 10])
+    assert sketch.zeros == 2 and sketch.quantile(0) == 0.0 and sketch.quantile(1) == 10
+    with pytest.raises(ValueError):
+        sketch.quantile(2)
+
+
+@pytest.mark.parametrize('sizes', [(10, 20), (10, 3000), (3000, 10), (3000, 3000)])
+def test_sketch_merge_matches_one_sketch(sizes):
+    rng = random.Random(3)
+    a_values = [rng.randint(0, 10**5) for _ in range(sizes[0])]
+    b_values = [rng.randint(0, 10**5) for _ in range(sizes[1])]
+    a, b, whole = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    a.extend(a_values)
+    b.extend(b_values)
+    whole.extend(a_values + b_values)
+    a.merge(b)
+    assert a.count == whole.count and a.zeros == whole.zeros
+    if a.exact == whole.exact:
+        assert a.buckets() == whole.buckets()
+    for q in (0.5, 0.9):
+        assert a.quantile(q) == pytest.approx(whole.quantile(q), rel=0.02)
+    with pytest.raises(ValueError):
+        a.merge(QuantileSketch(0.05))
+
+
+def test_histogram_observe_many_matches_observe():
+    values = [random.Random(4).uniform(0, 40) for _ in range(500)]
+    one, many = Histogram(), Histogram()
+    for value in values:
+        one.observe(value)
+    many.observe_many(values)
+    assert (one.counts, one.count) == (many.counts, many.count)
+    assert one.sum == pytest.approx(many.sum)
+
+
+def test_stats_bulk_matches_single_adds():
+    values = [random.Random(5).randint(0, 10**6) for _ in range(2000)]
+    single, bulk = DurationStats(), DurationStats()
+    for value in values:
+        single.add_closed(value)
+        single.add_open(value // 2)
+    bulk.extend_closed(values)
+    bulk.extend_open([v // 2 for v in values])
+    assert single.summary() == bulk.summary()
+    assert single.histogram.counts == bulk.histogram.counts
+
+
+@pytest.mark.parametrize('by', [('error',), ('siteName', 'error'), ('component',), ()])
+def test_groups_match_exact_lists(tickets, by):
+    durations = AlertDurations(by=by, now=NOW).update(tickets)
+    expected = exact_groups(tickets, by)
+    assert set(durations.groups) == set(expected)
+    for key, (closed, ages) in expected.items():
+        stats = durations.stats(*key)
+        assert (stats.closed.count, stats.closed_sum) == (len(closed), sum(closed))
+        assert (stats.open.count, stats.open_sum) == (len(ages), sum(ages))
+        if closed:
+            assert stats.summary()['max'] == max(closed)
+            assert stats.closed.quantile(0.5) == sorted(closed)[(len(closed) - 1) // 2]
+
+
+def test_update_alerts_matches_update(tickets):
+    by = ('siteName', 'error')
+    from_tickets = AlertDurations(by=by, now=NOW).update(tickets)
+    from_rows = AlertDurations(by=by, now=NOW).update_alerts(alert_rows(tickets))
+    assert from_rows.report() == from_tickets.report()
+
+
+def test_folding_in_several_passes(tickets, monkeypatch):
+    whole = AlertDurations(by='siteName', now=NOW).update(tickets)
+    monkeypatch.setattr(_durations, '_FOLD_AT', 7)
+    folded = AlertDurations(by='siteName', now=NOW).update(tickets)
+    assert folded.report() == whole.report()
+
+
+def test_merge_matches_one_pass(tickets):
+    whole = AlertDurations(by='error', now=NOW).update(tickets)
+    half = AlertDurations(by='error', now=NOW).update(tickets[:100])
+    half.merge(AlertDurations(by='error', now=NOW).update(tickets[100:]))
+    assert half.report() == whole.report()
+    with pytest.raises(ValueError):
+        half.merge(AlertDurations(by='siteName'))
+
+
+def test_skipped_and_censored_alerts():
+    ticket = {'siteName': 'A', 'alerts': [
+        {'error': 'e', 'alertOpenTimestamp': None, 'alertCloseTimestamp': None},
+        {'error': 'e', 'alertOpenTimestamp': '2025-12-31 12:00:00', 'alertCloseTimestamp': '2025-12-31 11:00:00'},
+        {'error': 'e', 'alertOpenTimestamp': '2025-12-31 12:00:00', 'alertCloseTimestamp': '2025-12-31 13:00:00'},
+        {'error': 'e', 'alertOpenTimestamp': '2025-12-31 18:00:00', 'alertCloseTimestamp': None},
+        {'error': 'e', 'alertOpenTimestamp': '2026-01-02 00:00:00', 'alertCloseTimestamp': None},
+    ]}
+    durations = AlertDurations(by='error', now=NOW).update([ticket])
+    assert durations.skipped == 2
+    row, = durations.report()
+    assert (row['closed'], row['open'], row['mttr']) == (1, 2, 3600)
+    assert row['open_max_age'] == 6 * 3600          # opened after `now`: age 0
+    assert row['mean_lower_bound'] == round((3600 + 6 * 3600) / 3, 1)
+
+
+def test_survival_quantile_counts_censoring():
+    stats = DurationStats()
+    stats.extend_closed([10, 20, 30])
+    assert stats.survival_quantile(0.5) == 20
+    stats.extend_open([5] * 10)                      # censored early: do not change the closed-only p50
+    assert stats.closed.quantile(0.5) == 20
+    assert stats.survival_quantile(0.5) == 20
+    stats.extend_open([100] * 10)                    # too many still open to reach 90%
+    assert stats.survival_quantile(0.9) is None
+
+
+def test_report_sort_and_validation(tickets):
+    durations = AlertDurations(by='error', now=NOW).update(tickets)
+    rows = durations.report(sort='p90')
+    p90 = [r['p90'] for r in rows if r['p90'] is not None]
+    assert p90 == sorted(p90, reverse=True)
+    with pytest.raises(ValueError):
+        AlertDurations(by='alertOpenTimestamp')
@@ -0,0 +1,99 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from pySiteIQ import Ticket
+from pySiteIQ._export import ALERT_COLUMNS, TICKET_COLUMNS, export_tickets, flatten_alerts, resolve_format
+
+
+def _csv(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def _jsonl(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('t.csv', ('csv', False)),
+    ('t.jsonl', ('jsonl', False)),
+    ('t.ndjson.gz', ('jsonl', True)),
+    ('t.CSV.GZ', ('csv', True)),
+])
+def test_format_from_suffix(name, expected):
+    assert resolve_format(name, None, None) == expected
+
+
+def test_bad_options(tmp_path):
+    with pytest.raises(ValueError):
+        resolve_format('tickets.txt', None, None)
+    with pytest.raises(ValueError):
+        export_tickets([], tmp_path / 't.csv', flatten='nested')
+    with pytest.raises(ValueError):
+        export_tickets([], tmp_path / 't.csv', columns=['nope'])
+
+
+def test_ticket_rows_csv(tmp_path, tickets):
+    summary = export_tickets(tickets, tmp_path / 't.csv')
+    rows = _csv(tmp_path / 't.csv')
+    assert summary['rows'] == len(rows) == len(tickets)
+    assert list(rows[0]) == list(TICKET_COLUMNS)
+    assert rows[0]['alertCount'] == str(len(tickets[0]['alerts']))
+    assert summary['bytes'] == (tmp_path / 't.csv').stat().st_size
+
+
+def test_alert_rows_gzip(tmp_path, tickets):
+    path = tmp_path / 'a.jsonl.gz'
+    summary = export_tickets((Ticket.from_dict(t) for t in tickets), path, flatten='alert')
+    rows = _jsonl(path, gzip.open)
+    assert summary['compressed'] and summary['rows'] == len(rows) == sum(len(t['alerts']) for t in tickets)
+    assert list(rows[0]) == list(ALERT_COLUMNS)
+    first = tickets[0]
+    assert rows[0]['ticketID'] == first['ticketID'] and rows[0]['error'] == first['alerts'][0]['error']
+
+
+def test_nested_and_columns(tmp_path, tickets):
+    export_tickets(tickets, tmp_path / 'n.jsonl', flatten='nested')
+    assert _jsonl(tmp_path / 'n.jsonl') == tickets
+    export_tickets(tickets, tmp_path / 'c.jsonl', columns=['siteName', 'ticketID'])
+    assert _jsonl(tmp_path / 'c.jsonl')[0] == {'siteName': tickets[0]['siteName'], 'ticketID': tickets[0]['ticketID']}
+
+
+def test_flatten_alert_filters(tickets):
+    rows = list(flatten_alerts(tickets, open_only=True, error={'paper out', 'pump stopped'}))
+    expected = [
+        (t['ticketID'], seq)
+        for t in tickets for seq, a in enumerate(t['alerts'])
+        if a['alertCloseTimestamp'] is None and a['error'] in ('paper out', 'pump stopped')
+    ]
+    assert [(r['ticketID'], r['alertSeq']) for r in rows] == expected
+
+
+def test_client_export(connect, tmp_path):
+    client = connect()
+    summary = client.export(tmp_path / 'out.csv', status='All', delta=0, where={'component': 'Printer'})
+    rows = _csv(tmp_path / 'out.csv')
+    assert summary['rows'] == len(rows) > 0
+    assert {r['component'] for r in rows} == {'Printer'}
+
+
+def test_headers_rename_columns(tmp_path, tickets):
+    headers = {'ticketID': 'TicketID', 'alertCount': 'AlertCount'}
+    columns = ['ticketID', 'siteName', 'alertCount']
+    export_tickets(tickets, tmp_path / 't.csv', columns=columns, headers=headers)
+    rows = _csv(tmp_path / 't.csv')
+    assert list(rows[0]) == ['TicketID', 'siteName', 'AlertCount']
+    assert rows[0]['TicketID'] == str(tickets[0]['ticketID'])
+    assert rows[0]['AlertCount'] == str(len(tickets[0]['alerts']))
+    export_tickets(tickets, tmp_path / 't.jsonl', columns=columns, headers=headers)
+    assert _jsonl(tmp_path / 't.jsonl')[0] == {
+        'TicketID': tickets[0]['ticketID'], 'siteName': tickets[0]['siteName'], 'AlertCount': len(tickets[0]['alerts']),
+    }
+    with pytest.raises(ValueError):
+        export_tickets(tickets, tmp_path / 'x.csv', columns=columns, headers={'warrantyDate': 'WarrantyDate'})
+    with pytest.raises(ValueError):
+        export_tickets(tickets, tmp_path / 'x.jsonl', flatten='nested', headers=headers)
@@ -0,0 +1,63 @@
+from collections import Counter
+
+import pytest
+
+from pySiteIQ import Ticket, TicketFrame
+
+
+@pytest.fixture
+def frame(tickets):
+    return TicketFrame(tickets)
+
+
+def test_count_by_matches_a_plain_count(frame, tickets):
+    assert frame.count_by('component') == Counter(t['component'] for t in tickets)
+    assert frame.count_by('alertCount') == Counter(len(t['alerts']) for t in tickets)
+
+
+def test_filters(frame, tickets):
+    site = tickets[0]['siteName']
+    assert frame.count(siteName=site) == sum(t['siteName'] == site for t in tickets)
+    assert frame.count(component={'Printer', 'POS'}) == sum(t['component'] in ('Printer', 'POS') for t in tickets)
+    assert frame.count(alertCount=lambda n: n >= 3) == sum(len(t['alerts']) >= 3 for t in tickets)
+    assert frame.count(siteName='no such site') == 0
+    expected = Counter(t['siteName'] for t in tickets if t['warrantyStatus'] == 'Out')
+    assert frame.count_by('siteName', warrantyStatus='Out') == expected
+    assert frame.top('siteName', 3, warrantyStatus='Out') == expected.most_common(3)
+
+
+def test_unknown_column(frame):
+    with pytest.raises(KeyError):
+        frame.count(ticketID=1)
+    with pytest.raises(KeyError):
+        frame.count_by('alerts')
+
+
+def test_tickets_round_trip(frame, tickets):
+    assert list(frame.tickets()) == tickets
+    printers = [t for t in tickets if t['component'] == 'Printer']
+    assert list(frame.tickets(component='Printer')) == printers
+    assert len(frame.filter(component='Printer')) == len(printers)
+
+
+def test_records_and_pages_build_the_same_frame(tickets):
+    records = TicketFrame(Ticket.from_dict(t) for t in tickets)
+    pages = TicketFrame.from_pages([tickets[:70], tickets[70:]])
+    assert list(records.tickets()) == list(pages.tickets()) == tickets
+
+
+def test_alert_table(frame, tickets):
+    alerts = [(t, a) for t in tickets for a in t['alerts']]
+    assert len(frame.alerts) == len(alerts)
+    assert frame.alerts.count_by('error') == Counter(a['error'] for _, a in alerts)
+    still_open = Counter(a['error'] for _, a in alerts if a['alertCloseTimestamp'] is None)
+    assert frame.alerts.count_by('error', stillOpen=True) == still_open
+    by_site = Counter(t['siteName'] for t, _ in alerts)
+    assert frame.alerts.count_by('siteName') == by_site
+
+
+def test_epochs_are_memoized_until_rows_are_added(frame, tickets):
+    first = frame.epochs('ticketOpenTimestamp')
+    assert frame.epochs('ticketOpenTimestamp') is first
+    frame.extend(tickets[:1])
+    assert len(frame.epochs('ticketOpenTimestamp')) == len(tickets) + 1
@@ -0,0 +1,49 @@
+from collections import Counter
+
+import pytest
+
+from pySiteIQ import Harvester, TicketStore
+from mock_server import MockSiteIQServer
+
+
+@pytest.fixture(scope='module')
+def small_server():
+    with MockSiteIQServer(tickets=300, password='secret') as server:
+        yield server
+
+
+def _harvester(server, *accounts):
+    return Harvester(accounts, base_uri=server.base_uri, max_concurrency=4)
+
+
+def test_tickets_are_tagged_per_account(small_server):
+    harvester = _harvester(small_server, {'name': 'acme', 'email': 'a@x', 'password': 'secret'}, ('b@x', 'secret'))
+    tickets = harvester.get_tickets(status='All', delta=0)
+    assert Counter(t['account'] for t in tickets) == {'acme': 300, 'b@x': 300}
+    assert harvester.summary['tickets'] == 600 and harvester.summary['failed'] == []
+
+
+def test_overlapping_accounts_store_each_ticket_once(small_server):
+    harvester = _harvester(small_server, ('a@x', 'secret'), ('b@x', 'secret'))
+    with TicketStore() as store:
+        summary = harvester.harvest(store, status='All', delta=0)
+        assert store.count() == 300
+        assert store.count(account='a@x') + store.count(account='b@x') == 300
+    assert (summary['inserted'], summary['updated'], summary['shared']) == (300, 0, 300)
+
+
+def test_a_failing_account_does_not_stop_the_others(small_server):
+    harvester = _harvester(small_server, ('a@x', 'secret'), ('b@x', 'wrong'))
+    tickets = harvester.get_tickets(status='All', delta=0)
+    assert {t['account'] for t in tickets} == {'a@x'}
+    assert harvester.summary['failed'] == ['b@x']
+    assert 'SiteIQAuthError' in harvester.summary['accounts']['b@x']['error']
+
+
+def test_invalid_accounts():
+    with pytest.raises(ValueError):
+        Harvester([('a@x', 'p'), {'name': 'a@x', 'email': 'b@x', 'password': 'p'}])
+    with pytest.raises(ValueError):
+        Harvester([{'email': 'a@x'}])
+    with pytest.raises(ValueError):
+        Harvester([('a@x', 'p')], max_concurrency=0)
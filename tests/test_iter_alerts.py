@@ -0,0 +1,36 @@
+from pySiteIQ._export import ALERT_COLUMNS
+
+QUERY = {'status': 'All', 'delta': 0}
+
+
+def _expected(tickets, keep):
+    return [
+        (t['ticketID'], seq)
+        for t in tickets for seq, a in enumerate(t['alerts'])
+        if keep(a)
+    ]
+
+
+def test_rows_follow_the_tickets(connect):
+    client = connect()
+    tickets = client.get_tickets(all_pages=True, **QUERY)
+    rows = list(client.iter_alerts(**QUERY))
+    assert [(r['ticketID'], r['alertSeq']) for r in rows] == _expected(tickets, lambda a: True)
+    assert list(rows[0]) == list(ALERT_COLUMNS)
+
+
+def test_filters(connect):
+    client = connect()
+    tickets = client.get_tickets(all_pages=True, **QUERY)
+    rows = client.iter_alerts(open_only=True, error='paper out', **QUERY)
+    keep = lambda a: a['alertCloseTimestamp'] is None and a['error'] == 'paper out'
+    assert [(r['ticketID'], r['alertSeq']) for r in rows] == _expected(tickets, keep)
+    rows = client.iter_alerts(fueling_position=lambda p: p is not None and p <= 2, prefetch=2, **QUERY)
+    keep = lambda a: a['fuelingPosition'] is not None and a['fuelingPosition'] <= 2
+    assert [(r['ticketID'], r['alertSeq']) for r in rows] == _expected(tickets, keep)
+
+
+def test_records_give_the_same_rows(connect):
+    plain = list(connect().iter_alerts(error={'pump stopped', 'paper out'}, **QUERY))
+    records = list(connect(records=True).iter_alerts(error={'pump stopped', 'paper out'}, **QUERY))
+    assert records == plain and plain
@@ -0,0 +1,67 @@
+import pytest
+
+from pySiteIQ import MetricsCollector, ResponseCache, RetryPolicy, SiteIQClient
+from pySiteIQ._metrics import Histogram
+from mock_server import MockSiteIQServer
+
+
+def test_histogram():
+    h = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        h.observe(value)
+    assert h.cumulative() == [(0.1, 2), (1.0, 3), ('+Inf', 4)]
+    assert h.quantile(0.5) == 0.1
+    assert h.quantile(1.0) == float('inf')
+    assert Histogram().quantile(0.5) is None
+
+
+def test_hooks_see_every_request_and_page(connect):
+    client = connect()
+    events = {name: [] for name in SiteIQClient.HOOK_EVENTS}
+    for name, seen in events.items():
+        client.add_hook(name, seen.append)
+    client.get_tickets(status='All', delta=0, all_pages=True)
+    assert len(events['request_start']) == len(events['request_end']) == len(events['page_decoded']) == 4
+    assert [p['page'] for p in events['page_decoded']] == [0, 1, 2, 3]
+    assert sum(p['tickets'] for p in events['page_decoded']) == 3000
+    assert {e['status'] for e in events['request_end']} == {200}
+    assert events['retry'] == []
+
+    client.remove_hook('page_decoded', events['page_decoded'].append)
+    client.get_tickets()
+    assert len(events['page_decoded']) == 4
+    with pytest.raises(ValueError):
+        client.add_hook('nope', print)
+
+
+def test_collector_counts(connect):
+    metrics = MetricsCollector()
+    client = connect(metrics=metrics, cache=ResponseCache(':memory:'))
+    client.get_tickets(status='All', delta=0, all_pages=True)
+    client.get_tickets(status='All', delta=0, all_pages=True)
+    snap = metrics.snapshot()
+    assert snap['requests'] == 4 and snap['statuses'] == {'200': 4}
+    assert snap['pages'] == {'network': 4, 'cache': 4}
+    assert snap['tickets'] == 6000 and snap['bytes'] > 0
+
+    text = metrics.to_prometheus()
+    assert 'siteiq_requests_total{status="200"} 4' in text
+    assert 'siteiq_pages_total{source="cache"} 4' in text
+    assert 'siteiq_request_duration_seconds_bucket{le="+Inf"} 4' in text
+
+    metrics.detach(client)
+    client.get_tickets()
+    assert metrics.snapshot()['requests'] == 4
+    metrics.reset()
+    assert metrics.snapshot()['tickets'] == 0
+
+
+def test_collector_counts_retries():
+    with MockSiteIQServer(tickets=100, throttle_rate=0.5, seed=3) as server:
+        metrics = MetricsCollector()
+        client = SiteIQClient(server.base_uri, metrics=metrics, retry=RetryPolicy(20, backoff_base=0.001))
+        client.connect('tester@example.com', 'secret')
+        client.get_tickets(status='All', delta=0, all_pages=True)
+    snap = metrics.snapshot()
+    assert snap['retries'] == {'429': server.stats['throttled']}
+    assert snap['statuses']['429'] == server.stats['throttled'] > 0
@@ -0,0 +1,104 @@
+import json
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from pySiteIQ._tokens import _jwt_exp
+from mock_server import MockSiteIQServer, STATUS_MATCH
+
+
+@pytest.fixture(scope='module')
+def api():
+    with MockSiteIQServer(tickets=1500, password='secret', token_ttl=60) as server:
+        yield server
+
+
+def _call(server, path, *, body=None, token=None, **params):
+    url = f'{server.base_uri}{path}'
+    if params:
+        url += '?' + urllib.parse.urlencode(params)
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    data = json.dumps(body).encode() if body is not None else None
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data, headers=headers)) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read() or b'null')
+
+
+def _token(server):
+    return _call(server, '/api/web/auth/token', body={'email': 'a@x', 'password': 'secret'})[1]['token']
+
+
+def test_auth(api):
+    status, body = _call(api, '/api/web/auth/token', body={'email': 'a@x', 'password': 'secret'})
+    assert status == 200
+    assert 50 < _jwt_exp(body['token']) - time.time() <= 60
+    assert _call(api, '/api/web/auth/token', body={'email': 'a@x', 'password': 'wrong'})[0] == 401
+    assert _call(api, '/api/web/auth/token', body={'email': 'a@x'})[0] == 400
+    assert _call(api, '/api/external/ticket')[0] == 401
+    assert _call(api, '/api/external/ticket', token='forged')[0] == 401
+
+
+def test_paging_covers_every_ticket_once(api):
+    token = _token(api)
+    ids = []
+    for offset in range(0, 2000, 400):
+        status, page = _call(api, '/api/external/ticket', token=token, status='All', delta=0,
+                             pageLimit=400, pageOffset=offset)
+        assert status == 200
+        ids += [t['ticketID'] for t in page]
+    assert sorted(ids) == list(range(1, 1501))
+
+
+def test_status_and_date_filters(api):
+    token = _token(api)
+    closed = _call(api, '/api/external/ticket', token=token, status='Closed', delta=0)[1]
+    assert closed and {t['ticketStatus'] for t in closed} == STATUS_MATCH['Closed']
+    week = _call(api, '/api/external/ticket', token=token, status='All',
+                 startDate='2025-03-01', endDate='2025-03-07')[1]
+    assert all('2025-03-01' <= t['ticketOpenTimestamp'][:10] <= '2025-03-07' for t in week)
+
+
+@pytest.mark.parametrize('params', [
+    {'status': 'Open'},
+    {'startDate': '2025-03-01', 'endDate': '2025-03-31'},
+    {'startDate': 'March'},
+    {'delta': 'soon'},
+    {'pageLimit': 1001},
+    {'pageOffset': -1},
+])
+def test_bad_requests(api, params):
+    assert _call(api, '/api/external/ticket', token=_token(api), **params)[0] == 400
+
+
+def test_delta_returns_later_modifications(api):
+    token = _token(api)
+    everything = _call(api, '/api/external/ticket', token=token, status='All', delta=0)[1]
+    since = sorted(api._modified)[len(api._modified) // 2]
+    later = _call(api, '/api/external/ticket', token=token, status='All', delta=since, pageLimit=1000)[1]
+    assert 0 < len(later) < len(everything)
+
+
+def test_injected_failures():
+    with MockSiteIQServer(tickets=10, throttle_rate=1.0, retry_after=3) as server:
+        token = _token(server)
+        assert _call(server, '/api/external/ticket', token=token)[0] == 429
+        assert server.stats['throttled'] == 1
+    with MockSiteIQServer(tickets=10, error_rate=1.0) as server:
+        assert _call(server, '/api/external/ticket', token=_token(server))[0] == 500
+        assert server.stats['errors'] == 1
+
+
+def test_connection_close_is_echoed(api):
+    request = urllib.request.Request(
+        f'{api.base_uri}/api/external/ticket?status=All',
+        headers={'Authorization': f'Bearer {_token(api)}', 'Connection': 'close'},
+    )
+    with urllib.request.urlopen(request) as resp:
+        assert resp.headers['Connection'] == 'close'
@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from pySiteIQ import RetryPolicy, SiteIQClient
+from pySiteIQ._transport import HTTPError
+from mock_server import MockSiteIQServer
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == 'siteiq-prefetch']
+
+
+def test_prefetch_yields_the_same_tickets_in_order(connect):
+    client = connect()
+    plain = [t['ticketID'] for t in client.iter_tickets(status='All', delta=0)]
+    ahead = [t['ticketID'] for t in client.iter_tickets(status='All', delta=0, prefetch=2)]
+    assert ahead == plain
+    assert len(client.get_tickets(status='All', delta=0, all_pages=True, prefetch=3)) == len(plain)
+
+
+def test_stopping_early_stops_the_worker(connect, server):
+    client = connect()
+    before = server.stats['requests']
+    tickets = client.iter_tickets(status='All', delta=0, prefetch=1)
+    next(tickets)
+    tickets.close()
+    assert not _prefetch_threads()
+    time.sleep(0.2)
+    # The first page plus at most the one buffered and the one in flight.
+    assert server.stats['requests'] - before <= 3
+
+
+def test_worker_errors_reach_the_consumer():
+    with MockSiteIQServer(tickets=100, error_rate=1.0) as server:
+        client = SiteIQClient(server.base_uri, retry=RetryPolicy(0))
+        client.connect('tester@example.com', 'secret')
+        with pytest.raises(HTTPError):
+            list(client.iter_tickets(prefetch=2))
+        client.disconnect()
+    assert not _prefetch_threads()
+
+
+def test_negative_prefetch_is_rejected(connect):
+    with pytest.raises(ValueError):
+        list(connect().iter_tickets(prefetch=-1))
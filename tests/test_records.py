@@ -0,0 +1,58 @@
+import pickle
+
+from pySiteIQ import Alert, Ticket
+
+
+def test_round_trip(tickets):
+    for data in tickets[:50]:
+        ticket = Ticket.from_dict(data)
+        assert ticket.to_dict() == data
+        assert list(ticket) == list(data)
+        assert all(isinstance(a, Alert) for a in ticket.alerts)
+
+
+def test_mapping_access(tickets):
+    ticket = Ticket.from_dict(tickets[0])
+    assert ticket['siteName'] == ticket.siteName == tickets[0]['siteName']
+    assert ticket.get('missing', 'x') == 'x'
+    assert 'alerts' in ticket and 'missing' not in ticket
+    assert len(ticket) == len(tickets[0])
+
+
+def test_text_fields_are_interned(tickets):
+    a, b = (Ticket.from_dict(dict(t, siteName=''.join(['Trial #', '1']))) for t in tickets[:2])
+    assert a.siteName is b.siteName
+
+
+def test_extra_fields_are_kept(tickets):
+    data = dict(tickets[0], region='north')
+    ticket = Ticket.from_dict(data)
+    assert ticket['region'] == 'north'
+    assert ticket.to_dict() == data
+
+
+def test_missing_field_plus_extra_field(tickets):
+    data = dict(tickets[0], region='north')
+    del data['integrationID3']
+    ticket = Ticket.from_dict(data)
+    assert ticket['region'] == 'north'
+    assert ticket.integrationID3 is None
+
+    alert = dict(tickets[0]['alerts'][0], severity='high')
+    del alert['fuelingPosition']
+    record = Alert.from_dict(alert)
+    assert record['severity'] == 'high'
+    assert record.fuelingPosition is None
+
+
+def test_partial_dict_has_no_extras():
+    ticket = Ticket.from_dict({'ticketID': 7})
+    assert ticket._extra is None
+    assert ticket.siteName is None and ticket.alerts is None
+
+
+def test_pickle(tickets):
+    ticket = Ticket.from_dict(dict(tickets[0], region='north'))
+    copy = pickle.loads(pickle.dumps(ticket))
+    assert copy['region'] == 'north'
+    assert copy.to_dict() == ticket.to_dict()
@@ -0,0 +1,99 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from pySiteIQ import AdaptiveLimiter, RetryPolicy, SiteIQClient
+from pySiteIQ._retry import parse_retry_after
+from pySiteIQ._transport import HTTPError
+from mock_server import MockSiteIQServer
+
+
+def test_backoff_stays_under_the_ceiling():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3)
+    for attempt in range(8):
+        assert 0 <= policy.delay(attempt) <= min(3, 0.5 * 2 ** attempt)
+
+
+def test_retry_after_is_the_minimum_wait():
+    policy = RetryPolicy(backoff_base=0.01, backoff_max=0.01)
+    assert policy.delay(0, '5') == 5
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('') is None
+    assert parse_retry_after(' 12 ') == 12
+    assert parse_retry_after('soon') is None
+    later = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 50 < parse_retry_after(format_datetime(later, usegmt=True)) <= 60
+    past = datetime.now(timezone.utc) - timedelta(seconds=60)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        RetryPolicy(-1)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(2, min_limit=3)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(4, decrease=1)
+
+
+def test_limiter_grows_additively_and_halves_on_throttle():
+    limiter = AdaptiveLimiter(8, initial=2)
+    for _ in range(2):
+        limiter.on_success()
+    assert limiter.limit == 3
+    for _ in range(3):
+        limiter.on_success()
+    assert limiter.limit == 4
+    limiter.on_throttle()
+    assert limiter.limit == 2
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 1
+
+
+def test_limiter_caps_requests_in_flight():
+    limiter = AdaptiveLimiter(4, initial=2)
+    peak = [0]
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def work():
+        with limiter:
+            with lock:
+                peak[0] = max(peak[0], limiter.in_flight)
+            release.wait(0.05)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 2
+    assert limiter.in_flight == 0
+
+
+def test_transient_errors_are_retried():
+    with MockSiteIQServer(tickets=500, error_rate=0.3, throttle_rate=0.2, seed=7) as server:
+        client = SiteIQClient(server.base_uri, retry=RetryPolicy(10, backoff_base=0.001, backoff_max=0.01))
+        client.connect('tester@example.com', 'secret')
+        tickets = client.get_tickets(status='All', delta=0, all_pages=True)
+        stats = client.retry_stats()
+    assert len(tickets) == 500
+    assert stats['retries'] == server.stats['errors'] + server.stats['throttled'] > 0
+    assert stats['throttled'] == server.stats['throttled']
+    assert stats['gave_up'] == 0
+
+
+def test_gives_up_after_max_retries():
+    with MockSiteIQServer(tickets=100, error_rate=1.0) as server:
+        client = SiteIQClient(server.base_uri, retry=RetryPolicy(2, backoff_base=0.001))
+        client.connect('tester@example.com', 'secret')
+        with pytest.raises(HTTPError):
+            client.get_tickets()
+        assert server.stats['errors'] == 3
+        assert client.retry_stats()['gave_up'] == 1
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from mock_server import MockSiteIQServer
+from pySiteIQ._client import _normalize_status, _status_scope, SiteIQClient
+
+VALID = SiteIQClient._VALID_STATUSES
+
+
+def test_normalize_status():
+    assert _normalize_status(None, VALID) is None
+    assert _normalize_status('Closed', VALID) == 'Closed'
+    assert _normalize_status({'Closed'}, VALID) == 'Closed'
+    assert _normalize_status(['Dispatch', 'Closed', 'Closed'], VALID) == ('Closed', 'Dispatch')
+    assert _normalize_status({'All', 'Closed'}, VALID) == 'All'
+    for bad in ('Open', set(), {'Closed', 'Open'}):
+        with pytest.raises(ValueError):
+            _normalize_status(bad, VALID)
+
+
+def test_status_scope():
+    assert _status_scope(None) == 'InProgress'
+    assert _status_scope(['Dispatch', 'Closed']) == 'Closed,Dispatch'
+    assert _status_scope({'Closed', 'All'}) == 'All'
+
+
+def test_fan_out_merges_each_status(connect, server):
+    client = connect()
+    statuses = ('InProgress', 'Closed', 'Dispatch')
+    before = server.stats['requests']
+    separate = {
+        t['ticketID']: t
+        for status in statuses
+        for t in client.get_tickets(status=status, delta=0, all_pages=True)
+    }
+    sequential = server.stats['requests'] - before
+    before = server.stats['requests']
+    merged = client.get_tickets(status=set(statuses), delta=0, all_pages=True)
+    assert sorted(t['ticketID'] for t in merged) == sorted(separate)
+    assert len({t['ticketID'] for t in merged}) == len(merged)
+    assert server.stats['requests'] - before == sequential
+
+
+def test_fan_out_with_date_shards(connect):
+    client = connect()
+    query = {'start_date': '2025-03-01', 'end_date': '2025-03-20', 'all_pages': True}
+    separate = {t['ticketID'] for s in ('Closed', 'Dispatch') for t in client.get_tickets(status=s, **query)}
+    merged = client.get_tickets(status=['Closed', 'Dispatch'], **query)
+    assert {t['ticketID'] for t in merged} == separate
+
+
+def test_several_statuses_need_all_pages(connect):
+    with pytest.raises(ValueError):
+        connect().get_tickets(status={'Closed', 'Dispatch'})
+
+
+@pytest.fixture(scope='module')
+def slow():
+    # Enough tickets for several pages per status, slow enough to watch shards run.
+    with MockSiteIQServer(tickets=20_000, latency=0.02) as server:
+        client = SiteIQClient(server.base_uri)
+        client.connect('tester@example.com', 'secret')
+        yield server, client
+        client.disconnect()
+
+
+FAN_OUT = {'status': {'Closed', 'Dispatch'}, 'delta': 0}
+
+
+def test_fan_out_stops_running_shards(slow):
+    server, client = slow
+    before = server.stats['requests']
+    everything = client.get_tickets(all_pages=True, **FAN_OUT)
+    full = server.stats['requests'] - before
+    assert full >= 10
+
+    before = server.stats['requests']
+    assert client.get_tickets(all_pages=True, limit=5, **FAN_OUT) == everything[:5]
+    # Each shard stops at its next page instead of fetching all of them.
+    assert server.stats['requests'] - before <= 6
+
+    tickets = client.iter_tickets(**FAN_OUT)
+    before = server.stats['requests']
+    next(tickets)
+    tickets.close()
+    assert server.stats['requests'] - before <= 6
+
+
+def test_prefetch_bounds_fan_out(slow):
+    server, client = slow
+    expected = [t['ticketID'] for t in client.iter_tickets(**FAN_OUT)]
+    before = server.stats['requests']
+    tickets = client.iter_tickets(prefetch=1, **FAN_OUT)
+    got = [next(tickets)['ticketID']]
+    time.sleep(0.3)                          # long enough for every page, were shards unbounded
+    assert server.stats['requests'] - before <= 6
+    got.extend(t['ticketID'] for t in tickets)
+    assert got == expected
@@ -0,0 +1,85 @@
+import pytest
+
+from pySiteIQ import Ticket, TicketStore
+
+
+@pytest.fixture
+def store():
+    with TicketStore() as store:
+        yield store
+
+
+def _by_id(tickets):
+    return sorted(tickets, key=lambda t: t['ticketID'])
+
+
+def test_upsert_round_trip(store, tickets):
+    assert store.upsert(tickets) == {'inserted': len(tickets), 'updated': 0}
+    assert store.get_tickets() == _by_id(tickets)
+    assert store.count() == len(tickets)
+
+
+def test_upsert_replaces_tickets_and_alerts(store, tickets):
+    store.upsert(tickets)
+    changed = [dict(t, ticketStatus='Closed', alerts=t['alerts'][:1]) for t in tickets[:10]]
+    assert store.upsert(changed) == {'inserted': 0, 'updated': 10}
+    stored = {t['ticketID']: t for t in store.iter_tickets()}
+    for t in changed:
+        assert stored[t['ticketID']] == t
+
+
+def test_duplicate_ids_in_one_batch(store, tickets):
+    # Regression: the second copy's alerts used to collide on (ticketID, seq).
+    first = dict(tickets[0], alerts=tickets[0]['alerts'] * 2)
+    last = dict(first, ticketStatus='Closed', alerts=first['alerts'][:1])
+    assert store.upsert([first] + tickets[1:] + [last, tickets[1]]) == {'inserted': len(tickets), 'updated': 0}
+    assert store.count() == len(tickets)
+    stored = {t['ticketID']: t for t in store.iter_tickets()}
+    assert stored[first['ticketID']] == last
+    assert store.upsert([last, first]) == {'inserted': 0, 'updated': 1}
+    assert store.get_tickets()[0] == first
+
+
+def test_upsert_without_account_keeps_the_stored_one(store, tickets):
+    ticket_id = tickets[0]['ticketID']
+    store.upsert([dict(tickets[0], account='a@x')])
+    store.upsert([tickets[0]])
+    assert store.count(account='a@x') == 1
+    store.upsert([dict(tickets[0], account='b@x')])
+    assert [t['account'] for t in store.iter_tickets(account='b@x')] == ['b@x']
+    assert store.get_tickets()[0]['ticketID'] == ticket_id
+
+
+def test_records_are_stored_like_dicts(store, tickets):
+    store.upsert(Ticket.from_dict(t) for t in tickets)
+    assert store.get_tickets() == _by_id(tickets)
+
+
+def test_filters(store, tickets):
+    store.upsert(tickets, synced_at=100)
+    site = tickets[0]['siteName']
+    assert store.count(siteName=site) == sum(t['siteName'] == site for t in tickets)
+    components = {'Printer', 'POS'}
+    assert store.count(component=components) == sum(t['component'] in components for t in tickets)
+    assert store.count(min_alerts=3) == sum(len(t['alerts']) >= 3 for t in tickets)
+    cutoff = sorted(t['ticketOpenTimestamp'] for t in tickets)[50]
+    assert len(store.get_tickets(opened_after=cutoff)) == sum(t['ticketOpenTimestamp'] >= cutoff for t in tickets)
+    store.upsert(tickets[:5], synced_at=200)
+    assert [t['ticketID'] for t in store.iter_tickets(synced_since=200)] == sorted(t['ticketID'] for t in tickets[:5])
+
+
+def test_last_sync_per_scope(store):
+    assert store.last_sync() is None
+    store.set_last_sync(1000)
+    store.set_last_sync(2000, 'Closed')
+    store.set_last_sync(1500)
+    assert store.last_sync() == 1500
+    assert store.last_sync('Closed') == 2000
+
+
+def test_reopens_from_disk(tmp_path, tickets):
+    path = tmp_path / 'siteiq.db'
+    with TicketStore(path) as store:
+        store.upsert(tickets)
+    with TicketStore(path) as store:
+        assert store.count() == len(tickets)
@@ -0,0 +1,102 @@
+import sqlite3
+
+import pytest
+
+from pySiteIQ import TicketStore
+
+
+@pytest.fixture
+def store():
+    with TicketStore() as store:
+        yield store
+
+
+def recount(store, columns):
+    """View rows recomputed from the stored tickets, as a comparable set."""
+    groups = {}
+    for t in store.iter_tickets():
+        key = tuple(t.get(c) for c in columns)
+        tickets, alerts = groups.get(key, (0, 0))
+        groups[key] = (tickets + 1, alerts + len(t['alerts']))
+    return {key + counts for key, counts in groups.items()}
+
+
+def view_rows(store, name, columns):
+    return {tuple(r[c] for c in columns) + (r['tickets'], r['alerts']) for r in store.aggregate(name)}
+
+
+def test_seeded_from_existing_tickets(store, tickets):
+    store.upsert(tickets)
+    store.materialize('by_site_status', ('siteName', 'ticketStatus'))
+    assert view_rows(store, 'by_site_status', ('siteName', 'ticketStatus')) == recount(store, ('siteName', 'ticketStatus'))
+    assert store.views() == {'by_site_status': ('siteName', 'ticketStatus')}
+
+
+def test_upserts_keep_views_current(store, tickets):
+    store.materialize('by_status', 'ticketStatus')
+    store.materialize('by_warranty', ('warrantyStatus', 'component'))
+    store.upsert(tickets[:150])
+    store.upsert(tickets[100:])                                     # overlap: updates
+    moved = [dict(t, ticketStatus='Closed', warrantyStatus=None, alerts=t['alerts'][:1]) for t in tickets[:40]]
+    store.upsert(moved)
+    for name, columns in store.views().items():
+        assert view_rows(store, name, columns) == recount(store, columns)
+    assert store.aggregate('by_warranty', warrantyStatus=None)    # NULL is a group of its own
+
+
+def test_duplicate_ids_in_one_batch(store, tickets):
+    store.materialize('by_status', 'ticketStatus')
+    first = tickets[0]
+    last = dict(first, ticketStatus='Closed', alerts=first['alerts'] * 2)
+    store.upsert([first] + tickets[1:] + [last])
+    assert view_rows(store, 'by_status', ('ticketStatus',)) == recount(store, ('ticketStatus',))
+    assert sum(r['tickets'] for r in store.aggregate('by_status')) == len(tickets)
+
+
+def test_aggregate_filters_and_sort(store, tickets):
+    store.upsert(tickets)
+    store.materialize('by_site', ('siteName', 'component'))
+    rows = store.aggregate('by_site', sort='alerts', component=['Printer', 'POS'])
+    assert rows and {r['component'] for r in rows} <= {'Printer', 'POS'}
+    assert [r['alerts'] for r in rows] == sorted((r['alerts'] for r in rows), reverse=True)
+    with pytest.raises(ValueError):
+        store.aggregate('by_site', ticketStatus='Open')
+    with pytest.raises(KeyError):
+        store.aggregate('missing')
+
+
+def test_materialize_validation(store):
+    store.materialize('by_status', 'ticketStatus')
+    store.materialize('by_status', ('ticketStatus',))              # same columns: no-op
+    with pytest.raises(ValueError):
+        store.materialize('by_status', 'component')
+    with pytest.raises(ValueError):
+        store.materialize('bad name', 'component')
+    with pytest.raises(ValueError):
+        store.materialize('by_error', 'error')
+    with pytest.raises(ValueError):
+        store.materialize('empty', ())
+
+
+def test_drop_view_removes_triggers(store, tickets):
+    store.materialize('by_status', 'ticketStatus')
+    store.drop_view('by_status')
+    assert store.views() == {}
+    store.upsert(tickets)
+    assert store.query('SELECT COUNT(*) FROM aggregates') == [(0,)]
+
+
+def test_persisted_and_refreshed(tmp_path, tickets):
+    path = tmp_path / 'siteiq.db'
+    with TicketStore(path) as store:
+        store.materialize('by_site', 'siteID')
+        store.upsert(tickets)
+    with sqlite3.connect(path) as db:                               # an edit the triggers never see
+        db.execute('DELETE FROM aggregates')
+    with TicketStore(path) as store:
+        assert store.views() == {'by_site': ('siteID',)}
+        assert store.aggregate('by_site') == []
+        store.refresh_view('by_site')
+        assert view_rows(store, 'by_site', ('siteID',)) == recount(store, ('siteID',))
+        store.upsert([dict(tickets[0], siteID='new-site')])
+        assert view_rows(store, 'by_site', ('siteID',)) == recount(store, ('siteID',))
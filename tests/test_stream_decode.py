@@ -0,0 +1,33 @@
+import pytest
+
+from pySiteIQ import Ticket
+
+
+def _streamed(client):
+    pages = []
+    client.add_hook('page_decoded', pages.append)
+    return pages
+
+
+@pytest.mark.parametrize('query', [
+    {'status': 'All', 'delta': 0},
+    {'status': 'All', 'delta': 0, 'prefetch': 2},
+    {'status': 'All', 'start_date': '2025-03-01', 'end_date': '2025-03-31'},
+    {'status': {'InProgress', 'Closed'}, 'delta': 0},
+])
+def test_every_paging_mode_streams(connect, query):
+    plain = [t['ticketID'] for t in connect().iter_tickets(**query)]
+    client = connect(stream_decode=True)
+    pages = _streamed(client)
+    streamed = [t['ticketID'] for t in client.iter_tickets(**query)]
+    assert sorted(streamed) == sorted(plain)
+    assert pages and all(p['decode_seconds'] is None for p in pages)
+
+
+def test_streamed_records_and_where(connect):
+    where = {'component': 'Printer'}
+    plain = connect(records=True).get_tickets(status='All', delta=0, all_pages=True, where=where)
+    client = connect(stream_decode=True, records=True)
+    streamed = list(client.iter_tickets(status='All', delta=0, prefetch=1, where=where))
+    assert streamed and streamed == plain
+    assert all(isinstance(t, Ticket) and t.component == 'Printer' for t in streamed)
@@ -0,0 +1,70 @@
+from array import array
+from datetime import datetime
+
+import pytest
+
+from pySiteIQ import NO_TIME, Alert, Ticket, TicketFrame, durations, to_datetime, to_epoch, to_epochs
+from pySiteIQ import _timestamps
+
+
+def test_to_epoch_formats():
+    assert to_epoch('1970-01-02 00:00:01') == 86401
+    assert to_epoch('1970-01-02') == 86400
+    assert to_epoch('1970-01-01T01:00:00+01:00') == 0
+    assert to_epoch(None) is None
+    assert to_epoch('') is None
+    assert to_epoch('not a date') is None
+
+
+def test_to_epochs_matches_to_epoch():
+    values = ['2025-07-01 08:00:00', None, '2025-07-01', 'garbage', '2025-07-01 08:00:00', '']
+    epochs = to_epochs(values)
+    assert isinstance(epochs, array) and epochs.typecode == 'q'
+    assert list(epochs) == [NO_TIME if to_epoch(v) is None else to_epoch(v) for v in values]
+    assert list(to_epochs(iter(values))) == list(epochs)
+
+
+def test_to_datetime_is_naive_utc():
+    assert to_datetime('2025-07-01 08:30:00') == datetime(2025, 7, 1, 8, 30)
+    assert to_datetime('nope') is None
+
+
+def test_cache_stays_bounded(monkeypatch):
+    monkeypatch.setattr(_timestamps, '_CACHE_LIMIT', 8)
+    monkeypatch.setattr(_timestamps, '_CACHE', {None: NO_TIME, '': NO_TIME})
+    to_epoch('2024-12-31')
+    assert '2024-12-31' in _timestamps._CACHE
+    values = [f'2025-01-{d:02d}' for d in range(1, 29)]
+    assert list(to_epochs(values)) == [86400 * (20089 + d) for d in range(28)]
+    assert '2024-12-31' not in _timestamps._CACHE      # cleared, not grown past the limit
+
+
+def test_durations_censoring():
+    starts = array('q', [100, 100, NO_TIME, 100])
+    ends = array('q', [160, NO_TIME, 200, NO_TIME])
+    assert list(durations(starts, ends)) == [60, NO_TIME, NO_TIME, NO_TIME]
+    assert list(durations(starts, ends, now=1000)) == [60, 900, NO_TIME, 900]
+    with pytest.raises(ValueError):
+        durations(starts, ends[:2])
+
+
+def test_record_properties():
+    alert = Alert.from_dict({'alertOpenTimestamp': '2025-07-01 08:00:00', 'alertCloseTimestamp': '2025-07-01 09:00:00'})
+    assert alert.seconds_to_close == 3600
+    assert alert.closed_datetime == datetime(2025, 7, 1, 9)
+    alert['alertCloseTimestamp'] = None
+    assert alert.seconds_to_close is None and alert.closed_epoch is None
+    ticket = Ticket.from_dict({'warrantyDate': '2026-01-01', 'ticketOpenTimestamp': None})
+    assert ticket.warranty_epoch == to_epoch('2026-01-01')
+    assert ticket.opened_epoch is None and ticket.opened_datetime is None
+
+
+def test_alert_table_seconds_to_close(tickets):
+    frame = TicketFrame(tickets)
+    alerts = [a for t in tickets for a in t.get('alerts') or ()]
+    now = 2_000_000_000
+    expected = [
+        (to_epoch(a['alertCloseTimestamp']) if a['alertCloseTimestamp'] else now) - to_epoch(a['alertOpenTimestamp'])
+        for a in alerts
+    ]
+    assert list(frame.alerts.seconds_to_close(now=now)) == expected
@@ -0,0 +1,103 @@
+import base64
+import json
+import os
+import stat
+import time
+
+import pytest
+
+from pySiteIQ import SiteIQAuthError, SiteIQClient, TokenCache
+
+posix = pytest.mark.skipif(os.name != 'posix', reason='POSIX permissions')
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({'exp': exp}).encode()).rstrip(b'=').decode()
+    return f'header.{payload}.signature'
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_save_load_discard(tmp_path):
+    cache = TokenCache(tmp_path / 'tokens.json')
+    assert cache.load('https://x', 'a@example.com') is None
+    assert cache.save('https://x/', 'A@example.com', _jwt(2000000000)) == 2000000000
+    assert cache.load('https://x', 'a@example.com') == (_jwt(2000000000), 2000000000)
+    cache.discard('https://x', 'a@example.com')
+    assert cache.load('https://x', 'a@example.com') is None
+
+
+def test_password_is_checked_not_stored(tmp_path):
+    path = tmp_path / 'tokens.json'
+    cache = TokenCache(path)
+    cache.save('https://x', 'a@example.com', 'token', expires=2000000000, password='secret')
+    assert 'secret' not in path.read_text()
+    assert cache.load('https://x', 'a@example.com', 'secret') == ('token', 2000000000)
+    assert cache.load('https://x', 'a@example.com', 'wrong') is None
+    assert cache.load('https://x', 'a@example.com') == ('token', 2000000000)
+    cache.save('https://x', 'a@example.com', 'token', expires=2000000000)     # no hash: never matches a password
+    assert cache.load('https://x', 'a@example.com', 'secret') is None
+
+
+def test_expiry_without_exp_claim(tmp_path):
+    cache = TokenCache(tmp_path / 'tokens.json', default_lifetime=100)
+    assert time.time() + 99 < cache.expiry_of('opaque-token') <= time.time() + 100
+
+
+def test_corrupt_file_reads_as_empty(tmp_path):
+    path = tmp_path / 'tokens.json'
+    path.write_text('{not json')
+    assert TokenCache(path).load('https://x', 'a@example.com') is None
+
+
+@posix
+def test_file_is_owner_only(tmp_path):
+    path = tmp_path / 'new' / 'tokens.json'
+    TokenCache(path).save('https://x', 'a@example.com', 'token')
+    assert _mode(path) == 0o600
+    assert _mode(path.parent) == 0o700
+
+
+@posix
+def test_existing_default_directory_is_tightened(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    directory = tmp_path / 'pySiteIQ'
+    directory.mkdir(mode=0o755)
+    os.chmod(directory, 0o755)
+    TokenCache().save('https://x', 'a@example.com', 'token')
+    assert _mode(directory) == 0o700
+    assert _mode(directory / 'tokens.json') == 0o600
+
+
+@posix
+def test_explicit_directory_is_left_alone(tmp_path):
+    os.chmod(tmp_path, 0o755)
+    TokenCache(tmp_path / 'tokens.json').save('https://x', 'a@example.com', 'token')
+    assert _mode(tmp_path) == 0o755
+
+
+def test_client_reuses_a_cached_token(server, tmp_path):
+    cache = TokenCache(tmp_path / 'tokens.json')
+    first = SiteIQClient(server.base_uri, token_cache=cache)
+    first.connect('tester@example.com', 'secret')
+    auths = server.stats['auth']
+    second = SiteIQClient(server.base_uri, token_cache=cache)
+    second.connect('tester@example.com', 'secret')
+    assert server.stats['auth'] == auths
+    assert second.get_tickets()
+
+
+def test_cached_token_needs_the_right_password(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server, 'password', 'secret')
+    cache = TokenCache(tmp_path / 'tokens.json')
+    SiteIQClient(server.base_uri, token_cache=cache).connect('tester@example.com', 'secret')
+    auths = server.stats['auth']
+    with pytest.raises(SiteIQAuthError):
+        SiteIQClient(server.base_uri, token_cache=cache).connect('tester@example.com', 'wrong')
+    assert server.stats['auth'] == auths + 1
+    monkeypatch.setattr(server, 'password', 'rotated')
+    client = SiteIQClient(server.base_uri, token_cache=cache)
+    assert client.connect('tester@example.com', 'rotated')['cached'] is False
+    assert SiteIQClient(server.base_uri, token_cache=cache).connect('tester@example.com', 'rotated')['cached']
@@ -0,0 +1,55 @@
+import pytest
+
+from pySiteIQ import ReplayTransport, RetryPolicy, SiteIQClient, UrllibTransport
+from mock_server import MockSiteIQServer
+
+QUERY = {'status': 'All', 'delta': 0, 'all_pages': True}
+
+
+def _client(server, transport, **options):
+    client = SiteIQClient(server.base_uri, transport=transport, **options)
+    client.connect('tester@example.com', 'secret')
+    return client
+
+
+def test_urllib_matches_requests(server, connect):
+    expected = connect().get_tickets(**QUERY)
+    client = _client(server, UrllibTransport())
+    assert client.get_tickets(**QUERY) == expected
+    assert client.connection_stats()['connections_opened'] == 1
+    assert client.connection_stats()['requests'] == 5
+
+
+def test_urllib_streams_and_closes(server, connect):
+    expected = connect().get_tickets(**QUERY)
+    client = _client(server, UrllibTransport(keep_alive=False), stream_decode=True)
+    assert list(client.iter_tickets(status='All', delta=0)) == expected
+    stats = client.connection_stats()
+    assert stats['connections_opened'] == stats['requests']
+
+
+def test_urllib_errors_are_retried():
+    with MockSiteIQServer(tickets=2500, error_rate=0.5, seed=1) as server:
+        client = _client(server, UrllibTransport(), retry=RetryPolicy(10, backoff_base=0.001))
+        assert len(client.get_tickets(**QUERY)) == 2500
+        assert client.retry_stats()['retries'] == server.stats['errors'] > 0
+
+
+def test_record_then_replay_offline(server, connect, tmp_path):
+    recorder = ReplayTransport(tmp_path, record=True)
+    recorded = _client(server, recorder).get_tickets(**QUERY)
+    assert len(recorder) == 4
+
+    replay = ReplayTransport(tmp_path)
+    client = SiteIQClient('http://offline.invalid', transport=replay)
+    client.connect('anyone@example.com', 'anything')
+    before = server.stats['requests']
+    assert client.get_tickets(**QUERY) == recorded
+    assert server.stats['requests'] == before
+    with pytest.raises(LookupError):
+        client.get_tickets(status='Closed', delta=0)
+
+
+def test_replay_needs_a_capture(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ReplayTransport(tmp_path / 'missing')
@@ -0,0 +1,101 @@
+from datetime import date, datetime
+
+import pytest
+
+from pySiteIQ import Ticket, WarrantyIndex, to_epoch
+
+
+def scan(tickets, start=None, end=None, status=None, site=None):
+    """What between() should return, by linear scan of the latest copy of each ticket."""
+    latest = {t['ticketID']: t for t in tickets}
+    lo = None if start is None else to_epoch(start)
+    hi = None if end is None else to_epoch(end)
+    rows = []
+    for t in latest.values():
+        expiry = to_epoch(t.get('warrantyDate'))
+        if expiry is None or (lo is not None and expiry < lo) or (hi is not None and expiry >= hi):
+            continue
+        if status is not None and t['warrantyStatus'] not in (status if isinstance(status, (set, list)) else (status,)):
+            continue
+        if site is not None and t['siteName'] != site:
+            continue
+        rows.append((expiry, t['ticketID']))
+    return [latest[ticket_id] for _, ticket_id in sorted(rows)]
+
+
+def test_range_queries_match_a_scan(tickets):
+    index = WarrantyIndex(tickets)
+    site = tickets[0]['siteName']
+    assert index.between() == scan(tickets)
+    assert index.between('2025-06-01', '2025-09-01') == scan(tickets, '2025-06-01', '2025-09-01')
+    assert index.between(None, '2025-03-01', status='Out') == scan(tickets, None, '2025-03-01', status='Out')
+    assert index.between(site=site) == scan(tickets, site=site)
+    assert index.between(status={'In', 'Out'}, site=site) == scan(tickets, status={'In', 'Out'}, site=site)
+    assert index.count('2025-06-01', '2025-09-01') == len(scan(tickets, '2025-06-01', '2025-09-01'))
+
+
+def test_bound_types_agree(tickets):
+    index = WarrantyIndex(tickets)
+    expected = index.between('2025-06-01', '2025-09-01')
+    assert index.between(date(2025, 6, 1), date(2025, 9, 1)) == expected
+    assert index.between(datetime(2025, 6, 1), datetime(2025, 9, 1)) == expected
+    assert index.between(to_epoch('2025-06-01'), to_epoch('2025-09-01')) == expected
+    with pytest.raises(ValueError):
+        index.between('June')
+
+
+def test_expiring_and_expired(tickets):
+    index = WarrantyIndex(tickets)
+    today = date(2025, 6, 1)
+    assert index.expiring(30, today=today) == scan(tickets, '2025-06-01', '2025-07-02', status='In')
+    assert index.count_expiring(30, today=today) == len(index.expiring(30, today=today))
+    assert index.expired(today=today) == scan(tickets, None, '2025-06-01')
+
+
+@pytest.mark.parametrize('changes', [5, 100])      # bisect path and rebuild path
+def test_update_moves_changed_tickets(tickets, changes):
+    index = WarrantyIndex(tickets)
+    changed = [dict(t, warrantyDate='2030-01-01', warrantyStatus='Out') for t in tickets[:changes]]
+    assert index.update(changed + tickets[changes:changes + 3]) == {'added': 0, 'moved': changes, 'unchanged': 3}
+    current = changed + tickets[changes:]
+    assert index.between() == scan(current)
+    assert index.between('2030-01-01', '2030-01-02') == scan(current, '2030-01-01', '2030-01-02')
+    assert index.get(changed[0]['ticketID']) is changed[0]
+
+
+@pytest.mark.parametrize('changes', [3, 100])
+def test_duplicate_ids_in_one_batch(tickets, changes):
+    # Regression: two copies of a ticket with different entries deleted a
+    # neighbouring entry from the partition.
+    index = WarrantyIndex(tickets)
+    first = [dict(t, warrantyDate='2029-01-01') for t in tickets[:changes]]
+    last = [dict(t, warrantyDate='2031-01-01', warrantyStatus='Out') for t in tickets[:changes]]
+    assert index.update(first + last) == {'added': 0, 'moved': changes, 'unchanged': 0}
+    current = last + tickets[changes:]
+    assert len(index) == len(tickets)
+    assert index.between() == scan(current)
+    assert index.count() == len(scan(current))
+    assert index.count('2029-01-01', '2030-01-01') == 0
+
+
+def test_duplicate_new_ids_are_added_once(tickets):
+    index = WarrantyIndex()
+    assert index.update(tickets + tickets[:10]) == {'added': len(tickets), 'moved': 0, 'unchanged': 0}
+    assert index.count() == len(scan(tickets))
+
+
+def test_remove_and_undated_tickets(tickets):
+    undated = dict(tickets[0], ticketID=-1, warrantyDate=None)
+    index = WarrantyIndex(tickets + [undated])
+    assert -1 in index and len(index) == len(tickets) + 1
+    assert index.count() == len(scan(tickets))
+    assert index.remove([tickets[0]['ticketID'], tickets[0]['ticketID'], -1, 'missing']) == 2
+    dated = scan(tickets[1:])
+    assert index.between() == dated
+    assert set(index.statuses()) == {t['warrantyStatus'] for t in dated}
+    assert set(index.sites(status='Out')) == {t['siteName'] for t in dated if t['warrantyStatus'] == 'Out'}
+
+
+def test_records_are_indexed_like_dicts(tickets):
+    records = WarrantyIndex(Ticket.from_dict(t) for t in tickets)
+    assert [t.to_dict() for t in records.between('2025-06-01')] == scan(tickets, '2025-06-01')
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from pySiteIQ import PageDecoder, Ticket, Where
+from pySiteIQ._where import compile_where
+
+QUERY = {'status': 'All', 'delta': 0}
+
+
+def _requests(server, fetch):
+    before = server.stats['requests']
+    result = fetch()
+    return result, server.stats['requests'] - before
+
+
+def test_dict_and_attribute_predicates_agree(tickets):
+    where = Where(component={'Printer', 'POS'}, warrantyStatus='Out', alertCount=lambda n: n >= 2)
+    expected = [
+        t for t in tickets
+        if t['component'] in {'Printer', 'POS'} and t['warrantyStatus'] == 'Out' and len(t['alerts']) >= 2
+    ]
+    assert expected
+    assert [t for t in tickets if where(t)] == expected
+    records = [Ticket.from_dict(t) for t in tickets]
+    assert [r.to_dict() for r in records if where.match_attrs(r)] == expected
+    assert [r.to_dict() for r in records if where.match(r)] == expected
+
+
+def test_conditions():
+    ticket = {'siteName': 'Trial #1', 'dispenser': None, 'alerts': []}
+    assert Where(dispenser=None)(ticket)
+    assert Where({'siteName': ['Trial #1', 'Trial #2']})(ticket)
+    assert not Where(siteName='Trial #2')(ticket)
+    assert Where(alertCount=0)(ticket)
+    assert Where()(ticket)
+    assert Where(lambda t: t['siteName'].startswith('Trial'))(ticket)
+
+
+def test_cheap_tests_run_first():
+    where = Where(siteName=lambda s: s.startswith('T'), component='Printer', dispenser=None)
+    body = where.source.split('return ')[1]
+    assert body.index('is None') < body.index('==') < body.index('_c0(')
+
+
+def test_validation_and_compile_where():
+    with pytest.raises(ValueError):
+        Where(region='north')
+    with pytest.raises(ValueError):
+        Where(lambda t: True, component='Printer')
+    where = Where(component='Printer')
+    assert compile_where(where) is where
+    assert compile_where(None) is None
+    assert compile_where({'component': 'Printer'}).conditions == {'component': 'Printer'}
+    assert repr(where) == "Where({'component': 'Printer'})"
+
+
+MODES = {
+    'dicts': lambda: {},
+    'records': lambda: {'records': True},
+    'stream_decode': lambda: {'stream_decode': True},
+    'json decoder': lambda: {'decoder': PageDecoder('json')},
+    'default decoder': lambda: {'decoder': PageDecoder()},
+}
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_iter_tickets_where_matches_filtering(connect, mode):
+    where = {'warrantyStatus': 'Out', 'alertCount': lambda n: n >= 2}
+    expected = [t['ticketID'] for t in connect().iter_tickets(**QUERY) if Where(where)(t)]
+    client = connect(**MODES[mode]())
+    assert [t['ticketID'] for t in client.iter_tickets(where=where, **QUERY)] == expected
+
+
+def test_pages_without_matches_do_not_end_the_query(server, connect):
+    ids = [t['ticketID'] for t in connect().iter_tickets(**QUERY)]
+    late = set(ids[-300:])                                        # only the last pages match
+    found, requests = _requests(server, lambda: [
+        t['ticketID'] for t in connect().iter_tickets(where={'ticketID': late}, **QUERY)
+    ])
+    assert found == ids[-300:]
+    assert requests == 4
+
+
+def test_limit_stops_paging(server, connect):
+    client = connect()
+    first, requests = _requests(server, lambda: [t['ticketID'] for t in client.iter_tickets(limit=5, **QUERY)])
+    assert len(first) == 5 and requests == 1
+    assert client.get_tickets(all_pages=True, limit=5, **QUERY) == list(client.iter_tickets(limit=5, **QUERY))
+    assert client.get_tickets(limit=0, **QUERY) == []
+    assert list(client.iter_tickets(limit=0, **QUERY)) == []
+    with pytest.raises(ValueError):
+        client.get_tickets(limit=-1, **QUERY)
+
+
+def test_limit_with_prefetch_and_where(connect):
+    client = connect()
+    where = Where(warrantyStatus='In')
+    expected = [t['ticketID'] for t in client.iter_tickets(where=where, **QUERY)][:1500]
+    got = [t['ticketID'] for t in client.iter_tickets(where=where, limit=1500, prefetch=2, **QUERY)]
+    assert got == expected
+
+
+def test_single_page_get_tickets(connect):
+    client = connect()
+    page = client.get_tickets(page_limit=200, **QUERY)
+    where = Where(warrantyStatus='Out')
+    assert client.get_tickets(page_limit=200, where=where, limit=3, **QUERY) == [t for t in page if where(t)][:3]
+
+
+def test_async_where_and_limit(server, connect):
+    pytest.importorskip('aiohttp')
+    from pySiteIQ import AsyncSiteIQClient
+
+    where = {'component': 'Printer'}
+    expected = [t['ticketID'] for t in connect().iter_tickets(where=where, **QUERY)]
+
+    async def main():
+        async with AsyncSiteIQClient(server.base_uri) as client:
+            await client.connect('tester@example.com', 'secret')
+            everything = [t['ticketID'] async for t in client.iter_tickets(where=where, **QUERY)]
+            first = await client.get_tickets(all_pages=True, where=where, limit=10, **QUERY)
+            return everything, [t['ticketID'] for t in first]
+    everything, first = asyncio.run(main())
+    assert everything == expected
+    assert first == expected[:10]